@@ -0,0 +1,123 @@
+"""
+Image assets for SpaceRace.
+
+Icons are drawn at a handful of fixed sizes (96 px on the business cards,
+60 px in the Managers/Upgrades/Unlocks lists, 58 px in the Investor Shop and
+50 px for the stats button), often greyed out while locked. IconCache builds
+every one of those variants once, right after the images are loaded, so the
+draw functions only blit instead of smoothscaling and tinting each row every
+frame.
+
+AssetManager is the one place PNGs are read from disk: each file is decoded
+once per resolved path (the businesses, unlocks, upgrades and galactic
+upgrades share a dozen files between them) and scaled icons come from its
+IconCache.
+"""
+import pygame
+
+# Every size an icon is drawn at
+ICON_SIZES = (96, 60, 58, 50)
+
+# Multiply tint applied to icons of locked businesses
+LOCKED_TINT = (100, 100, 100, 150)
+
+
+class IconCache:
+    """
+    Pre-scaled copies of source icons, keyed on (source surface, size, locked).
+    """
+
+    def __init__(self, sizes=ICON_SIZES):
+        self.sizes  = sizes
+        self._icons = {}
+
+    def add(self, image):
+        """
+        Build every size in `sizes`, normal and locked, for one source image.
+        """
+        for size in self.sizes:
+            self._build(image, size)
+
+    def _build(self, image, size):
+        if image.get_size() == (size, size):
+            scaled = image
+        else:
+            scaled = pygame.transform.smoothscale(image, (size, size))
+        locked = scaled.copy()
+        locked.fill(LOCKED_TINT, special_flags=pygame.BLEND_RGBA_MULT)
+        self._icons[(image, size, False)] = scaled
+        self._icons[(image, size, True)]  = locked
+
+    def get(self, image, size, locked=False):
+        """
+        The cached 'size' x 'size' version of 'image' (greyed when 'locked').
+        Sizes outside `sizes` are built on first use and kept.
+        """
+        icon = self._icons.get((image, size, locked))
+        if icon is None:
+            self._build(image, size)
+            icon = self._icons[(image, size, locked)]
+        return icon
+
+    def clear(self):
+        """
+        Forget every scaled icon (before the source images are reloaded).
+        """
+        self._icons.clear()
+
+
+class AssetManager:
+    """
+    Loads each image file once and hands out cached scaled icons.
+
+    'resolve' maps a relative asset path to a file path (resource_path in
+    main.py). Files that are missing or fail to decode are remembered as None,
+    so a broken path is not retried every frame either.
+    """
+
+    def __init__(self, resolve, icons=None):
+        self.resolve = resolve
+        self.icons   = icons if icons is not None else IconCache()
+        self._images = {}   # resolved path -> Surface or None
+        self._by_rel = {}   # path as written in the data -> same Surface
+
+    def image(self, rel_path):
+        """
+        The full-size surface for 'rel_path', or None if it cannot be loaded.
+        """
+        if rel_path in self._by_rel:
+            return self._by_rel[rel_path]
+        path = self.resolve(rel_path)
+        if path not in self._images:
+            try:
+                self._images[path] = pygame.image.load(path).convert_alpha()
+            except (pygame.error, OSError):
+                self._images[path] = None
+        img = self._by_rel[rel_path] = self._images[path]
+        return img
+
+    def icon(self, rel_path, size, locked=False):
+        """
+        'rel_path' scaled to 'size' x 'size' (greyed when 'locked'), or None.
+        """
+        img = self.image(rel_path)
+        if img is None:
+            return None
+        return self.icons.get(img, size, locked)
+
+    def preload(self, rel_paths):
+        """
+        Load every distinct path and build all of its icon sizes up front.
+        """
+        for rel_path in dict.fromkeys(rel_paths):
+            img = self.image(rel_path)
+            if img is not None:
+                self.icons.add(img)
+
+    def clear(self):
+        """
+        Forget every loaded image and scaled icon.
+        """
+        self._images.clear()
+        self._by_rel.clear()
+        self.icons.clear()
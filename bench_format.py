@@ -0,0 +1,93 @@
+"""
+Micro-benchmark: number_format.format_number_parts against the old
+loop-and-divide formatter it replaced.
+
+    python bench_format.py [calls]
+
+Feeds both functions the same mix of values the UI formats each frame
+(money that creeps up between frames, fixed costs, large incomes) plus a
+fixed set of rounding boundaries, and prints time per call plus how many
+outputs differ, with the first few.
+"""
+import random
+import sys
+import timeit
+
+from number_format import NUMBER_UNITS, format_cache_info, format_number_parts
+
+# Differing outputs printed in full
+SHOWN_MISMATCHES = 5
+
+
+def legacy_format_number_parts(n):
+    """
+    The previous implementation: rebuilds the unit list and divides by 1000 in a loop.
+    """
+    units = list(NUMBER_UNITS)
+    scale = 0
+    val = float(n)
+    while abs(val) >= 1000.0 and scale < len(units) - 1:
+        val /= 1000.0
+        scale += 1
+    mantissa = f"{val:.3f}"
+    suffix = units[scale]
+    return mantissa, suffix
+
+
+def sample_values(count, seed=1):
+    """
+    A frame-like mix: a slowly growing money value, repeated costs, random magnitudes.
+    """
+    rng    = random.Random(seed)
+    costs  = [int(4 * 1.07 ** k) for k in range(0, 3000, 50)]
+    money  = 1.0e12
+    values = []
+    for _ in range(count):
+        money *= 1.0000001
+        values.append(money)
+        values.append(rng.choice(costs))
+        values.append(rng.uniform(1, 1000) * 10.0 ** rng.randint(0, 300))
+    return values
+
+
+def boundary_values():
+    """
+    Values that land on a rounding or unit boundary, where random samples never do:
+    9.9995 * 10**k, d * 10**(3n) - 0.5, 0.0005 and the Decillion and Centillion edges.
+    """
+    values = [0.0005, 999.9995, 999.9996]
+    for k in range(0, 300):
+        values.append(9.9995 * 10.0 ** k)
+    for n in range(1, 101):
+        for d in (1, 10, 100):
+            values.append(d * 10.0 ** (3 * n) - 0.5)
+    for edge in (1e33, 1e303):
+        values.extend((edge * (1 - 1e-7), edge, edge * (1 + 1e-7)))
+    return values
+
+
+def main():
+    calls  = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    values = sample_values(calls // 3) + boundary_values()
+
+    mismatches = [
+        (v, legacy_format_number_parts(v), format_number_parts(v))
+        for v in values if legacy_format_number_parts(v) != format_number_parts(v)
+    ]
+
+    legacy = timeit.timeit(lambda: [legacy_format_number_parts(v) for v in values], number=3)
+    cached = timeit.timeit(lambda: [format_number_parts(v) for v in values], number=3)
+    per_call = 1e9 / (3 * len(values))
+
+    print(f"values formatted : {len(values)}")
+    print(f"legacy           : {legacy * per_call:8.1f} ns/call")
+    print(f"number_format    : {cached * per_call:8.1f} ns/call  ({legacy / cached:.1f}x)")
+    print(f"memo             : {format_cache_info()}")
+    carried = sum(1 for _, old, _ in mismatches if abs(float(old[0])) >= 1000.0)
+    print(f"differing output : {len(mismatches)} ({carried} where the legacy mantissa reached 1000.000)")
+    for v, old, new in mismatches[:SHOWN_MISMATCHES]:
+        print(f"    {v!r}: legacy {''.join(old)!r}, number_format {''.join(new)!r}")
+
+
+if __name__ == "__main__":
+    main()
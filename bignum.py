@@ -0,0 +1,336 @@
+"""
+Mantissa/exponent number type for SpaceRace money.
+
+Python floats stop at ~1.8e308 while the unit table runs to Centillion and
+late-game income keeps multiplying, so money, costs and lifetime earnings are
+stored as BigNum: value = m * 10**e with 1 <= |m| < 10 (or m == 0), m a float
+and e an int, so there is no ceiling.
+
+While the exponent is at most FLOAT_EXP_LIMIT the exact value is also kept as
+a plain float (f) and arithmetic and comparisons run on that. Rescaling the
+mantissa by a power of ten on every add is not exact, and whole-dollar money
+would otherwise drift just below the price it should afford. Past the limit
+f is None and the mantissa/exponent path takes over. Either way an operation
+is a couple of float operations, so it stays cheap in the per-frame hot path.
+
+BigNum is immutable and mixes freely with int and float on either side of
++, -, *, / and the comparisons.
+"""
+import math
+
+# Exponent gap beyond which the smaller addend is below float precision
+_PRECISION_DIGITS = 17
+_NEG_POW10 = tuple(10.0 ** -k for k in range(_PRECISION_DIGITS))
+
+# Values with a larger exponent than this are kept out of float conversions
+FLOAT_EXP_LIMIT = 300
+
+# Ints below this convert to float without losing the exponent
+_INT_FLOAT_LIMIT = 10 ** FLOAT_EXP_LIMIT
+
+# Float results below this in magnitude stay on the exact float path
+_FLOAT_CEIL = 10.0 ** (FLOAT_EXP_LIMIT + 1)
+
+
+def _normalize(m, e):
+    """
+    Return (m, e) rescaled so that 1 <= |m| < 10, or (0.0, 0).
+    """
+    a = abs(m)
+    if a == 0.0 or a < 1e-300:
+        return 0.0, 0
+    if a >= 10.0:
+        if a < 100.0:
+            m /= 10.0
+            e += 1
+        else:
+            k = int(math.floor(math.log10(a)))
+            m /= 10.0 ** k
+            e += k
+    elif a < 1.0:
+        if a >= 0.1:
+            m *= 10.0
+            e -= 1
+        else:
+            k = int(math.floor(math.log10(a)))
+            m *= 10.0 ** -k
+            e += k
+    # log10 can land one digit off for values right at a power of ten
+    a = abs(m)
+    if a >= 10.0:
+        m /= 10.0
+        e += 1
+    elif a < 1.0:
+        m *= 10.0
+        e -= 1
+    return m, e
+
+
+def _make(m, e):
+    """
+    Build a normalized BigNum from a float mantissa and an int exponent.
+    """
+    n = object.__new__(BigNum)
+    n.m, n.e = m, e = _normalize(m, e)
+    n.f = m * 10.0 ** e if e <= FLOAT_EXP_LIMIT else None
+    return n
+
+
+def _from_float(x):
+    """
+    Build a BigNum from a finite float below _FLOAT_CEIL, keeping it exact.
+    """
+    n = object.__new__(BigNum)
+    n.m, n.e = _normalize(x, 0)
+    n.f = x if n.m != 0.0 else 0.0
+    return n
+
+
+class BigNum:
+    """
+    Arbitrary-magnitude number: m * 10**e with a float mantissa.
+
+    BigNum(5.0), BigNum(10**400), BigNum("1.5e612") and BigNum(2.5, 900) are
+    all accepted; an existing BigNum is returned as-is by as_big().
+    """
+    __slots__ = ("m", "e", "f")
+
+    def __init__(self, value=0.0, exponent=0):
+        kind = type(value)
+        if kind is float or (kind is int and -_INT_FLOAT_LIMIT < value < _INT_FLOAT_LIMIT):
+            m, e = float(value), exponent
+        elif isinstance(value, BigNum):
+            m, e = value.m, value.e + exponent
+        elif isinstance(value, str):
+            text = value.strip().lower()
+            if "e" in text:
+                mant_text, exp_text = text.split("e", 1)
+                m, e = float(mant_text), int(exp_text) + exponent
+            else:
+                m, e = float(text), exponent
+        elif isinstance(value, int) and abs(value) >= _INT_FLOAT_LIMIT:
+            digits = str(abs(value))
+            m = float(digits[0] + "." + digits[1:_PRECISION_DIGITS])
+            m = -m if value < 0 else m
+            e = len(digits) - 1 + exponent
+        else:
+            m, e = float(value), exponent
+        if not math.isfinite(m):
+            raise ValueError(f"BigNum cannot hold {value!r}")
+        exact = m if e == 0 else None
+        self.m, self.e = m, e = _normalize(m, e)
+        if e > FLOAT_EXP_LIMIT:
+            self.f = None
+        elif m == 0.0:
+            self.f = 0.0
+        else:
+            self.f = exact if exact is not None else m * 10.0 ** e
+
+    @classmethod
+    def from_log10(cls, log_value):
+        """
+        Return 10**log_value, for magnitudes a float cannot reach.
+        """
+        e = math.floor(log_value)
+        return _make(10.0 ** (log_value - e), int(e))
+
+    # ─── CONVERSIONS ───
+    def __float__(self):
+        if self.f is not None:
+            return self.f
+        if self.e > 308:
+            return math.copysign(math.inf, self.m)
+        if self.e < -320:
+            return 0.0
+        return self.m * 10.0 ** self.e
+
+    def __int__(self):
+        if self.f is not None:
+            return int(self.f)
+        if self.e < _PRECISION_DIGITS:
+            return int(self.m * 10.0 ** self.e) if self.e >= 0 else 0
+        shift = _PRECISION_DIGITS - 1
+        return int(self.m * 10.0 ** shift) * 10 ** (self.e - shift)
+
+    def __bool__(self):
+        return self.m != 0.0
+
+    def __hash__(self):
+        if self.f is not None:
+            return hash(self.f)
+        return hash((self.m, self.e))
+
+    def __repr__(self):
+        return f"BigNum('{self}')"
+
+    def __str__(self):
+        if -5 < self.e <= 15:
+            return repr(float(self))
+        return f"{self.m!r}e{self.e:+d}"
+
+    def __format__(self, spec):
+        if self.f is not None:
+            return format(self.f, spec)
+        return f"{format(self.m, spec)}e{self.e:+d}"
+
+    def to_json(self):
+        """
+        Save-file form: a plain number while it fits a float, else a string.
+        """
+        if self.f is not None:
+            return self.f
+        return str(self)
+
+    # ─── MATH HELPERS ───
+    def floor(self):
+        """
+        Largest whole value <= self (values past float precision are already whole).
+        """
+        if self.e >= _PRECISION_DIGITS:
+            return self
+        return _from_float(float(math.floor(float(self))))
+
+    def log10(self):
+        """
+        log10(|self|); -inf for zero.
+        """
+        if self.m == 0.0:
+            return -math.inf
+        return math.log10(abs(self.m)) + self.e
+
+    def sqrt(self):
+        """
+        Square root of a non-negative BigNum.
+        """
+        if self.m < 0:
+            raise ValueError("sqrt of a negative BigNum")
+        if self.e % 2:
+            return _make(math.sqrt(self.m * 10.0), (self.e - 1) // 2)
+        return _make(math.sqrt(self.m), self.e // 2)
+
+    # ─── ARITHMETIC ───
+    def __neg__(self):
+        if self.f is not None:
+            return _from_float(-self.f)
+        return _make(-self.m, self.e)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.m >= 0 else -self
+
+    def __add__(self, other):
+        f = self.f
+        if f is not None and type(other) is float:
+            r = f + other
+            if -_FLOAT_CEIL < r < _FLOAT_CEIL:
+                return _from_float(r)
+        o = other if type(other) is BigNum else BigNum(other)
+        if f is not None and o.f is not None:
+            r = f + o.f
+            if -_FLOAT_CEIL < r < _FLOAT_CEIL:
+                return _from_float(r)
+        if o.m == 0.0:
+            return self
+        if self.m == 0.0:
+            return o
+        gap = self.e - o.e
+        if gap >= 0:
+            if gap >= _PRECISION_DIGITS:
+                return self
+            return _make(self.m + o.m * _NEG_POW10[gap], self.e)
+        if -gap >= _PRECISION_DIGITS:
+            return o
+        return _make(o.m + self.m * _NEG_POW10[-gap], o.e)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if type(other) is float:
+            return self + -other
+        o = other if type(other) is BigNum else BigNum(other)
+        return self + -o
+
+    def __rsub__(self, other):
+        return BigNum(other) + -self
+
+    def __mul__(self, other):
+        o = other if type(other) is BigNum else BigNum(other)
+        if self.f is not None and o.f is not None:
+            r = self.f * o.f
+            if -_FLOAT_CEIL < r < _FLOAT_CEIL and (r != 0.0 or self.m == 0.0 or o.m == 0.0):
+                return _from_float(r)
+        return _make(self.m * o.m, self.e + o.e)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        o = other if type(other) is BigNum else BigNum(other)
+        if o.m == 0.0:
+            raise ZeroDivisionError("BigNum division by zero")
+        if self.f is not None and o.f is not None:
+            r = self.f / o.f
+            if -_FLOAT_CEIL < r < _FLOAT_CEIL and (r != 0.0 or self.m == 0.0):
+                return _from_float(r)
+        return _make(self.m / o.m, self.e - o.e)
+
+    def __rtruediv__(self, other):
+        return BigNum(other) / self
+
+    def __pow__(self, power):
+        if self.m <= 0:
+            return BigNum(float(self) ** power)
+        return BigNum.from_log10(self.log10() * power)
+
+    # ─── COMPARISONS ───
+    def _compare(self, other):
+        kind = type(other)
+        if kind is float or kind is int:
+            # Plain numbers (upgrade and unlock costs) compare without building a BigNum
+            f = self.f
+            if f is not None:
+                return (f > other) - (f < other)
+            if -_FLOAT_CEIL < other < _FLOAT_CEIL:
+                return 1 if self.m > 0 else -1
+        o = other if kind is BigNum else BigNum(other)
+        if self.f is not None and o.f is not None:
+            return (self.f > o.f) - (self.f < o.f)
+        sa = (self.m > 0) - (self.m < 0)
+        so = (o.m > 0) - (o.m < 0)
+        if sa != so:
+            return -1 if sa < so else 1
+        if sa == 0:
+            return 0
+        if self.e != o.e:
+            return sa if self.e > o.e else -sa
+        if self.m == o.m:
+            return 0
+        return -1 if self.m < o.m else 1
+
+    def __eq__(self, other):
+        if not isinstance(other, (BigNum, int, float)):
+            return NotImplemented
+        return self._compare(other) == 0
+
+    def __lt__(self, other):
+        return self._compare(other) < 0
+
+    def __le__(self, other):
+        return self._compare(other) <= 0
+
+    def __gt__(self, other):
+        return self._compare(other) > 0
+
+    def __ge__(self, other):
+        return self._compare(other) >= 0
+
+
+ZERO = BigNum(0)
+
+
+def as_big(value):
+    """
+    Return 'value' as a BigNum without copying one that already is.
+    """
+    return value if type(value) is BigNum else BigNum(value)
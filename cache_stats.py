@@ -0,0 +1,38 @@
+"""
+Shared bookkeeping for the SpaceRace render caches.
+
+TextCache, SurfacePool and RowCache all keep a dict of rendered surfaces and
+report how often a lookup was served from it. CountedCache holds that part
+once: the entry dict, hit/miss counters overall and for the last finished
+frame (end_frame()), clear() and len(). Subclasses only decide what a key
+is and how a missing entry gets built.
+"""
+
+
+class CountedCache:
+    """
+    A dict of cached entries plus hit/miss counters.
+    """
+
+    def __init__(self, entries=None):
+        self._entries    = entries if entries is not None else {}
+        self.hits        = 0
+        self.misses      = 0
+        self.last_frame  = (0, 0)   # (hits, misses) of the last finished frame
+        self._frame_base = (0, 0)
+
+    def end_frame(self):
+        """
+        Close the current frame's counters into last_frame.
+        """
+        self.last_frame  = (self.hits - self._frame_base[0], self.misses - self._frame_base[1])
+        self._frame_base = (self.hits, self.misses)
+
+    def clear(self):
+        """
+        Drop every entry; the counters keep running.
+        """
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
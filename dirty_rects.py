@@ -0,0 +1,95 @@
+"""
+Dirty-rectangle bookkeeping for the SpaceRace main screen.
+
+The main view (header, sidebar, business cards) is mostly still: between two
+frames usually only a few progress bars, timers and the money label change.
+The screen surface keeps last frame's pixels, so each region reports the
+state it would draw this frame; regions whose (rect, state) match last frame
+are skipped entirely, and only the redrawn rectangles are pushed to the
+display with pygame.display.update(rects) instead of a full flip().
+
+A frame is drawn in full (fill + every region + flip) whenever the layout
+itself may have moved: a click, a resize, an overlay or popup opening or
+closing, or the window being exposed again.
+
+Things drawn on top of the regions every frame (the unlock popup, the F3
+readout) register their rectangle with cover(); the next frame clears those
+rectangles to the background and redraws every region under them first.
+"""
+import pygame
+
+
+class DirtyRects:
+    """
+    Per-region state from the last frame plus this frame's damaged rectangles.
+    """
+
+    def __init__(self, background):
+        self.background  = background
+        self.full        = True
+        self.last_frame  = (0, 0.0)   # (rectangles pushed, fraction of the screen)
+        self._states     = {}
+        self._rects      = []
+        self._covers     = []
+        self._prev_cover = []
+        self._force_full = True
+
+    def invalidate(self):
+        """
+        Redraw the whole screen next frame.
+        """
+        self._force_full = True
+
+    def begin_frame(self, surface, full):
+        """
+        Start a frame; 'full' asks for a complete redraw (fill + flip).
+        """
+        self.full        = full or self._force_full
+        self._force_full = False
+        self._rects      = []
+        self._prev_cover = self._covers
+        self._covers     = []
+        if self.full:
+            self._states.clear()
+            surface.fill(self.background)
+            return
+        for rect in self._prev_cover:
+            surface.fill(self.background, rect)
+            self._rects.append(rect)
+
+    def needs_redraw(self, region, rect, state):
+        """
+        True if 'region' must be drawn this frame: always in a full frame,
+        otherwise when its rect or 'state' changed or a cover lay on top of it.
+        The rect is queued for the display update whenever True is returned.
+        """
+        rect = pygame.Rect(rect)
+        key  = (tuple(rect), state)
+        if not self.full and self._states.get(region) == key and rect.collidelist(self._prev_cover) < 0:
+            return False
+        self._states[region] = key
+        self._rects.append(rect)
+        return True
+
+    def cover(self, rect):
+        """
+        Register something drawn over the regions this frame.
+        """
+        rect = pygame.Rect(rect)
+        self._covers.append(rect)
+        self._rects.append(rect)
+
+    def present(self, surface):
+        """
+        Push this frame to the display: flip() for a full frame, otherwise
+        update() with only the damaged rectangles (nothing if none changed).
+        """
+        if self.full:
+            pygame.display.flip()
+            self.last_frame = (1, 1.0)
+            return
+        if self._rects:
+            pygame.display.update(self._rects)
+        screen_area = surface.get_width() * surface.get_height()
+        area = sum(r.w * r.h for r in self._rects)
+        self.last_frame = (len(self._rects), min(1.0, area / screen_area) if screen_area else 0.0)
@@ -0,0 +1,117 @@
+"""
+Adaptive frame rate for SpaceRace.
+
+An idle game spends most of its life idle: nobody touching the mouse, the
+window behind another one, or minimized. Running 60 frames a second through
+all of that burns CPU for nothing, so FrameScheduler picks the rate from
+what the player is doing:
+
+    active     ACTIVE_FPS      input in the last IDLE_AFTER seconds
+    idle       IDLE_FPS        no input for IDLE_AFTER seconds
+    unfocused  UNFOCUSED_FPS   window lost keyboard/mouse focus
+    minimized  no rendering    woken by an event or every MINIMIZED_WAIT_MS
+
+Between slow frames it waits on the event queue instead of sleeping, so the
+first input after a quiet spell is handled at once and snaps back to the
+active rate. tick() returns the real time since the previous frame however
+long that was; the simulation advances in closed form, so one long step is
+exactly as good as many short ones.
+"""
+import time
+
+import pygame
+
+ACTIVE_FPS        = 60
+IDLE_FPS          = 10
+UNFOCUSED_FPS     = 5
+IDLE_AFTER        = 30.0    # seconds without input before dropping to IDLE_FPS
+MINIMIZED_WAIT_MS = 1000    # longest block while minimized
+
+# Events that count as the player doing something
+INPUT_EVENTS = {
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL, pygame.KEYDOWN, pygame.KEYUP, pygame.VIDEORESIZE,
+}
+
+
+class FrameScheduler:
+    """
+    Chooses the frame rate per frame and paces the main loop accordingly.
+    """
+
+    def __init__(self, clock):
+        self.clock      = clock
+        self.focused    = True
+        self.minimized  = False
+        self.last_input = time.monotonic()
+        self._frame_end = time.monotonic()
+
+    def on_event(self, event):
+        """
+        Feed every event from the main loop; input and window events change the mode.
+        """
+        kind = event.type
+        if kind in INPUT_EVENTS:
+            self.last_input = time.monotonic()
+        elif kind == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif kind == pygame.WINDOWFOCUSGAINED:
+            self.focused    = True
+            self.last_input = time.monotonic()
+        elif kind in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            self.minimized = True
+        elif kind in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED):
+            self.minimized = False
+
+    @property
+    def rendering(self):
+        """
+        False while minimized: keep simulating, skip drawing.
+        """
+        return not self.minimized
+
+    def mode(self):
+        """
+        "active", "idle", "unfocused" or "minimized".
+        """
+        if self.minimized:
+            return "minimized"
+        if not self.focused:
+            return "unfocused"
+        if time.monotonic() - self.last_input >= IDLE_AFTER:
+            return "idle"
+        return "active"
+
+    def target_fps(self):
+        """
+        Frame rate for the current mode (0 while minimized).
+        """
+        mode = self.mode()
+        if mode == "active":
+            return ACTIVE_FPS
+        if mode == "idle":
+            return IDLE_FPS
+        if mode == "unfocused":
+            return UNFOCUSED_FPS
+        return 0
+
+    def tick(self):
+        """
+        Wait until the next frame is due and return the seconds since the last one.
+        """
+        fps = self.target_fps()
+        if fps >= ACTIVE_FPS:
+            dt = self.clock.tick(fps) / 1000.0
+        else:
+            if fps:
+                wait_ms = int(1000 / fps - (time.monotonic() - self._frame_end) * 1000)
+            else:
+                wait_ms = MINIMIZED_WAIT_MS
+            if wait_ms > 0:
+                # Any event ends the wait early; hand it back to the main loop's event.get()
+                event = pygame.event.wait(wait_ms)
+                if event.type != pygame.NOEVENT:
+                    pygame.event.post(event)
+            dt = self.clock.tick() / 1000.0
+        self._frame_end = time.monotonic()
+        return dt
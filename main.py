@@ -5,6 +5,17 @@ import json
 import math
 import time
 
+from assets import AssetManager, IconCache
+from dirty_rects import DirtyRects
+from frame_scheduler import FrameScheduler
+from bignum import as_big
+from number_format import NOTATIONS, format_number_parts, get_notation, set_notation
+from pricing import PricingService
+from text_cache import TextCache
+from simulation import SimulationCore, UnlockIndex, advance
+from surface_pool import SurfacePool
+from virtual_list import WHEEL_STEP, RowCache, VirtualList
+
 pygame.init()
 
 # -------------------------------------------------------------------------------
@@ -60,82 +71,6 @@ def load_game():
 # -------------------------------------------------------------------------------
 # 3. UI UTILITIES
 # -------------------------------------------------------------------------------
-def format_number_parts(n):
-    """
-    Split a number into a mantissa and suffix (e.g., 1,234,000 → ("1.234", "Million")).
-    """
-    units = [
-        " ", " Thousand", " Million", " Billion", " Trillion", " Quadrillion",
-        " Quintillion", " Sextillion", " Septillion", " Octillion", " Nonillion",
-        " Decillion", " Undecillion", " Duodecillion", " Tredécillion",
-        " Quattuordecillion", " Quindecillion", " Sexdecillion",
-        " Septendecillion", " Octodecillion", " Novemdecillion", " Vigintillion",
-        " Unvigintillion", " Duovigintillion", " Trevigintillion",
-        " Quattuorvigintillion", " Quinvigintillion", " Sexvigintillion",
-        " Septenvigintillion", " Octovigintillion", " Novemnovigintillion",
-        " Trigintillion", " Untrigintillion", " Duotrigintillion",
-        " Trestrigintillion", " Quattuortrigintillion", " Quintrigintillion",
-        " Sextrigintillion", " Septentrigintillion", " Octotrigintillion",
-        " Novemtrigintillion", " Quadragintillion", " Unquadragintillion",
-        " Duoquadragintillion", " Trequadragintillion", " Quattuorquadragintillion",
-        " Quinquadragintillion", " Sexquadragintillion", " Septenquadragintillion",
-        " Octoquadragintillion", " Novemquadragintillion", " Quinquagintillion",
-        " Unquinquagintillion", " Duoquinquagintillion", " Trequinquagintillion",
-        " Quattuorquinquagintillion", " Quinquinquagintillion", " Sexquinquagintillion",
-        " Septenquinquagintillion", " Octoquinquagintillion", " Novemquinquagintillion",
-        " Sexagintillion", " Unsexagintillion", " Duosexagintillion", " Tresexagintillion",
-        " Quattuorsexagintillion", " Quinsexagintillion", " Sexsexagintillion",
-        " Septensexagintillion", " Octosexagintillion", " Novemsexagintillion",
-        " Septuagintillion", " Unseptuagintillion", " Duoseptuagintillion",
-        " Treseptuagintillion", " Quattuorseptuagintillion", " Quinseptuagintillion",
-        " Sexseptuagintillion", " Septenseptuagintillion", " Octoseptuagintillion",
-        " Novemseptuagintillion", " Octogintillion", " Unoctogintillion",
-        " Duooctogintillion", " Treoctogintillion", " Quattuoroctogintillion",
-        " Quinoctogintillion", " Sexoctogintillion", " Septenoctogintillion",
-        " Octooctogintillion", " Novemoctogintillion", " Nonagintillion",
-        " Unnonagintillion", " Duononagintillion", " Trenonagintillion",
-        " Quattuornonagintillion", " Quinnonagintillion", " Sexnonagintillion",
-        " Septennonagintillion", " Octononagintillion", " Novemnonagintillion",
-        " Centillion"
-    ]
-    scale = 0
-    val = float(n)
-    while abs(val) >= 1000.0 and scale < len(units) - 1:
-        val /= 1000.0
-        scale += 1
-    mantissa = f"{val:.3f}"
-    suffix = units[scale]
-    return mantissa, suffix
-
-def total_cost_for_next_N(biz, N):
-    """
-    Return the total cost to purchase N more of business 'biz', given its current owned count.
-    """
-    owned = biz["owned"]
-    b0 = biz["base_cost"] * (biz["coef"] ** owned)
-    if N == 0:
-        return 0
-    if biz["coef"] == 1:
-        return int(b0 * N)
-    numerator   = (biz["coef"] ** N) - 1
-    denom       = biz["coef"] - 1
-    total_cost  = b0 * (numerator / denom)
-    return int(total_cost)
-
-def max_affordable(biz, money_available):
-    """
-    Return the maximum number of biz items you can purchase with 'money_available'.
-    """
-    owned = biz["owned"]
-    base_term = biz["base_cost"] * (biz["coef"] ** owned)
-    if base_term == 0:
-        return 0
-    rhs = 1 + (money_available * (biz["coef"] - 1) / base_term)
-    if rhs <= 1:
-        return 0
-    N = int(math.log(rhs, biz["coef"]))
-    return max(0, N)
-
 def format_time(seconds_left):
     """
     Format a float number of seconds as MM:SS.
@@ -148,81 +83,14 @@ def format_time(seconds_left):
 # -------------------------------------------------------------------------------
 # 4. OFFLINE EARNINGS CALCULATION
 # -------------------------------------------------------------------------------
-def calculate_offline_earnings(data_loaded: dict, now_ts: float):
+def calculate_offline_earnings(sim, last_ts: float, now_ts: float):
     """
-    Compute earnings while offline for every owned business (whether or not it has a manager).
+    Compute earnings while offline by advancing the simulation over the gap.
+    Uses the same closed-form advance() as live play, so managers keep
+    cycling and unmanaged businesses finish only the cycle they were running.
     """
-    last_ts = data_loaded.get("last_timestamp", now_ts)
     offline_seconds = max(0.0, now_ts - last_ts)
-
-    total_offline_earn = 0
-    global_speed_mult   = data_loaded.get("global_speed_mult", 1.0)
-    global_profit_mult  = data_loaded.get("global_profit_mult", 1.0)
-    galactic_investors_total = data_loaded.get("galactic_investors_total", 0)
-    investor_effectiveness_mult = data_loaded.get("investor_effectiveness_mult", 0.0)
-
-    per_investor_pct = 0.02 + investor_effectiveness_mult
-
-    for i, biz_saved in enumerate(data_loaded["businesses"]):
-        owned = biz_saved["owned"]
-        if owned <= 0:
-            continue
-
-        base_time      = biz_saved["base_time"]
-        speed_mult     = biz_saved["speed_mult"]
-        effective_time = (base_time / speed_mult) / global_speed_mult
-        if effective_time <= 0:
-            continue
-
-        cycles = math.floor(offline_seconds / effective_time)
-        one_cycle_value = (
-            biz_saved["base_payout"]
-            * owned
-            * biz_saved["profit_mult"]
-            * global_profit_mult
-            * (1.0 + per_investor_pct * galactic_investors_total)
-        )
-
-        if cycles > 0:
-            earned = one_cycle_value * cycles
-            total_offline_earn += earned
-
-            remainder = offline_seconds - (cycles * effective_time)
-            if biz_saved.get("has_manager", False):
-                if remainder >= effective_time:
-                    total_offline_earn += one_cycle_value
-                    biz_saved["in_progress"] = True
-                    biz_saved["timer"] = effective_time - (remainder - effective_time)
-                else:
-                    biz_saved["in_progress"] = True
-                    biz_saved["timer"] = effective_time - remainder
-            else:
-                if remainder >= effective_time:
-                    total_offline_earn += one_cycle_value
-                    biz_saved["in_progress"] = False
-                    biz_saved["timer"] = 0.0
-                else:
-                    biz_saved["in_progress"] = True
-                    biz_saved["timer"] = effective_time - remainder
-
-            continue
-
-        saved_timer = biz_saved.get("timer", 0.0)
-        if saved_timer > 0:
-            new_timer = saved_timer - offline_seconds
-            if new_timer <= 0:
-                total_offline_earn += one_cycle_value
-                biz_saved["in_progress"] = False
-                biz_saved["timer"] = 0.0
-            else:
-                biz_saved["in_progress"] = True
-                biz_saved["timer"] = new_timer
-
-    data_loaded["money"] += total_offline_earn
-    data_loaded["space_lifetime_earnings"] += total_offline_earn
-    data_loaded["last_timestamp"] = now_ts
-
-    return total_offline_earn
+    return advance(sim, offline_seconds)
 
 # -------------------------------------------------------------------------------
 # 5. DEFAULT GAME STATE
@@ -237,6 +105,7 @@ def default_game_state():
         "global_speed_mult": 1.0,
         "global_profit_mult": 1.0,
         "investor_effectiveness_mult": 0.0,
+        "number_notation": "suffix",
         "last_timestamp": time.time(),
         "galactic_investors_total": 0,
         "galactic_investors_spent": 0,
@@ -265,9 +134,11 @@ if os.path.isfile(icon_path):
 else:
     print("Icon file not found at:", icon_path)
 
-FPS = 60
 clock = pygame.time.Clock()
 
+# Drops the frame rate when idle or unfocused and stops drawing while minimized
+scheduler = FrameScheduler(clock)
+
 WHITE              = (235, 235, 245)
 ACCENT             = (82, 130, 255)
 BG_DARK            = (30, 32, 41)
@@ -287,21 +158,22 @@ font_big   = pygame.font.SysFont(None, 44)
 font_med   = pygame.font.SysFont(None, 32)
 font_small = pygame.font.SysFont(None, 20)
 
-# Scroll offsets & dragging state
+# First-time pop-up letter
+font_center = pygame.font.SysFont(None, 28)
+font_bold   = pygame.font.SysFont(None, 28, bold=True)
+
+# Rendered labels keyed on (font, text, colour); every draw function goes through it
+text_cache = TextCache()
+
+# Translucent fills (overlay dimmers, locked-card veil, timer boxes) reused frame to frame
+surface_pool = SurfacePool()
+
+# Main-screen regions redrawn (and pushed to the display) only when they change
+dirty = DirtyRects(BG_DARK)
+last_scene = None
+
+# Scroll offset of the business panel
 business_scroll      = 0
-manager_scroll       = 0
-upgrade_scroll       = 0
-unlock_scroll        = 0
-investor_shop_scroll = 0
-investor_shop_dragging = False
-investor_shop_drag_offset = 0
-
-manager_dragging      = False
-manager_drag_offset   = 0
-upgrade_dragging      = False
-upgrade_drag_offset   = 0
-unlock_dragging       = False
-unlock_drag_offset    = 0
 
 SIDEBAR_WIDTH  = 180
 HEADER_HEIGHT  = 80
@@ -314,6 +186,15 @@ ROW_GAP        = 16
 INVESTOR_ICON_SIZE = 58
 ENTRY_PADDING      = 20
 
+# Overlay lists: each owns its scroll offset and scrollbar drag state
+manager_list       = VirtualList(60, 10)
+upgrade_list       = VirtualList(80, 10)
+unlock_list        = VirtualList(60, 10)
+investor_shop_list = VirtualList(max(INVESTOR_ICON_SIZE + ENTRY_PADDING, 60), 12)
+
+# Rendered Upgrades / Unlocks / Investor Shop rows, keyed on what they show
+row_cache = RowCache()
+
 prestige_count = 0
 
 overlay_mode        = None
@@ -5424,66 +5305,45 @@ galactic_upgrades = [
 # -------------------------------------------------------------------------------
 def load_all_business_images():
     """
-    Loads and scales images for each business, global unlocks, upgrades, and the stats icon.
+    Loads images for each business, global unlocks, upgrades, and the stats icon
+    through the asset manager, then pre-scales every icon.
     - Businesses use their own 'asset_path'.
     - Unlocks with biz_index=None use 'assets/global.png'.
     - Cash-upgrades with biz_index=None also use the global icon.
     - The stats button uses 'assets/stats.png'.
+    - Galactic upgrades reuse those files through their 'icon_image'.
     """
-    # ─── LOAD BUSINESS IMAGES (96×96) ───
+    assets.clear()
+
+    # ─── LOAD BUSINESS IMAGES (drawn at 96/60 via icon_cache) ───
     for biz in businesses:
         rel = biz.get("asset_path")
-        if rel:
-            abs_p = resource_path(rel)
-            if os.path.isfile(abs_p):
-                try:
-                    img = pygame.image.load(abs_p).convert_alpha()
-                    biz["image"] = pygame.transform.smoothscale(img, (96, 96))
-                except Exception:
-                    biz["image"] = None
-            else:
-                biz["image"] = None
-        else:
-            biz["image"] = None
-
-    # ─── LOAD GLOBAL UNLOCK ICON (96×96) ───
-    global_abs = resource_path("assets/global.png")
-    if os.path.isfile(global_abs):
-        try:
-            gimg = pygame.image.load(global_abs).convert_alpha()
-            gimg = pygame.transform.smoothscale(gimg, (96, 96))
-            for u in unlocks:
-                if u.get("biz_index") is None:
-                    u["image"] = gimg
-        except Exception:
-            for u in unlocks:
-                if u.get("biz_index") is None:
-                    u["image"] = None
-    else:
-        for u in unlocks:
-            if u.get("biz_index") is None:
-                u["image"] = None
-
-    # ─── ASSIGN GLOBAL ICON TO CASH-UPGRADES (biz_index=None) ───
-    if 'gimg' in locals():
-        for upg in upgrades:
-            if upg.get("biz_index") is None:
-                upg["image"] = gimg
-    else:
-        for upg in upgrades:
-            if upg.get("biz_index") is None:
-                upg["image"] = None
+        biz["image"] = assets.image(rel) if rel else None
+
+    # ─── GLOBAL ICON FOR UNLOCKS & CASH-UPGRADES (biz_index=None) ───
+    gimg = assets.image("assets/global.png")
+    for u in unlocks:
+        if u.get("biz_index") is None:
+            u["image"] = gimg
+    for upg in upgrades:
+        if upg.get("biz_index") is None:
+            upg["image"] = gimg
+
+    # ─── PRE-SCALE EVERY ICON (all draw sizes, normal + locked) ───
+    icon_paths = [biz["asset_path"] for biz in businesses if biz.get("asset_path")]
+    icon_paths.append("assets/global.png")
+    icon_paths.extend(gu["icon_image"] for gu in galactic_upgrades if gu.get("icon_image"))
+    assets.preload(icon_paths)
 
     # ─── LOAD STATS ICON (50×50) ───
-    try:
-        t_abs = resource_path("assets/stats.png")
-        if os.path.isfile(t_abs):
-            img_t = pygame.image.load(t_abs).convert_alpha()
-            globals()["stats_icon"] = pygame.transform.smoothscale(img_t, (50, 50))
-        else:
-            globals()["stats_icon"] = None
-    except Exception:
-        globals()["stats_icon"] = None
+    img_t = assets.image("assets/stats.png")
+    globals()["stats_icon"] = icon_cache.get(img_t, 50) if img_t else None
+
+# Scaled (and greyed) icon variants, rebuilt by load_all_business_images()
+icon_cache = IconCache()
+
+# Decodes each PNG once; every loaded image goes through here
+assets = AssetManager(resource_path, icon_cache)
 
 load_all_business_images()
 
@@ -5516,11 +5376,6 @@ if loaded is None:
         game_state["galactic_upgrades"].append({"purchased": gu["purchased"]})
 
     # Initialize local variables from default state
-    money                       = game_state["money"]
-    space_lifetime_earnings     = game_state["space_lifetime_earnings"]
-    global_speed_mult           = game_state["global_speed_mult"]
-    global_profit_mult          = game_state["global_profit_mult"]
-    galactic_investors_total    = game_state["galactic_investors_total"]
     galactic_investors_spent    = game_state["galactic_investors_spent"]
     unlocked_shown              = set(game_state["unlocked_shown"])
 
@@ -5539,7 +5394,7 @@ if loaded is None:
     first_time_popup_close = pygame.Rect(cb_x, cb_y, cb_size, cb_size)
 
     cycle_start_time  = time.time()
-    cycle_start_money = money
+    cycle_start_money = game_state["money"]
 
     click_count = 0
     session_start_time = time.time()
@@ -5573,31 +5428,21 @@ else:
             galactic_upgrades[i]["purchased"] = gu_saved.get("purchased", False)
 
     # Restore core numeric values
-    money                       = game_state.get("money", 5.0)
-    space_lifetime_earnings     = game_state.get("space_lifetime_earnings", 0)
-    global_speed_mult           = game_state.get("global_speed_mult", 1.0)
-    global_profit_mult          = game_state.get("global_profit_mult", 1.0)
-    galactic_investors_total    = game_state.get("galactic_investors_total", 0)
+    game_state.setdefault("money", 5.0)
+    game_state.setdefault("space_lifetime_earnings", 0)
+    game_state.setdefault("global_speed_mult", 1.0)
+    game_state.setdefault("global_profit_mult", 1.0)
+    game_state.setdefault("galactic_investors_total", 0)
     galactic_investors_spent    = game_state.get("galactic_investors_spent", 0)
     
     game_state.setdefault("investor_effectiveness_mult", 0.0)
+    game_state.setdefault("number_notation", "suffix")
 
-    # Offline earnings & timer adjustments
     now_ts = time.time()
-    offline_earned = calculate_offline_earnings(game_state, now_ts)
-    if offline_earned > 0:
-        money = game_state["money"]
-        mant, suff = format_number_parts(int(offline_earned))
-        popup_message = {
-            "text": f"You earned ${mant}{suff} while away",
-            "requirement": "Press X to close"
-        }
-        popup_end_time = pygame.time.get_ticks() + 3000
 
     load_all_business_images()
 
     cycle_start_time  = now_ts
-    cycle_start_money = money
 
     click_count = game_state.get("click_count", 0)
     session_start_time = now_ts - game_state.get("total_playtime", 0.0)
@@ -5627,41 +5472,79 @@ if loaded is None:
     game_state["playtime_this_prestige"] = playtime_this_prestige
     game_state["total_playtime"] = total_playtime
 
+# The simulation core owns money, multipliers and every business timer from here on
+sim = SimulationCore(
+    businesses,
+    money                       = game_state["money"],
+    space_lifetime_earnings     = game_state["space_lifetime_earnings"],
+    global_speed_mult           = game_state["global_speed_mult"],
+    global_profit_mult          = game_state["global_profit_mult"],
+    galactic_investors_total    = game_state["galactic_investors_total"],
+    investor_effectiveness_mult = game_state["investor_effectiveness_mult"],
+)
+
+if game_state["number_notation"] in NOTATIONS:
+    set_notation(game_state["number_notation"])
+
+# (count, cost) per business and purchase mode, repriced only when owned or money moves past a price
+pricing = PricingService(businesses)
+
+# Sorted per-business / global thresholds, so unlock checks only run when owned changes
+unlock_index = UnlockIndex(unlocks, len(businesses), unlocked_shown)
+
+if loaded is not None:
+    # Offline earnings & timer adjustments
+    offline_earned = calculate_offline_earnings(sim, game_state.get("last_timestamp", now_ts), now_ts)
+    if offline_earned > 0:
+        mant, suff = format_number_parts(offline_earned.floor())
+        popup_message = {
+            "text": f"You earned ${mant}{suff} while away",
+            "requirement": "Press X to close"
+        }
+        popup_end_time = pygame.time.get_ticks() + 3000
+
+    cycle_start_money = sim.money
+
 # -------------------------------------------------------------------------------
 # 13. APPLY UNLOCKS HELPER
 # -------------------------------------------------------------------------------
-def apply_single_unlock(idx):
+def apply_crossed_unlocks():
     """
-    idx is the index into `unlocks`. If u["type"] is "speed" or "profit", we
-    multiply only that business. If u["type"] starts with "global_", we adjust
-    global_speed_mult or global_profit_mult. Then we fire a popup.
-    Finally, we add idx to unlocked_shown so it never triggers again.
+    Apply every unlock reached since the last check in one step. The index hands
+    back the combined speed/profit factor per business (and for the global
+    multipliers), so a bulk buy crossing dozens of thresholds multiplies once
+    and shows a single popup. The fired indices go into unlocked_shown so they
+    never trigger again.
     """
-    global popup_message, popup_end_time, global_speed_mult, global_profit_mult
+    global popup_message, popup_end_time
 
-    u = unlocks[idx]
-    descr = u["description"]
+    fired, factors = unlock_index.crossed(businesses)
+    if not fired:
+        return
 
-    if u["biz_index"] is not None:
-        biz = businesses[u["biz_index"]]
-        if u["type"] == "speed":
-            biz["speed_mult"] *= u["multiplier"]
-        elif u["type"] == "profit":
-            biz["profit_mult"] *= u["multiplier"]
-    else:
-        if u["type"] == "global_speed":
-            global_speed_mult *= u["multiplier"]
-        elif u["type"] == "global_profit":
-            global_profit_mult *= u["multiplier"]
+    for target, (speed, profit) in factors.items():
+        if target is None:
+            if speed != 1.0:
+                sim.global_speed_mult *= speed
+            if profit != 1.0:
+                sim.global_profit_mult *= profit
+        else:
+            biz = businesses[target]
+            biz["speed_mult"]  *= speed
+            biz["profit_mult"] *= profit
+            sim.invalidate(target)
 
+    unlocked_shown.update(fired)
+
+    descr = unlocks[fired[-1]]["description"]
+    if len(fired) > 1:
+        descr = f"{len(fired)} unlocks! Latest: {descr}"
     popup_message = {
         "text": descr,
         "requirement": "Press X to close"
     }
     popup_end_time = pygame.time.get_ticks() + 2000
 
-    unlocked_shown.add(idx)
-
 # -------------------------------------------------------------------------------
 # 14. UI DRAW FUNCTIONS
 # -------------------------------------------------------------------------------
@@ -5673,10 +5556,6 @@ def draw_sidebar(surface, mouse_pos, mouse_clicked):
     If there is any *new* affordable, unpurchased upgrade while the Upgrades tab is not open,
     draw a red notification dot on the Upgrades button.
     """
-    pygame.draw.rect(surface, SIDEBAR_BG, (0, 0, SIDEBAR_WIDTH, HEIGHT))
-    title_surf = font_big.render("SpaceRace", True, WHITE)
-    surface.blit(title_surf, ((SIDEBAR_WIDTH // 2) - (title_surf.get_width() // 2), 20))
-
     btn_h = 50
     spacing = 20
     y_start = 100
@@ -5686,7 +5565,7 @@ def draw_sidebar(surface, mouse_pos, mouse_clicked):
     # Determine which upgrades are currently affordable
     current_affordable = set(
         i for i, upg in enumerate(upgrades)
-        if (not upg["purchased"]) and (money >= upg["cost"])
+        if (not upg["purchased"]) and (sim.money >= upg["cost"])
     )
 
     # The dot appears only if there's at least one index in current_affordable
@@ -5696,6 +5575,16 @@ def draw_sidebar(surface, mouse_pos, mouse_clicked):
         if current_affordable - prev_affordable_upgrades:
             upgrade_notification = True
 
+    # Skip the redraw while the dot and the hover are unchanged
+    sidebar_rect = pygame.Rect(0, 0, SIDEBAR_WIDTH, HEIGHT)
+    hover_pos    = mouse_pos if sidebar_rect.collidepoint(mouse_pos) else None
+    if not dirty.needs_redraw("sidebar", sidebar_rect, (upgrade_notification, hover_pos)):
+        return None
+
+    pygame.draw.rect(surface, SIDEBAR_BG, sidebar_rect)
+    title_surf = text_cache.render(font_big, "SpaceRace", WHITE)
+    surface.blit(title_surf, ((SIDEBAR_WIDTH // 2) - (title_surf.get_width() // 2), 20))
+
     # ────────────────────────────────────────────────────────
     # Top four menu items
     labels = ["Managers", "Upgrades", "Unlocks", "Investors"]
@@ -5705,7 +5594,7 @@ def draw_sidebar(surface, mouse_pos, mouse_clicked):
         hovered = rect.collidepoint(mouse_pos)
         color   = BTN_HOVER if hovered else PANEL_DARK
         pygame.draw.rect(surface, color, rect, border_radius=12)
-        label = font_med.render(label_text, True, WHITE)
+        label = text_cache.render(font_med, label_text, WHITE)
         surface.blit(
             label,
             (rect.x + (rect.w - label.get_width()) // 2,
@@ -5734,7 +5623,7 @@ def draw_sidebar(surface, mouse_pos, mouse_clicked):
     if globals().get("stats_icon"):
         surface.blit(globals()["stats_icon"], (stats_x, stats_y))
     else:
-        t_txt = font_med.render("📊", True, WHITE)
+        t_txt = text_cache.render(font_med, "📊", WHITE)
         surface.blit(t_txt, (stats_x + (stats_size - t_txt.get_width()) // 2,
                              stats_y + (stats_size - t_txt.get_height()) // 2))
     if hovered_t and mouse_clicked:
@@ -5744,11 +5633,29 @@ def draw_sidebar(surface, mouse_pos, mouse_clicked):
 
 def draw_header(surface, money, mouse_pos, mouse_clicked):
     global purchase_index
-    pygame.draw.rect(surface, PANEL_DARK, (SIDEBAR_WIDTH, 0, WIDTH - SIDEBAR_WIDTH, HEADER_HEIGHT))
-
     mant, suff = format_number_parts(money)
-    money_label = font_big.render(f"${mant}{suff}", True, WHITE)
-    surface.blit(money_label, (SIDEBAR_WIDTH + 20, (HEADER_HEIGHT - money_label.get_height()) // 2))
+    rate_mant, rate_suff = format_number_parts(sim.total_income_per_sec())
+    money_text = f"${mant}{suff}"
+    rate_text  = f"+${rate_mant}{rate_suff} /sec"
+
+    # Skip the redraw while the labels, the selected mode and the hover are unchanged
+    header_rect = pygame.Rect(SIDEBAR_WIDTH, 0, WIDTH - SIDEBAR_WIDTH, HEADER_HEIGHT)
+    hover_pos   = mouse_pos if header_rect.collidepoint(mouse_pos) else None
+    if not dirty.needs_redraw("header", header_rect, (money_text, rate_text, purchase_index, hover_pos)):
+        return
+
+    pygame.draw.rect(surface, PANEL_DARK, header_rect)
+
+    # Money and income change every frame, so they are drawn from glyph atlases
+    money_glyphs = text_cache.atlas(font_big, WHITE)
+
+    # Income/sec from the simulation's running total, just under the money
+    rate_glyphs = text_cache.atlas(font_small, ACCENT)
+
+    block_h = money_glyphs.height + 4 + rate_glyphs.height
+    money_y = (HEADER_HEIGHT - block_h) // 2
+    money_glyphs.draw(surface, money_text, (SIDEBAR_WIDTH + 20, money_y))
+    rate_glyphs.draw(surface, rate_text, (SIDEBAR_WIDTH + 22, money_y + money_glyphs.height + 4))
 
     # Now six buttons: x1, x5, x10, x50, x100, MAX
     labels = ["x1", "x5", "x10", "x50", "x100", "MAX"]
@@ -5759,7 +5666,7 @@ def draw_header(surface, money, mouse_pos, mouse_clicked):
 
     # Compute total width needed
     for lbl in labels:
-        txt = font_small.render(lbl, True, WHITE)
+        txt = text_cache.render(font_small, lbl, WHITE)
         total_w += txt.get_width() + 20
     total_w += gap * (len(labels) - 1)
 
@@ -5768,7 +5675,7 @@ def draw_header(surface, money, mouse_pos, mouse_clicked):
 
     x = x0
     for i, lbl in enumerate(labels):
-        txt = font_small.render(lbl, True, WHITE)
+        txt = text_cache.render(font_small, lbl, WHITE)
         w = txt.get_width() + 20
         rect = pygame.Rect(x, y0, w, btn_h)
         hovered = rect.collidepoint(mouse_pos)
@@ -5787,16 +5694,100 @@ def draw_header(surface, money, mouse_pos, mouse_clicked):
                 purchase_index = i
                 break
 
-def draw_business_panel(surface, dt, mouse_pos, mouse_clicked):
+# Per-business static card layers: idx -> ((size, unlocked, owned), surface, owned label width)
+card_layers = {}
+
+def card_static_layer(idx, size):
+    """
+    The pre-composited static part of business 'idx''s card at 'size': rounded
+    background, 96px icon, name, owned count and (once unlocked) the empty
+    progress-bar track. Rebuilt only when the card unlocks, its owned count
+    changes or the window is resized. Returns (surface, owned label width).
+    """
+    biz      = businesses[idx]
+    unlocked = biz["unlocked"]
+    key      = (size, unlocked, biz["owned"])
+    cached   = card_layers.get(idx)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    w, h  = size
+    layer = pygame.Surface(size)
+    layer.fill(BG_DARK)
+    bg_col = BUSINESS_BG if unlocked else BUSINESS_BG_LOCKED
+    pygame.draw.rect(layer, bg_col, (0, 0, w, h), border_radius=18)
+
+    # ICON
+    if biz.get("image"):
+        layer.blit(icon_cache.get(biz["image"], 96, locked=not unlocked), (0, (h - 96) // 2))
+    else:
+        col_icon = biz["icon_color"] if unlocked else GRAYED
+        pygame.draw.circle(layer, col_icon, (32, 32), 32)
+        pygame.draw.circle(layer, PANEL_DARK if unlocked else BUSINESS_BG_LOCKED, (32, 32), 26)
+        pygame.draw.circle(layer, col_icon, (32, 32), 21)
+        icon_label = text_cache.render(font_big, biz["icon"], WHITE if unlocked else GRAYED)
+        layer.blit(icon_label, (16, 16))
+
+    txt_col   = WHITE if unlocked else GRAYED
+    name_surf = text_cache.render(font_med, biz["name"], txt_col)
+    layer.blit(name_surf, (100, 18))
+
+    owned_glyphs = text_cache.atlas(font_small, txt_col)
+    owned_w = owned_glyphs.draw(layer, f"x{biz['owned']}", (100, 52))
+
+    # Empty progress-bar track (locked cards show the cost veil instead)
+    if unlocked:
+        pygame.draw.rect(layer, PROGRESS_BG, (100, 80, w - 170, 18), border_radius=7)
+
+    card_layers[idx] = (key, layer, owned_w)
+    return layer, owned_w
+
+# Fast-cycle stripes: STRIPE_W wide, one every STRIPE_PERIOD pixels
+STRIPE_W      = 20
+STRIPE_PERIOD = 40
+
+# Pre-baked stripe strips per bar size: (bar_w, bar_h) -> (texture, rounded-end caps)
+stripe_strips = {}
+
+def stripe_strip(bar_w, bar_h):
+    """
+    The striped fill for a fast-cycle bar of this size, built once. The texture
+    is one stripe period wider than the bar, so every scroll offset is just a
+    bar-wide window into it; the caps surface puts the card background back
+    outside the bar's rounded ends.
+    """
+    strip = stripe_strips.get((bar_w, bar_h))
+    if strip is not None:
+        return strip
+
+    texture = pygame.Surface((bar_w + STRIPE_PERIOD, bar_h))
+    texture.fill(PROGRESS_FILL)
+    stripe = pygame.Surface((STRIPE_W, bar_h), pygame.SRCALPHA)
+    stripe.fill(DARKER_GREEN)
+    for x_pos in range(STRIPE_PERIOD - STRIPE_W, bar_w + STRIPE_PERIOD, STRIPE_PERIOD):
+        texture.blit(stripe, (x_pos, 0))
+
+    caps = pygame.Surface((bar_w, bar_h), pygame.SRCALPHA)
+    caps.fill(BUSINESS_BG)
+    pygame.draw.rect(caps, (0, 0, 0, 0), (0, 0, bar_w, bar_h), border_radius=7)
+
+    strip = stripe_strips[(bar_w, bar_h)] = (texture, caps)
+    return strip
+
+def draw_business_panel(surface, mouse_pos, mouse_clicked):
     """
     Draw all businesses in two columns inside a scrollable panel.
+    Timers and payouts are only read here; sim.tick() advances them.
+    Cards whose displayed state is unchanged since last frame are not redrawn.
     Return (unlock_clicked_index, buy_clicked_index).
     """
-    global business_scroll, money, global_speed_mult, space_lifetime_earnings, global_profit_mult
+    global business_scroll
 
     stripe_threshold = 0.7  # threshold (in seconds) for "fast-cycle" visual
+    max_stripe_rate  = 15   # stripes/sec cap so very fast businesses don't blur
 
-    pygame.draw.rect(surface, BG_DARK, (PANEL_X - 10, PANEL_Y - 10, PANEL_WIDTH + 20, PANEL_HEIGHT + 20))
+    if dirty.full:
+        pygame.draw.rect(surface, BG_DARK, (PANEL_X - 10, PANEL_Y - 10, PANEL_WIDTH + 20, PANEL_HEIGHT + 20))
 
     n_total       = len(businesses)
     n_per_column  = math.ceil(n_total / 2)
@@ -5807,6 +5798,9 @@ def draw_business_panel(surface, dt, mouse_pos, mouse_clicked):
     unlock_clicked = None
     buy_clicked    = None
 
+    # Count and cost for the current purchase mode, straight from the pricing cache
+    quotes = pricing.quotes(sim.money, purchase_options[purchase_index])
+
     for idx, biz in enumerate(businesses):
         col = 0 if idx < n_per_column else 1
         row = idx if col == 0 else idx - n_per_column
@@ -5816,61 +5810,18 @@ def draw_business_panel(surface, dt, mouse_pos, mouse_clicked):
         biz_rect = pygame.Rect(x, y, (PANEL_WIDTH // 2) - ROW_GAP, ROW_HEIGHT)
 
         unlocked = biz["unlocked"]
-        bg_col   = BUSINESS_BG if unlocked else BUSINESS_BG_LOCKED
 
         # Only draw if within visible panel bounds
         if y + ROW_HEIGHT < PANEL_Y or y > PANEL_Y + PANEL_HEIGHT:
             continue
 
-        pygame.draw.rect(surface, bg_col, (x, y, biz_rect.w, biz_rect.h), border_radius=18)
-
-        # ICON
-        if biz.get("image"):
-            icon_surf = biz["image"]
-            icon_x = x
-            icon_y = y + (ROW_HEIGHT - 96) // 2
-            if not unlocked:
-                locked_img = icon_surf.copy()
-                locked_img.fill((100, 100, 100, 150), special_flags=pygame.BLEND_RGBA_MULT)
-                surface.blit(locked_img, (icon_x, icon_y))
-            else:
-                surface.blit(icon_surf, (icon_x, icon_y))
-        else:
-            icon_cx = x + 32
-            icon_cy = y + 32
-            col_icon = biz["icon_color"] if unlocked else GRAYED
-            pygame.draw.circle(surface, col_icon, (icon_cx, icon_cy), 32)
-            pygame.draw.circle(surface, PANEL_DARK if unlocked else BUSINESS_BG_LOCKED, (icon_cx, icon_cy), 26)
-            pygame.draw.circle(surface, col_icon, (icon_cx, icon_cy), 21)
-            icon_label = font_big.render(biz["icon"], True, WHITE if unlocked else GRAYED)
-            surface.blit(icon_label, (x + 16, y + 16))
-
-        txt_col   = WHITE if unlocked else GRAYED
-        name_surf = font_med.render(biz["name"], True, txt_col)
-        surface.blit(name_surf, (x + 100, y + 18))
-
-        profit_mult = (1.0 + (0.02 * galactic_investors_total)) * global_profit_mult * biz["profit_mult"]
-        earn_val    = int(biz["base_payout"] * biz["owned"] * profit_mult)
+        earn_val    = sim.payout_per_cycle(idx)
         earn_mant, earn_suff = format_number_parts(earn_val)
         earning_text = f"+${earn_mant}{earn_suff}"
         owned_text   = f"x{biz['owned']}"
 
-        second_y = y + 52
-        owned_surf = font_small.render(owned_text, True, txt_col)
-        earn_surf  = font_small.render(earning_text, True, (ACCENT if unlocked else GRAYED))
-        surface.blit(owned_surf, (x + 100, second_y))
-        surface.blit(earn_surf, (x + 100 + owned_surf.get_width() + 20, second_y))
-
         # Determine how many to buy at once
-        opt = purchase_options[purchase_index]
-        if opt == -1:
-            count = max_affordable(biz, money)
-        else:
-            count = opt
-        if count < 0:
-            count = 0
-
-        total_cost = total_cost_for_next_N(biz, count)
+        count, total_cost = quotes[idx]
 
         # BUY button is now moved above the progress bar
         btn_w = 140
@@ -5880,9 +5831,46 @@ def draw_business_panel(surface, dt, mouse_pos, mouse_clicked):
         btn_rect = pygame.Rect(btn_x, btn_y, btn_w, btn_h)
 
         mant, suff = format_number_parts(total_cost)
-        can_buy     = (money >= total_cost and count > 0 and unlocked)
+        can_buy     = (sim.money >= total_cost and count > 0 and unlocked)
         hovered_btn = btn_rect.collidepoint(mouse_pos)
 
+        if not unlocked:
+            # Instead of showing base_cost, show cost_for_count
+            # A MAX quote with nothing affordable falls back to the cached single-unit price
+            unlock_count = count if count > 0 else 1
+            unlock_cost  = total_cost if count > 0 else pricing.quote(idx, sim.money, 1)[1]
+            cost_mant_u, cost_suff_u = format_number_parts(unlock_cost)
+            can_unlock = (sim.money >= unlock_cost)
+            live_state  = (cost_mant_u, cost_suff_u, can_unlock)
+        elif biz["in_progress"]:
+            effective_time = sim.effective_time(idx)
+            if effective_time <= stripe_threshold:
+                # One stripe passes per completed cycle, so the bar shows real throughput
+                stripe_speed = STRIPE_PERIOD * min(sim.cycles_per_second(idx), max_stripe_rate)
+                offset = int((pygame.time.get_ticks() / 1000.0) * stripe_speed) % STRIPE_PERIOD
+                timer_text = f"{sim.cycles_per_second(idx):,.1f}/s"
+                live_state  = ("fast", offset, timer_text)
+            else:
+                fill_w     = int((biz_rect.w - 170) * sim.progress(biz))
+                timer_text = format_time(sim.time_left(biz))
+                live_state  = ("fill", fill_w, timer_text)
+        else:
+            live_state = None
+
+        # Cards that would look exactly like last frame are left on screen as they are
+        card_state = (unlocked, owned_text, earning_text, count, mant, suff,
+                      can_buy, hovered_btn and can_buy, live_state)
+        if not dirty.needs_redraw(("card", idx), biz_rect, card_state):
+            continue
+
+        # Static layer (background, icon, name, owned count, bar track) in one blit
+        layer, owned_w = card_static_layer(idx, biz_rect.size)
+        surface.blit(layer, (x, y))
+
+        second_y = y + 52
+        earn_glyphs  = text_cache.atlas(font_small, ACCENT if unlocked else GRAYED)
+        earn_glyphs.draw(surface, earning_text, (x + 100 + owned_w + 20, second_y))
+
         if can_buy:
             base_color = ACCENT
         else:
@@ -5894,10 +5882,10 @@ def draw_business_panel(surface, dt, mouse_pos, mouse_clicked):
         line1_y = btn_y + 6
         line2_y = btn_y + btn_h // 2 + 2
 
-        left1  = font_small.render("Buy", True, WHITE)
-        left2  = font_small.render(f"x{count}", True, WHITE)
-        right1 = font_small.render(f"{mant}", True, WHITE)
-        right2 = font_small.render(f"{suff}", True, WHITE)
+        left1  = text_cache.render(font_small, "Buy", WHITE)
+        left2  = text_cache.render(font_small, f"x{count}", WHITE)
+        right1 = text_cache.render(font_small, f"{mant}", WHITE)
+        right2 = text_cache.render(font_small, f"{suff}", WHITE)
 
         surface.blit(left1,  (btn_x + 8, line1_y))
         surface.blit(right1, (btn_x + btn_w - right1.get_width() - 8, line1_y))
@@ -5909,18 +5897,11 @@ def draw_business_panel(surface, dt, mouse_pos, mouse_clicked):
             buy_clicked = idx
 
         if not unlocked:
-            # Instead of showing base_cost, show cost_for_count
-            unlock_count = count if count > 0 else 1
-            unlock_cost  = total_cost_for_next_N(biz, unlock_count)
-            cost_mant_u, cost_suff_u = format_number_parts(unlock_cost)
-            can_unlock = (money >= unlock_cost)
             cost_color = WHITE if can_unlock else GRAYED
 
-            overlay_surf2 = pygame.Surface((biz_rect.w, biz_rect.h), pygame.SRCALPHA)
-            overlay_surf2.fill((40, 42, 56, 180))
-            surface.blit(overlay_surf2, (x, y))
+            surface.blit(surface_pool.filled(biz_rect.size, (40, 42, 56, 180)), (x, y))
 
-            lock_label = font_small.render(f"Cost: ${cost_mant_u}{cost_suff_u}", True, cost_color)
+            lock_label = text_cache.render(font_small, f"Cost: ${cost_mant_u}{cost_suff_u}", cost_color)
             surface.blit(
                 lock_label,
                 (x + (biz_rect.w - lock_label.get_width()) // 2,
@@ -5929,11 +5910,12 @@ def draw_business_panel(surface, dt, mouse_pos, mouse_clicked):
 
             # If you click on the locked rect and can afford "count" units, unlock+buy
             if biz_rect.collidepoint(mouse_pos) and mouse_clicked and can_unlock:
-                money -= unlock_cost
+                sim.money -= unlock_cost
                 biz["owned"]    = unlock_count
                 biz["unlocked"] = True
-                biz["in_progress"] = False
-                biz["timer"]    = 0.0
+                sim.invalidate(idx)
+                unlock_index.notify(idx)
+                sim.stop_production(idx)
                 unlock_clicked = idx
             continue
 
@@ -5943,10 +5925,8 @@ def draw_business_panel(surface, dt, mouse_pos, mouse_clicked):
         else:
             icon_hitbox = pygame.Rect(x + 16, y + 16, 64, 64)
 
-        if icon_hitbox.collidepoint(mouse_pos) and mouse_clicked and not biz["in_progress"] and biz["owned"] > 0:
-            biz["in_progress"] = True
-            effective_time = (biz["base_time"] / biz["speed_mult"]) / global_speed_mult
-            biz["timer"] = effective_time
+        if icon_hitbox.collidepoint(mouse_pos) and mouse_clicked:
+            sim.start_production(idx)
 
         # ─── PROGRESS BAR WITH FAST‐CYCLE OVERLAY LOGIC ───
         bar_x = x + 100
@@ -5954,80 +5934,34 @@ def draw_business_panel(surface, dt, mouse_pos, mouse_clicked):
         bar_w = biz_rect.w - 170
         bar_h = 18
 
-        pygame.draw.rect(surface, PROGRESS_BG, (bar_x, bar_y, bar_w, bar_h), border_radius=7)
-
-        if biz["in_progress"]:
-            effective_time = (biz["base_time"] / biz["speed_mult"]) / global_speed_mult
-            prev_timer = biz["timer"]
-            biz["timer"] -= dt * biz["speed_mult"] * global_speed_mult
-            reached_zero = False
-            if biz["timer"] <= 0:
-                biz["timer"] = 0.0
-                reached_zero = True
-
-            pct = max(0.0, min(1.0, 1.0 - (biz["timer"] / effective_time))) if effective_time > 0 else 0.0
-            fill_w = int(bar_w * pct)
-
-            if effective_time <= stripe_threshold:
-                # FAST‐CYCLE: full fill + dark‐green stripes overlay
-                pygame.draw.rect(surface, PROGRESS_FILL, (bar_x, bar_y, bar_w, bar_h), border_radius=7)
-                clip_rect = pygame.Rect(bar_x, bar_y, bar_w, bar_h)
-                surface.set_clip(clip_rect)
-
-                stripe_w = 20
-                stripe_speed = 200
-                offset = int((pygame.time.get_ticks() / 1000.0) * stripe_speed) % (stripe_w + 20)
-                stripe_surf = pygame.Surface((stripe_w, bar_h), pygame.SRCALPHA)
-                stripe_surf.fill(DARKER_GREEN)
-
-                x_pos = bar_x - stripe_w + offset
-                while x_pos < bar_x + bar_w:
-                    surface.blit(stripe_surf, (x_pos, bar_y))
-                    x_pos += stripe_w + 20
-                surface.set_clip(None)
+        if live_state is not None:
+            if live_state[0] == "fast":
+                # FAST‐CYCLE: a bar-wide window into the pre-baked stripe strip,
+                # shifted by the offset, then the rounded-end caps on top
+                texture, caps = stripe_strip(bar_w, bar_h)
+                window = pygame.Rect((STRIPE_PERIOD - offset) % STRIPE_PERIOD, 0, bar_w, bar_h)
+                surface.blits(((texture, (bar_x, bar_y), window), (caps, (bar_x, bar_y))), doreturn=False)
             else:
                 if fill_w > 0:
                     pygame.draw.rect(surface, PROGRESS_FILL, (bar_x, bar_y, fill_w, bar_h), border_radius=7)
 
-            if reached_zero:
-                profit_mult = (
-                    (1.0 + (0.02 * galactic_investors_total))
-                    * global_profit_mult
-                    * biz["profit_mult"]
-                )
-                payout_val = int(biz["base_payout"] * biz["owned"] * profit_mult)
-                money += payout_val
-                space_lifetime_earnings += payout_val
-
-                if biz["has_manager"]:
-                    biz["in_progress"] = True
-                    effective_time = (biz["base_time"] / biz["speed_mult"]) / global_speed_mult
-                    biz["timer"] = effective_time
-                else:
-                    biz["in_progress"] = False
-
             # ─── TIMER BOX just below Buy button and to the left of the progress bar ───
-            timer_text = format_time(biz["timer"])
-            tw_surf = font_small.render(timer_text, True, WHITE)
-            tw_w, tw_h = tw_surf.get_size()
+            timer_glyphs = text_cache.atlas(font_small, WHITE)
+            tw_w, tw_h = timer_glyphs.size(timer_text)
             box_w_t = tw_w + 12
             box_h_t = tw_h + 8
             box_x_t = bar_x - box_w_t - 8
             box_y_t = btn_y + btn_h + 2
-            timer_box = pygame.Surface((box_w_t, box_h_t), pygame.SRCALPHA)
-            timer_box.fill((40, 44, 55, 200))
-            surface.blit(timer_box, (box_x_t, box_y_t))
-            surface.blit(tw_surf, (box_x_t + 6, box_y_t + 4))
+            surface.blit(surface_pool.filled((box_w_t, box_h_t), (40, 44, 55, 200)), (box_x_t, box_y_t))
+            timer_glyphs.draw(surface, timer_text, (box_x_t + 6, box_y_t + 4))
 
     # ←── Return must occur *after* the loop finishes, not inside it ──→
     return unlock_clicked, buy_clicked
 
 def draw_managers_ui(surface, mouse_pos, mouse_clicked):
-    global close_btn_rect, money, manager_scroll, manager_dragging, manager_drag_offset
+    global close_btn_rect
 
-    overlay_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay_surf.fill((30, 30, 40, 210))
-    surface.blit(overlay_surf, (0, 0))
+    surface.blit(surface_pool.filled((WIDTH, HEIGHT), (30, 30, 40, 210)), (0, 0))
 
     box_w = int(WIDTH * 0.6)
     box_h = int(HEIGHT * 0.7)
@@ -6036,7 +5970,7 @@ def draw_managers_ui(surface, mouse_pos, mouse_clicked):
     pygame.draw.rect(surface, PANEL_DARK, (box_x, box_y, box_w, box_h), border_radius=12)
 
     # TITLE + CLOSE BUTTON
-    t_surf = font_big.render("Hire Managers", True, WHITE)
+    t_surf = text_cache.render(font_big, "Hire Managers", WHITE)
     surface.blit(t_surf, (box_x + (box_w - t_surf.get_width()) // 2, box_y + 20))
 
     close_size = 24
@@ -6044,7 +5978,7 @@ def draw_managers_ui(surface, mouse_pos, mouse_clicked):
     close_y    = box_y + 12
     close_btn_rect = pygame.Rect(close_x, close_y, close_size, close_size)
     pygame.draw.rect(surface, BTN_HOVER, close_btn_rect, border_radius=4)
-    x_surf = font_small.render("X", True, WHITE)
+    x_surf = text_cache.render(font_small, "X", WHITE)
     surface.blit(
         x_surf,
         (close_x + (close_size - x_surf.get_width()) // 2,
@@ -6064,25 +5998,17 @@ def draw_managers_ui(surface, mouse_pos, mouse_clicked):
     clip_rect     = pygame.Rect(box_x + 10, scroll_top, box_w - 20, visible_h)
     surface.set_clip(clip_rect)
 
-    mgr_entry_h = 60
-    spacing     = 10
-
-    total_content_h = len(businesses) * (mgr_entry_h + spacing)
-    max_mgr_scroll  = max(0, total_content_h - visible_h)
-    manager_scroll  = max(0, min(manager_scroll, max_mgr_scroll))
+    mgr_entry_h = manager_list.row_h
 
-    y_offset = mgr_list_y0 - manager_scroll
+    for i in manager_list.layout(clip_rect, len(businesses)):
+        biz      = businesses[i]
+        y_offset = manager_list.row_y(i)
 
-    for biz in businesses:
         biz_unlocked = biz["unlocked"]
         biz_has_mgr  = biz["has_manager"]
         cost_val     = biz["manager_cost"]
         cost_mant, cost_suff = format_number_parts(cost_val)
 
-        if (y_offset + mgr_entry_h < scroll_top) or (y_offset > scroll_bottom):
-            y_offset += mgr_entry_h + spacing
-            continue
-
         entry_rect = pygame.Rect(box_x + 10, y_offset, box_w - 20, mgr_entry_h)
         pygame.draw.rect(surface, (50, 50, 70), entry_rect, border_radius=8)
 
@@ -6090,21 +6016,15 @@ def draw_managers_ui(surface, mouse_pos, mouse_clicked):
         icon_size = 60
         icon_y    = y_offset + (mgr_entry_h - icon_size) // 2
         if biz.get("image"):
-            icon_surf = pygame.transform.smoothscale(biz["image"], (icon_size, icon_size))
-            if not biz_unlocked:
-                locked_img = icon_surf.copy()
-                locked_img.fill((100, 100, 100, 150), special_flags=pygame.BLEND_RGBA_MULT)
-                surface.blit(locked_img, (col1_x, icon_y))
-            else:
-                surface.blit(icon_surf, (col1_x, icon_y))
+            surface.blit(icon_cache.get(biz["image"], icon_size, locked=not biz_unlocked), (col1_x, icon_y))
         else:
             color = GRAYED if not biz_unlocked else WHITE
-            icosurf = font_big.render(biz["icon"], True, color)
+            icosurf = text_cache.render(font_big, biz["icon"], color)
             surface.blit(icosurf, (col1_x, icon_y))
 
         # NAME
         name_color = GRAYED if not biz_unlocked else YELLOW
-        name_surf  = font_med.render(biz["name"], True, name_color)
+        name_surf  = text_cache.render(font_med, biz["name"], name_color)
         surface.blit(name_surf, (col2_x, y_offset + 6))
 
         # DESCRIPTION or “Locked”
@@ -6112,11 +6032,11 @@ def draw_managers_ui(surface, mouse_pos, mouse_clicked):
             effect_text = "Automatically restarts production when idle"
         else:
             effect_text = "Locked until you unlock that business"
-        effect_surf = font_small.render(effect_text, True, GRAYED)
+        effect_surf = text_cache.render(font_small, effect_text, GRAYED)
         surface.blit(effect_surf, (col2_x, y_offset + 30))
 
         # COST
-        cost_surf = font_small.render(f"${cost_mant}{cost_suff}", True, ACCENT)
+        cost_surf = text_cache.render(font_small, f"${cost_mant}{cost_suff}", ACCENT)
         surface.blit(cost_surf, (col2_x, y_offset + 45))
 
         # HIRE BUTTON
@@ -6131,7 +6051,7 @@ def draw_managers_ui(surface, mouse_pos, mouse_clicked):
             base_color = PANEL_DARK
         else:
             btn_label  = "Hire"
-            can_hire   = (money >= cost_val)
+            can_hire   = (sim.money >= cost_val)
             base_color = ACCENT if can_hire else PANEL_DARK
 
         if hire_rect.collidepoint(mouse_pos) and can_hire:
@@ -6140,7 +6060,7 @@ def draw_managers_ui(surface, mouse_pos, mouse_clicked):
             hire_color = base_color
 
         pygame.draw.rect(surface, hire_color, hire_rect, border_radius=6)
-        hire_txt = font_small.render(btn_label, True, WHITE)
+        hire_txt = text_cache.render(font_small, btn_label, WHITE)
         surface.blit(
             hire_txt,
             (
@@ -6150,55 +6070,85 @@ def draw_managers_ui(surface, mouse_pos, mouse_clicked):
         )
 
         if hire_rect.collidepoint(mouse_pos) and mouse_clicked and can_hire:
-            money -= cost_val
-            biz["has_manager"] = True
-            if biz["owned"] > 0 and not biz["in_progress"]:
-                biz["in_progress"] = True
-                effective_time = (biz["base_time"] / biz["speed_mult"]) / global_speed_mult
-                biz["timer"]     = effective_time
-
-        y_offset += mgr_entry_h + spacing
+            sim.money -= cost_val
+            sim.hire_manager(biz["index"])
 
     surface.set_clip(None)
 
-    if total_content_h > visible_h:
-        track_x = box_x + box_w - 12
-        track_y = scroll_top
-        track_w = 6
-        track_h = visible_h
-        pygame.draw.rect(surface, (60, 60, 80), (track_x, track_y, track_w, track_h), border_radius=3)
-
-        thumb_h = max(20, int((visible_h / total_content_h) * visible_h))
-        max_thumb_travel = visible_h - thumb_h
-        if max_mgr_scroll > 0:
-            thumb_y = scroll_top + int((manager_scroll / max_mgr_scroll) * max_thumb_travel)
-        else:
-            thumb_y = scroll_top
+    manager_list.draw_scrollbar(surface, box_x + box_w - 12, mouse_pos, mouse_clicked, ACCENT, BTN_HOVER)
 
-        thumb_rect = pygame.Rect(track_x, thumb_y, track_w, thumb_h)
-        thumb_color = ACCENT if thumb_rect.collidepoint(mouse_pos) else BTN_HOVER
-        pygame.draw.rect(surface, thumb_color, thumb_rect, border_radius=3)
+    return close_btn_rect
 
-        global manager_dragging, manager_drag_offset
-        if mouse_clicked and thumb_rect.collidepoint(mouse_pos):
-            manager_dragging = True
-            manager_drag_offset = mouse_pos[1] - thumb_y
+def render_upgrade_row(row, upg, valid, can_buy, hovered):
+    """
+    Paint one Upgrades row onto 'row', a row-sized surface whose (0, 0) is the
+    row's top-left corner. Rows with a bad biz_index only get their background.
+    """
+    row_w, entry_h = row.get_size()
+    row.fill(PANEL_DARK)
+    pygame.draw.rect(row, (50, 50, 70), row.get_rect(), border_radius=8)
+    if not valid:
+        return
+
+    col1_x = -5
+    col2_x = 50
+    col3_x = row_w - 130
+
+    biz_index = upg.get("biz_index")
+    icon_size = 60
+    icon_y = (entry_h - icon_size) // 2
+
+    if biz_index is None:
+        biz_name = "All Businesses"
+        if upg.get("image"):
+            row.blit(icon_cache.get(upg["image"], icon_size), (col1_x, icon_y))
+        else:
+            pygame.draw.circle(
+                row,
+                (150, 150, 150),
+                (col1_x + icon_size // 2, icon_y + icon_size // 2),
+                icon_size // 2
+            )
+    else:
+        biz      = businesses[biz_index]
+        biz_name = biz["name"]
+        if biz.get("image"):
+            row.blit(icon_cache.get(biz["image"], icon_size), (col1_x, icon_y))
+        else:
+            icon_surf = text_cache.render(font_big, biz["icon"], WHITE)
+            row.blit(icon_surf, (col1_x, icon_y))
 
-        if manager_dragging and pygame.mouse.get_pressed()[0]:
-            new_y = mouse_pos[1] - manager_drag_offset
-            new_y = max(scroll_top, min(scroll_top + max_thumb_travel, new_y))
-            manager_scroll = int(((new_y - scroll_top) / max_thumb_travel) * max_mgr_scroll) if max_thumb_travel > 0 else 0
-        elif not pygame.mouse.get_pressed()[0]:
-            manager_dragging = False
+    name_surf = text_cache.render(font_med, upg["name"], YELLOW)
+    row.blit(name_surf, (col2_x, 8))
 
-    return close_btn_rect
+    if biz_index is None:
+        desc_text = f"Investor effectiveness ×{upg['multiplier']:.2f}"
+    else:
+        desc_text = f"{biz_name} profit ×{upg['multiplier']:.2f}"
+    desc_surf = text_cache.render(font_small, desc_text, GRAYED)
+    row.blit(desc_surf, (col2_x, 30))
+
+    cost_mant, cost_suff = format_number_parts(upg["cost"])
+    cost_color = ACCENT if can_buy else GRAYED
+    cost_surf = text_cache.render(font_small, f"${cost_mant}{cost_suff}", cost_color)
+    row.blit(cost_surf, (col2_x, 45))
+
+    buy_rect = pygame.Rect(col3_x, 15, 100, 30)
+    base_color = ACCENT if can_buy else PANEL_DARK
+    buy_color  = BTN_HOVER if hovered else base_color
+    pygame.draw.rect(row, buy_color, buy_rect, border_radius=6)
+
+    buy_txt = text_cache.render(font_small, "Buy!", WHITE)
+    row.blit(
+        buy_txt,
+        (buy_rect.x + (buy_rect.w - buy_txt.get_width()) // 2,
+         buy_rect.y + (buy_rect.h - buy_txt.get_height()) // 2)
+    )
 
 def draw_upgrades_ui(surface, mouse_pos, mouse_clicked):
-    global close_btn_rect, money, upgrade_scroll, upgrade_dragging, upgrade_drag_offset, prev_affordable_upgrades, game_state
+    global close_btn_rect, prev_affordable_upgrades, game_state
 
-    overlay_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay_surf.fill((30, 30, 40, 210))
-    surface.blit(overlay_surf, (0, 0))
+    surface.blit(surface_pool.filled((WIDTH, HEIGHT), (30, 30, 40, 210)), (0, 0))
 
     box_w = int(WIDTH * 0.6)
     box_h = int(HEIGHT * 0.7)
@@ -6211,14 +6161,14 @@ def draw_upgrades_ui(surface, mouse_pos, mouse_clicked):
     buyall_hovered = buyall_rect.collidepoint(mouse_pos)
     buyall_color = BTN_HOVER if buyall_hovered else ACCENT
     pygame.draw.rect(surface, buyall_color, buyall_rect, border_radius=6)
-    buyall_txt = font_small.render("Buy All", True, WHITE)
+    buyall_txt = text_cache.render(font_small, "Buy All", WHITE)
     surface.blit(
         buyall_txt,
         (buyall_rect.x + (buyall_rect.w - buyall_txt.get_width()) // 2,
          buyall_rect.y + (buyall_rect.h - buyall_txt.get_height()) // 2)
     )
 
-    title_surf = font_big.render("Purchase Upgrades", True, WHITE)
+    title_surf = text_cache.render(font_big, "Purchase Upgrades", WHITE)
     surface.blit(
         title_surf,
         (box_x + (box_w - title_surf.get_width()) // 2, box_y + 20 + buyall_rect.height + 10)
@@ -6229,7 +6179,7 @@ def draw_upgrades_ui(surface, mouse_pos, mouse_clicked):
     close_y    = box_y + 12
     close_btn_rect = pygame.Rect(close_x, close_y, close_size, close_size)
     pygame.draw.rect(surface, BTN_HOVER, close_btn_rect, border_radius=4)
-    x_surf = font_small.render("X", True, WHITE)
+    x_surf = text_cache.render(font_small, "X", WHITE)
     surface.blit(
         x_surf,
         (close_x + (close_size - x_surf.get_width()) // 2,
@@ -6239,158 +6189,71 @@ def draw_upgrades_ui(surface, mouse_pos, mouse_clicked):
     # As soon as we draw Upgrades UI, clear the notification
     current_affordable = set(
         i for i, upg in enumerate(upgrades)
-        if (not upg["purchased"]) and (money >= upg["cost"])
+        if (not upg["purchased"]) and (sim.money >= upg["cost"])
     )
     prev_affordable_upgrades = set(current_affordable)
 
     header_y = box_y + 20 + buyall_rect.height + 10 + 40
-    col1_x = box_x + 5
     col2_x = box_x + 60
     col3_x = box_x + box_w - 140
 
-    surface.blit(font_med.render("Upgrade", True, WHITE), (col2_x, header_y))
-    surface.blit(font_med.render("Cost", True, WHITE),    (col3_x, header_y))
+    surface.blit(text_cache.render(font_med, "Upgrade", WHITE), (col2_x, header_y))
+    surface.blit(text_cache.render(font_med, "Cost", WHITE),    (col3_x, header_y))
 
     scroll_top    = header_y + 40
     scroll_bottom = box_y + box_h - 20
     visible_h     = scroll_bottom - scroll_top
 
-    entry_h = 80
-    spacing = 10
+    entry_h = upgrade_list.row_h
 
     unpurchased_upgs = [u for u in upgrades if not u["purchased"]]
     sorted_upgs      = sorted(unpurchased_upgs, key=lambda u: u["cost"])
 
-    total_content_h = len(sorted_upgs) * (entry_h + spacing)
-    max_scroll      = max(0, total_content_h - visible_h)
-    upgrade_scroll  = max(0, min(upgrade_scroll, max_scroll))
-
     clip_rect = pygame.Rect(box_x + 10, scroll_top, box_w - 20, visible_h)
     surface.set_clip(clip_rect)
-    y_offset = scroll_top - upgrade_scroll
 
-    for upg in sorted_upgs:
+    for i in upgrade_list.layout(clip_rect, len(sorted_upgs)):
+        upg      = sorted_upgs[i]
+        y_offset = upgrade_list.row_y(i)
         if upg["purchased"]:
-            y_offset += entry_h + spacing
-            continue
-
-        if (y_offset + entry_h < scroll_top) or (y_offset > scroll_bottom):
-            y_offset += entry_h + spacing
             continue
 
         entry_rect = pygame.Rect(box_x + 10, y_offset, box_w - 20, entry_h)
-        pygame.draw.rect(surface, (50, 50, 70), entry_rect, border_radius=8)
-
-        biz_index = upg.get("biz_index")
-
-        icon_size = 60
-        icon_y = y_offset + (entry_h - icon_size) // 2
-
-        if biz_index is None:
-            biz_name = "All Businesses"
-            if upg.get("image"):
-                gimg_surf = pygame.transform.smoothscale(upg["image"], (icon_size, icon_size))
-                surface.blit(gimg_surf, (col1_x, icon_y))
-            else:
-                placeholder = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    placeholder,
-                    (150, 150, 150),
-                    (icon_size // 2, icon_size // 2),
-                    icon_size // 2
-                )
-                surface.blit(placeholder, (col1_x, icon_y))
-        else:
-            if not isinstance(biz_index, int) or not (0 <= biz_index < len(businesses)):
-                y_offset += entry_h + spacing
-                continue
-
-            biz      = businesses[biz_index]
-            biz_name = biz["name"]
-            if biz.get("image"):
-                small_img = pygame.transform.smoothscale(biz["image"], (icon_size, icon_size))
-                surface.blit(small_img, (col1_x, icon_y))
-            else:
-                icon_surf = font_big.render(biz["icon"], True, WHITE)
-                surface.blit(icon_surf, (col1_x, icon_y))
-
-        name_surf = font_med.render(upg["name"], True, YELLOW)
-        surface.blit(name_surf, (col2_x, y_offset + 8))
-
-        if biz_index is None:
-            desc_text = f"Investor effectiveness ×{upg['multiplier']:.2f}"
-        else:
-            desc_text = f"{biz_name} profit ×{upg['multiplier']:.2f}"
-        desc_surf = font_small.render(desc_text, True, GRAYED)
-        surface.blit(desc_surf, (col2_x, y_offset + 30))
+        biz_index  = upg.get("biz_index")
+        valid      = biz_index is None or (isinstance(biz_index, int) and 0 <= biz_index < len(businesses))
 
         cost_val = upg["cost"]
-        cost_mant, cost_suff = format_number_parts(cost_val)
-        can_buy  = (money >= cost_val)
-        cost_color = ACCENT if can_buy else GRAYED
-        cost_surf = font_small.render(f"${cost_mant}{cost_suff}", True, cost_color)
-        surface.blit(cost_surf, (col2_x, y_offset + 45))
-
+        can_buy  = (sim.money >= cost_val)
         buy_rect = pygame.Rect(col3_x, y_offset + 15, 100, 30)
-        base_color = ACCENT if can_buy else PANEL_DARK
-        buy_color  = BTN_HOVER if (buy_rect.collidepoint(mouse_pos) and can_buy) else base_color
-        pygame.draw.rect(surface, buy_color, buy_rect, border_radius=6)
-
-        buy_txt = font_small.render("Buy!", True, WHITE)
-        surface.blit(
-            buy_txt,
-            (buy_rect.x + (buy_rect.w - buy_txt.get_width()) // 2,
-             buy_rect.y + (buy_rect.h - buy_txt.get_height()) // 2)
-        )
+        hovered  = valid and can_buy and buy_rect.collidepoint(mouse_pos)
+
+        row_key = ("upgrade", upg["name"], biz_index, upg["multiplier"], cost_val,
+                   valid, can_buy, hovered, get_notation())
+        row = row_cache.get(row_key, entry_rect.size,
+                            lambda r: render_upgrade_row(r, upg, valid, can_buy, hovered))
+        surface.blit(row, entry_rect.topleft)
+        if not valid:
+            continue
 
-        if buy_rect.collidepoint(mouse_pos) and mouse_clicked and can_buy:
-            money -= cost_val
+        if hovered and mouse_clicked:
+            sim.money -= cost_val
             if biz_index is None:
                 # ← Instead of boosting every business’s profit directly, add to investor_effectiveness_mult:
-                game_state["investor_effectiveness_mult"] += upg["multiplier"]
+                sim.investor_effectiveness_mult += upg["multiplier"]
             else:
                 businesses[biz_index]["profit_mult"] *= upg["multiplier"]
+                sim.invalidate(biz_index)
             upg["purchased"] = True
 
             remaining    = [u2 for u2 in upgrades if not u2["purchased"]]
-            new_total_h  = len(remaining) * (entry_h + spacing)
+            new_total_h  = len(remaining) * upgrade_list.stride
             new_max_scroll = max(0, new_total_h - visible_h)
-            upgrade_scroll = min(upgrade_scroll + (entry_h + spacing), new_max_scroll)
-
-        y_offset += entry_h + spacing
+            upgrade_list.scroll = min(upgrade_list.scroll + upgrade_list.stride, new_max_scroll)
 
     surface.set_clip(None)
 
     # ─── Scrollbar drawing ───
-    if total_content_h > visible_h:
-        track_x = box_x + box_w - 12
-        track_y = scroll_top
-        track_w = 6
-        track_h = visible_h
-        pygame.draw.rect(surface, (60, 60, 80), (track_x, track_y, track_w, track_h), border_radius=3)
-
-        thumb_h = max(20, int((visible_h / total_content_h) * visible_h))
-        max_thumb_travel = visible_h - thumb_h
-        if max_scroll > 0:
-            thumb_y = scroll_top + int((upgrade_scroll / max_scroll) * max_thumb_travel)
-        else:
-            thumb_y = scroll_top
-
-        thumb_rect = pygame.Rect(track_x, thumb_y, track_w, thumb_h)
-        thumb_color = ACCENT if thumb_rect.collidepoint(mouse_pos) else BTN_HOVER
-        pygame.draw.rect(surface, thumb_color, thumb_rect, border_radius=3)
-
-        global upgrade_dragging, upgrade_drag_offset
-        if mouse_clicked and thumb_rect.collidepoint(mouse_pos):
-            upgrade_dragging   = True
-            upgrade_drag_offset = mouse_pos[1] - thumb_y
-
-        if upgrade_dragging and pygame.mouse.get_pressed()[0]:
-            new_y = mouse_pos[1] - upgrade_drag_offset
-            new_y = max(scroll_top, min(scroll_top + max_thumb_travel, new_y))
-            upgrade_scroll = int(((new_y - scroll_top) / max_thumb_travel) * max_scroll) if max_thumb_travel > 0 else 0
-        elif not pygame.mouse.get_pressed()[0]:
-            upgrade_dragging = False
+    upgrade_list.draw_scrollbar(surface, box_x + box_w - 12, mouse_pos, mouse_clicked, ACCENT, BTN_HOVER)
 
     # ─── “Buy All” logic: if clicked, attempt to buy every affordable upgrade ───
     if buyall_rect.collidepoint(mouse_pos) and mouse_clicked:
@@ -6401,13 +6264,14 @@ def draw_upgrades_ui(surface, mouse_pos, mouse_clicked):
                 if upg2["purchased"]:
                     continue
                 cost2 = upg2["cost"]
-                if money >= cost2:
-                    money -= cost2
+                if sim.money >= cost2:
+                    sim.money -= cost2
                     if upg2.get("biz_index") is None:
                         # ← Instead of looping over businesses here, add to investor_effectiveness_mult:
-                        game_state["investor_effectiveness_mult"] += upg2["multiplier"]
+                        sim.investor_effectiveness_mult += upg2["multiplier"]
                     else:
                         businesses[upg2["biz_index"]]["profit_mult"] *= upg2["multiplier"]
+                        sim.invalidate(upg2["biz_index"])
                     upg2["purchased"] = True
                     something_bought = True
                     break  # restart scanning from top
@@ -6415,12 +6279,55 @@ def draw_upgrades_ui(surface, mouse_pos, mouse_clicked):
 
     return close_btn_rect
 
+def render_unlock_row(row, u, is_unlocked):
+    """
+    Paint one Unlocks row onto 'row', a row-sized surface whose (0, 0) is the
+    row's top-left corner.
+    """
+    row_w, entry_h = row.get_size()
+    row.fill(PANEL_DARK)
+    pygame.draw.rect(row, (50, 50, 70), row.get_rect(), border_radius=8)
+
+    col1_x = -5
+    col2_x = 70
+    col3_x = row_w - 130
+
+    icon_size = 60
+    icon_y = (entry_h - icon_size) // 2
+
+    if u["biz_index"] is not None:
+        biz = businesses[u["biz_index"]]
+        if biz.get("image"):
+            row.blit(icon_cache.get(biz["image"], icon_size), (col1_x, icon_y))
+        else:
+            icon_surf = text_cache.render(font_big, biz["icon"], WHITE)
+            row.blit(icon_surf, (col1_x, icon_y))
+    else:
+        if u.get("image"):
+            row.blit(icon_cache.get(u["image"], icon_size), (col1_x, icon_y))
+        else:
+            globe_surf = text_cache.render(font_big, "🌐", WHITE)
+            row.blit(globe_surf, (col1_x, icon_y))
+
+    name_surf = text_cache.render(font_med, u["description"], YELLOW)
+    row.blit(name_surf, (col2_x, 8))
+
+    if u["biz_index"] is not None:
+        req_text = f"Own {u['threshold']} {businesses[u['biz_index']]['name']}"
+    else:
+        req_text = f"Own {u['threshold']} of every business"
+    req_surf = text_cache.render(font_small, req_text, GRAYED)
+    row.blit(req_surf, (col2_x, 30))
+
+    status_text = "Unlocked" if is_unlocked else "Locked"
+    status_color = ACCENT if is_unlocked else GRAYED
+    status_surf = text_cache.render(font_small, status_text, status_color)
+    row.blit(status_surf, (col3_x, 20))
+
 def draw_unlocks_ui(surface, mouse_pos, mouse_clicked):
-    global close_btn_rect, unlock_scroll, unlock_dragging, unlock_drag_offset
+    global close_btn_rect
 
-    overlay_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay_surf.fill((30, 30, 40, 210))
-    surface.blit(overlay_surf, (0, 0))
+    surface.blit(surface_pool.filled((WIDTH, HEIGHT), (30, 30, 40, 210)), (0, 0))
 
     box_w = int(WIDTH * 0.6)
     box_h = int(HEIGHT * 0.7)
@@ -6428,7 +6335,7 @@ def draw_unlocks_ui(surface, mouse_pos, mouse_clicked):
     box_y = (HEIGHT - box_h) // 2
     pygame.draw.rect(surface, PANEL_DARK, (box_x, box_y, box_w, box_h), border_radius=12)
 
-    title_surf = font_big.render("Unlocks", True, WHITE)
+    title_surf = text_cache.render(font_big, "Unlocks", WHITE)
     surface.blit(title_surf, (box_x + (box_w - title_surf.get_width()) // 2, box_y + 20))
 
     close_size = 24
@@ -6436,7 +6343,7 @@ def draw_unlocks_ui(surface, mouse_pos, mouse_clicked):
     close_y    = box_y + 12
     close_btn_rect = pygame.Rect(close_x, close_y, close_size, close_size)
     pygame.draw.rect(surface, BTN_HOVER, close_btn_rect, border_radius=4)
-    x_surf = font_small.render("X", True, WHITE)
+    x_surf = text_cache.render(font_small, "X", WHITE)
     surface.blit(
         x_surf,
         (close_x + (close_size - x_surf.get_width()) // 2,
@@ -6444,278 +6351,50 @@ def draw_unlocks_ui(surface, mouse_pos, mouse_clicked):
     )
 
     header_y = box_y + 60
-    col1_x = box_x + 5
     col2_x = box_x + 80
     col3_x = box_x + box_w - 140
 
-    surface.blit(font_med.render("Unlock / Global", True, WHITE), (col2_x, header_y))
-    surface.blit(font_med.render("Status", True, WHITE), (col3_x, header_y))
+    surface.blit(text_cache.render(font_med, "Unlock / Global", WHITE), (col2_x, header_y))
+    surface.blit(text_cache.render(font_med, "Status", WHITE), (col3_x, header_y))
 
     scroll_top    = header_y + 40
     scroll_bottom = box_y + box_h - 20
     visible_h     = scroll_bottom - scroll_top
 
-    entry_h = 60
-    spacing = 10
-
-    total_content_h = len(unlocks) * (entry_h + spacing)
-    max_scroll  = max(0, total_content_h - visible_h)
-    unlock_scroll = max(0, min(unlock_scroll, max_scroll))
+    entry_h = unlock_list.row_h
 
     clip_rect = pygame.Rect(box_x + 10, scroll_top, box_w - 20, visible_h)
     surface.set_clip(clip_rect)
 
-    y_offset = scroll_top - unlock_scroll
+    # Only the rows on screen are evaluated; the rest of the ~630 are never touched
+    for idx in unlock_list.layout(clip_rect, len(unlocks)):
+        u        = unlocks[idx]
+        y_offset = unlock_list.row_y(idx)
 
-    for idx, u in enumerate(unlocks):
         if u["biz_index"] is not None:
             b = businesses[u["biz_index"]]
             is_unlocked = (b["owned"] >= u["threshold"])
         else:
             is_unlocked = all(bz["owned"] >= u["threshold"] for bz in businesses)
 
-        if y_offset + entry_h < scroll_top or y_offset > scroll_bottom:
-            y_offset += entry_h + spacing
-            continue
-
         entry_rect = pygame.Rect(box_x + 10, y_offset, box_w - 20, entry_h)
-        pygame.draw.rect(surface, (50, 50, 70), entry_rect, border_radius=8)
-
-        icon_size = 60
-        icon_y = y_offset + (entry_h - icon_size) // 2
-
-        if u["biz_index"] is not None:
-            biz = businesses[u["biz_index"]]
-            if biz.get("image"):
-                icon_img = pygame.transform.smoothscale(biz["image"], (icon_size, icon_size))
-                surface.blit(icon_img, (col1_x, icon_y))
-            else:
-                icon_surf = font_big.render(biz["icon"], True, WHITE)
-                surface.blit(icon_surf, (col1_x, icon_y))
-        else:
-            if u.get("image"):
-                gimg_surf = pygame.transform.smoothscale(u["image"], (icon_size, icon_size))
-                surface.blit(gimg_surf, (col1_x, icon_y))
-            else:
-                globe_surf = font_big.render("🌐", True, WHITE)
-                surface.blit(globe_surf, (col1_x, icon_y))
-
-        name_surf = font_med.render(u["description"], True, YELLOW)
-        surface.blit(name_surf, (col2_x, y_offset + 8))
-
-        if u["biz_index"] is not None:
-            req_text = f"Own {u['threshold']} {businesses[u['biz_index']]['name']}"
-        else:
-            req_text = f"Own {u['threshold']} of every business"
-        req_surf = font_small.render(req_text, True, GRAYED)
-        surface.blit(req_surf, (col2_x, y_offset + 30))
-
-        status_text = "Unlocked" if is_unlocked else "Locked"
-        status_color = ACCENT if is_unlocked else GRAYED
-        status_surf = font_small.render(status_text, True, status_color)
-        surface.blit(status_surf, (col3_x, y_offset + 20))
-
-        y_offset += entry_h + spacing
+        row = row_cache.get(("unlock", idx, is_unlocked), entry_rect.size,
+                            lambda r: render_unlock_row(r, u, is_unlocked))
+        surface.blit(row, entry_rect.topleft)
 
     surface.set_clip(None)
 
-    if total_content_h > visible_h:
-        track_x = box_x + box_w - 12
-        track_y = scroll_top
-        track_w = 6
-        track_h = visible_h
-        pygame.draw.rect(surface, (60, 60, 80), (track_x, track_y, track_w, track_h), border_radius=3)
-
-        thumb_h = max(20, int((visible_h / total_content_h) * visible_h))
-        max_thumb_travel = visible_h - thumb_h
-        if max_scroll > 0:
-            thumb_y = scroll_top + int((unlock_scroll / max_scroll) * max_thumb_travel)
-        else:
-            thumb_y = scroll_top
-
-        thumb_rect = pygame.Rect(track_x, thumb_y, track_w, thumb_h)
-        thumb_color = ACCENT if thumb_rect.collidepoint(mouse_pos) else BTN_HOVER
-        pygame.draw.rect(surface, thumb_color, thumb_rect, border_radius=3)
-
-        global unlock_dragging, unlock_drag_offset
-        if mouse_clicked and thumb_rect.collidepoint(mouse_pos):
-            unlock_dragging = True
-            unlock_drag_offset = mouse_pos[1] - thumb_y
-
-        if unlock_dragging and pygame.mouse.get_pressed()[0]:
-            new_y = mouse_pos[1] - unlock_drag_offset
-            new_y = max(scroll_top, min(scroll_top + max_thumb_travel, new_y))
-            unlock_scroll = int(((new_y - scroll_top) / max_thumb_travel) * max_scroll) if max_thumb_travel > 0 else 0
-        elif not pygame.mouse.get_pressed()[0]:
-            unlock_dragging = False
+    unlock_list.draw_scrollbar(surface, box_x + box_w - 12, mouse_pos, mouse_clicked, ACCENT, BTN_HOVER)
 
     return close_btn_rect
 
 def draw_investors_ui(surface, mouse_pos, mouse_clicked):
-    global close_btn_rect, show_investor_shop, galactic_investors_total, galactic_investors_spent
-    global investor_shop_scroll, global_speed_mult, global_profit_mult
-    global money, space_lifetime_earnings, businesses, upgrades, unlocked_shown, session_start_time, playtime_this_prestige
-    invest_yes_rect = None
-    invest_no_rect  = None
-
-    overlay_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay_surf.fill((30, 30, 40, 210))
-    surface.blit(overlay_surf, (0, 0))
-
-    box_w = int(WIDTH * 0.6)
-    box_h = int(HEIGHT * 0.7)
-    box_x = (WIDTH - box_w) // 2
-    box_y = (HEIGHT - box_h) // 2
-    pygame.draw.rect(surface, PANEL_DARK, (box_x, box_y, box_w, box_h), border_radius=12)
-
-    close_size = 24
-    if not show_investor_shop:
-        # ─── Main "Galactic Investors" view ───
-        close_x = box_x + box_w - close_size - 12
-        close_y = box_y + 12
-        close_btn_rect = pygame.Rect(close_x, close_y, close_size, close_size)
-        pygame.draw.rect(surface, BTN_HOVER, close_btn_rect, border_radius=4)
-        x_surf = font_small.render("X", True, WHITE)
-        surface.blit(
-            x_surf,
-            (close_x + (close_size - x_surf.get_width()) // 2,
-             close_y + (close_size - x_surf.get_height()) // 2)
-        )
-
-        title_surf = font_big.render("Galactic Investors", True, WHITE)
-        surface.blit(title_surf, (box_x + (box_w - title_surf.get_width()) // 2, box_y + 20))
-
-        tagline = "Putting the ‘Galaxy’ back in ‘Galactic profits’!"
-        tag_surf = font_small.render(tagline, True, GRAYED)
-        surface.blit(tag_surf, (box_x + (box_w - tag_surf.get_width()) // 2, box_y + 60))
-
-        info_y = box_y + 100
-        line_spacing = 30
-
-        # Total GIs
-        gis_text = font_med.render(f"Total GIs: {galactic_investors_total}", True, WHITE)
-        surface.blit(gis_text, (box_x + 40, info_y))
-
-        
-        # ─── Bonus per GI (use current value from game_state, two‐decimal format)
-        per_investor_bonus = 0.02 + game_state.get("investor_effectiveness_mult", 0.0)
-        # multiply by 100 to show as “%” and force two decimals
-        bonus_str = f"Bonus per Galactic Investor: {per_investor_bonus * 100:.2f}%"
-        bonus_surf = font_med.render(bonus_str, True, WHITE)
-        surface.blit(bonus_surf, (box_x + 40, info_y + line_spacing))
-
-        # GIs Spent
-        spent_text = font_med.render(f"Galactic Investors Spent: {galactic_investors_spent}", True, WHITE)
-        surface.blit(spent_text, (box_x + 40, info_y + 2 * line_spacing))
-
-        # ─── Lifetime Earnings: format with format_number_parts ───
-        mantissa, suffix = format_number_parts(int(space_lifetime_earnings))
-        lte_text = font_med.render(f"Lifetime Earnings: {mantissa}{suffix}", True, WHITE)
-        surface.blit(lte_text, (box_x + 40, info_y + 3 * line_spacing))
-
-        # Calculate how many new GIs are available to collect
-        # Use space_lifetime_earnings directly instead of undefined lf_q
-        lf_q_value = space_lifetime_earnings / 1e15
-        potential = int(150 * math.sqrt(lf_q_value)) if lf_q_value > 0 else 0
-        new_gis = max(0, potential - galactic_investors_spent)
-
-        # ─── Draw “Available Galactic Investors to collect: <new_gis>” text ───
-        avail_text = f"Available Galactic Investors to collect: {new_gis}"
-        avail_surf = font_med.render(avail_text, True, WHITE)
-        surface.blit(avail_surf, (box_x + 40, box_y + box_h - 200))
-
-        # ─── “Invest” button ───
-        invest_btn_rect = pygame.Rect(box_x + 40, box_y + box_h - 160, box_w - 80, 40)
-        if new_gis > 0:
-            invest_color = ACCENT if not invest_btn_rect.collidepoint(mouse_pos) else BTN_HOVER
-        else:
-            invest_color = PANEL_DARK
-        pygame.draw.rect(surface, invest_color, invest_btn_rect, border_radius=6)
-        invest_surf = font_small.render("Invest", True, WHITE)
-        surface.blit(
-            invest_surf,
-            (invest_btn_rect.x + (invest_btn_rect.w - invest_surf.get_width()) // 2,
-             invest_btn_rect.y + (invest_btn_rect.h - invest_surf.get_height()) // 2)
-        )
-        if invest_btn_rect.collidepoint(mouse_pos) and mouse_clicked and new_gis > 0:
-            # Collect all available GIs
-            collect_amt = new_gis
-            galactic_investors_total += collect_amt
-            galactic_investors_spent += collect_amt
-
-            # Reset everything except GIs and investor unlocks
-            money = 0.0
-            space_lifetime_earnings = 0.0
-            for biz in businesses:
-                biz["owned"] = 0
-                biz["speed_mult"] = 1.0
-                biz["profit_mult"] = 1.0
-                biz["unlocked"] = False
-                biz["has_manager"] = False
-                biz["in_progress"] = False
-                biz["timer"] = 0.0
-            businesses[0]["unlocked"] = True
-            businesses[0]["owned"]   = 1
-
-            for upg in upgrades:
-                upg["purchased"] = False
-            unlocked_shown.clear()
-
-            # Reset cycle timers
-            global cycle_start_time, cycle_start_money, playtime_this_prestige
-            cycle_start_time = time.time()
-            cycle_start_money = money
-            playtime_this_prestige = 0.0
-
-        # ─── “Investor Shop” button ───
-        shop_btn_rect = pygame.Rect(box_x + 40, box_y + box_h - 100, box_w - 80, 40)
-        shop_color = ACCENT if not shop_btn_rect.collidepoint(mouse_pos) else BTN_HOVER
-        pygame.draw.rect(surface, shop_color, shop_btn_rect, border_radius=6)
-        shop_surf = font_small.render("Investor Shop", True, WHITE)
-        surface.blit(
-            shop_surf,
-            (shop_btn_rect.x + (shop_btn_rect.w - shop_surf.get_width()) // 2,
-             shop_btn_rect.y + (shop_btn_rect.h - shop_surf.get_height()) // 2)
-        )
-        if shop_btn_rect.collidepoint(mouse_pos) and mouse_clicked:
-            show_investor_shop = True
-
-        return close_btn_rect
-
-    else:
-        # ─── Investor Shop sub‐view ───
-        title_surf = font_big.render("GALACTIC INVESTOR SHOP", True, WHITE)
-        surface.blit(title_surf, (box_x + (box_w - title_surf.get_width()) // 2, box_y + 20))
-
-        # Draw “X” close button instead of back arrow
-        close_x = box_x + box_w - close_size - 12
-        close_y = box_y + 12
-        close_btn_rect = pygame.Rect(close_x, close_y, close_size, close_size)
-        pygame.draw.rect(surface, BTN_HOVER, close_btn_rect, border_radius=4)
-        x_surf = font_small.render("X", True, WHITE)
-        surface.blit(
-            x_surf,
-            (close_x + (close_size - x_surf.get_width()) // 2,
-             close_y + (close_size - x_surf.get_height()) // 2)
-        )
-        if close_btn_rect.collidepoint(mouse_pos) and mouse_clicked:
-            show_investor_shop = False
-
-        draw_investor_shop_list(surface, mouse_pos, mouse_clicked)
-        return close_btn_rect
-
-
-
-def draw_investors_ui(surface, mouse_pos, mouse_clicked):
-    global close_btn_rect, show_investor_shop, galactic_investors_total, galactic_investors_spent
-    global investor_shop_scroll, global_speed_mult, global_profit_mult
-    global money, space_lifetime_earnings, businesses, upgrades, unlocked_shown, session_start_time, playtime_this_prestige
+    global close_btn_rect, show_investor_shop, galactic_investors_spent
+    global businesses, upgrades, unlocked_shown, session_start_time, playtime_this_prestige
     global game_state
-    global confirm_invest_popup, invest_yes_rect, invest_no_rect   
+    global confirm_invest_popup, invest_yes_rect, invest_no_rect
 
-    overlay_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay_surf.fill((30, 30, 40, 210))
-    surface.blit(overlay_surf, (0, 0))
+    surface.blit(surface_pool.filled((WIDTH, HEIGHT), (30, 30, 40, 210)), (0, 0))
 
     box_w = int(WIDTH * 0.6)
     box_h = int(HEIGHT * 0.7)
@@ -6731,7 +6410,7 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
         close_y = box_y + 12
         close_btn_rect = pygame.Rect(close_x, close_y, close_size, close_size)
         pygame.draw.rect(surface, BTN_HOVER, close_btn_rect, border_radius=4)
-        x_surf = font_small.render("X", True, WHITE)
+        x_surf = text_cache.render(font_small, "X", WHITE)
         surface.blit(
             x_surf,
             (
@@ -6740,14 +6419,14 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
             )
         )
 
-        title_surf = font_big.render("Galactic Investors", True, WHITE)
+        title_surf = text_cache.render(font_big, "Galactic Investors", WHITE)
         surface.blit(
             title_surf,
             (box_x + (box_w - title_surf.get_width()) // 2, box_y + 20)
         )
 
         tagline = "Putting the ‘Galaxy’ back in ‘Galactic profits’!"
-        tag_surf = font_small.render(tagline, True, GRAYED)
+        tag_surf = text_cache.render(font_small, tagline, GRAYED)
         surface.blit(
             tag_surf,
             (box_x + (box_w - tag_surf.get_width()) // 2, box_y + 60)
@@ -6757,35 +6436,35 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
         line_spacing = 30
 
         # Total GIs (formatted)
-        mant_gi, suff_gi = format_number_parts(int(galactic_investors_total))
-        gis_text = font_med.render(f"Total GIs: {mant_gi}{suff_gi}", True, WHITE)
+        mant_gi, suff_gi = format_number_parts(int(sim.galactic_investors_total))
+        gis_text = text_cache.render(font_med, f"Total GIs: {mant_gi}{suff_gi}", WHITE)
         surface.blit(gis_text, (box_x + 40, info_y))
 
         # Bonus per GI (two decimals)
-        per_investor_bonus = 0.02 + game_state.get("investor_effectiveness_mult", 0.0)
+        per_investor_bonus = sim.per_investor_bonus()
         bonus_str = f"Bonus per Galactic Investor: {per_investor_bonus * 100:.2f}%"
-        bonus_surf = font_med.render(bonus_str, True, WHITE)
+        bonus_surf = text_cache.render(font_med, bonus_str, WHITE)
         surface.blit(bonus_surf, (box_x + 40, info_y + line_spacing))
 
         # GIs Spent (formatted)
         mant_spent, suff_spent = format_number_parts(int(galactic_investors_spent))
-        spent_text = font_med.render(f"Galactic Investors Spent: {mant_spent}{suff_spent}", True, WHITE)
+        spent_text = text_cache.render(font_med, f"Galactic Investors Spent: {mant_spent}{suff_spent}", WHITE)
         surface.blit(spent_text, (box_x + 40, info_y + 2 * line_spacing))
 
         # Lifetime Earnings (already formatted)
-        mantissa, suffix = format_number_parts(int(space_lifetime_earnings))
-        lte_text = font_med.render(f"Lifetime Earnings: {mantissa}{suffix}", True, WHITE)
+        mantissa, suffix = format_number_parts(sim.space_lifetime_earnings.floor())
+        lte_text = text_cache.render(font_med, f"Lifetime Earnings: {mantissa}{suffix}", WHITE)
         surface.blit(lte_text, (box_x + 40, info_y + 3 * line_spacing))
 
         # Calculate how many new GIs are available to collect
-        lf_q_value = space_lifetime_earnings / 1e15
-        potential = int(150 * math.sqrt(lf_q_value)) if lf_q_value > 0 else 0
+        lf_q_value = sim.space_lifetime_earnings / 1e15
+        potential = int(lf_q_value.sqrt() * 150) if lf_q_value > 0 else 0
         new_gis = max(0, potential - galactic_investors_spent)
 
         # Available GIs to collect (formatted)
         mant_new, suff_new = format_number_parts(int(new_gis))
         avail_text = f"Available Galactic Investors to collect: {mant_new}{suff_new}"
-        avail_surf = font_med.render(avail_text, True, WHITE)
+        avail_surf = text_cache.render(font_med, avail_text, WHITE)
         surface.blit(avail_surf, (box_x + 40, box_y + box_h - 200))
 
         # ─── Invest button (shows confirmation, does NOT auto‐reset) ───
@@ -6795,7 +6474,7 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
         else:
             invest_color = PANEL_DARK
         pygame.draw.rect(surface, invest_color, invest_btn_rect, border_radius=6)
-        invest_surf = font_small.render("Invest", True, WHITE)
+        invest_surf = text_cache.render(font_small, "Invest", WHITE)
         surface.blit(
             invest_surf,
             (
@@ -6811,9 +6490,7 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
         # ─── If confirmation is active, draw yes/no popup on top ───
         if confirm_invest_popup:
             # Darken background further
-            popup_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            popup_overlay.fill((0, 0, 0, 180))
-            surface.blit(popup_overlay, (0, 0))
+            surface.blit(surface_pool.filled((WIDTH, HEIGHT), (0, 0, 0, 180)), (0, 0))
 
             # Popup box dimensions
             pw = int(box_w * 0.8)
@@ -6832,7 +6509,7 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
             ]
             ty = py + 20
             for line in confirm_lines:
-                line_surf = font_small.render(line, True, WHITE)
+                line_surf = text_cache.render(font_small, line, WHITE)
                 surface.blit(
                     line_surf,
                     (px + (pw - line_surf.get_width()) // 2, ty)
@@ -6846,7 +6523,7 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
             invest_yes_rect = pygame.Rect(yes_x, yes_y, yes_w, yes_h)
             yes_color = ACCENT if not invest_yes_rect.collidepoint(mouse_pos) else BTN_HOVER
             pygame.draw.rect(surface, yes_color, invest_yes_rect, border_radius=6)
-            yes_txt = font_med.render("YES", True, WHITE)
+            yes_txt = text_cache.render(font_med, "YES", WHITE)
             surface.blit(
                 yes_txt,
                 (
@@ -6862,7 +6539,7 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
             invest_no_rect = pygame.Rect(no_x, no_y, no_w, no_h)
             no_color = ACCENT if not invest_no_rect.collidepoint(mouse_pos) else BTN_HOVER
             pygame.draw.rect(surface, no_color, invest_no_rect, border_radius=6)
-            no_txt = font_med.render("NO", True, WHITE)
+            no_txt = text_cache.render(font_med, "NO", WHITE)
             surface.blit(
                 no_txt,
                 (
@@ -6875,31 +6552,32 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
             if invest_yes_rect.collidepoint(mouse_pos) and mouse_clicked:
                 # User confirmed “YES” → perform the actual invest/reset logic:
                 collect_amt = new_gis
-                galactic_investors_total += collect_amt
+                sim.galactic_investors_total += collect_amt
                 galactic_investors_spent += collect_amt
 
                 # Reset all businesses, upgrades, unlocks, managers
-                money = 0.0
-                space_lifetime_earnings = 0.0
+                sim.money = 0.0
+                sim.space_lifetime_earnings = 0.0
                 for biz in businesses:
                     biz["owned"] = 0
                     biz["speed_mult"] = 1.0
                     biz["profit_mult"] = 1.0
                     biz["unlocked"] = False
                     biz["has_manager"] = False
-                    biz["in_progress"] = False
-                    biz["timer"] = 0.0
+                    sim.stop_production(biz["index"])
                 businesses[0]["unlocked"] = True
                 businesses[0]["owned"]   = 1
+                sim.invalidate()
 
                 for upg in upgrades:
                     upg["purchased"] = False
                 unlocked_shown.clear()
+                unlock_index.reset()
 
                 # Reset cycle timers
                 global cycle_start_time, cycle_start_money, playtime_this_prestige
                 cycle_start_time = time.time()
-                cycle_start_money = money
+                cycle_start_money = sim.money
                 playtime_this_prestige = 0.0
 
                 confirm_invest_popup = False   # close the popup
@@ -6912,7 +6590,7 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
         shop_btn_rect = pygame.Rect(box_x + 40, box_y + box_h - 100, box_w - 80, 40)
         shop_color = ACCENT if not shop_btn_rect.collidepoint(mouse_pos) else BTN_HOVER
         pygame.draw.rect(surface, shop_color, shop_btn_rect, border_radius=6)
-        shop_surf = font_small.render("Investor Shop", True, WHITE)
+        shop_surf = text_cache.render(font_small, "Investor Shop", WHITE)
         surface.blit(
             shop_surf,
             (
@@ -6927,7 +6605,7 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
 
     else:
         # ─── Investor Shop sub‐view ───
-        title_surf = font_big.render("GALACTIC INVESTOR SHOP", True, WHITE)
+        title_surf = text_cache.render(font_big, "GALACTIC INVESTOR SHOP", WHITE)
         surface.blit(
             title_surf,
             (box_x + (box_w - title_surf.get_width()) // 2, box_y + 20)
@@ -6938,7 +6616,7 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
         close_y = box_y + 12
         close_btn_rect = pygame.Rect(close_x, close_y, close_size, close_size)
         pygame.draw.rect(surface, BTN_HOVER, close_btn_rect, border_radius=4)
-        x_surf = font_small.render("X", True, WHITE)
+        x_surf = text_cache.render(font_small, "X", WHITE)
         surface.blit(
             x_surf,
             (
@@ -6952,10 +6630,67 @@ def draw_investors_ui(surface, mouse_pos, mouse_clicked):
         draw_investor_shop_list(surface, mouse_pos, mouse_clicked)
         return close_btn_rect
     
+def render_investor_shop_row(row, upgrade, can_buy, hovered):
+    """
+    Paint one Investor Shop row onto 'row', a row-sized surface whose (0, 0)
+    is the row's top-left corner.
+    """
+    row_w, entry_h = row.get_size()
+    row.fill(PANEL_DARK)
+    pygame.draw.rect(row, (50, 50, 70), row.get_rect(), border_radius=8)
+
+    col1_x = 10                       # where the icon goes
+    col2_x = 70                       # text column
+    col3_x = row_w - 130              # “Buy” button right‐edge
+
+    # ───── ICON ─────
+    icon_y = (entry_h - INVESTOR_ICON_SIZE) // 2
+    img = assets.icon(upgrade["icon_image"], INVESTOR_ICON_SIZE)
+    if img is not None:
+        row.blit(img, (col1_x, icon_y))
+    else:
+        # Fallback: draw a grey circle if asset not found
+        pygame.draw.circle(
+            row,
+            (150, 150, 150),
+            (col1_x + INVESTOR_ICON_SIZE // 2, icon_y + INVESTOR_ICON_SIZE // 2),
+            INVESTOR_ICON_SIZE // 2
+        )
+
+    # ───── NAME & DESCRIPTION ─────
+    name_surf = text_cache.render(font_med, upgrade.get("name", ""), YELLOW)
+    row.blit(name_surf, (col2_x, 8))
+
+    desc_surf = text_cache.render(font_small, upgrade.get("description", ""), GRAYED)
+    row.blit(desc_surf, (col2_x, 30))
+
+    # ───── PRICE BELOW DESCRIPTION (formatted) ─────
+    mant, suff = format_number_parts(upgrade.get("cost", 0))
+    price_surf = text_cache.render(font_small, f"${mant}{suff}", ACCENT)
+    row.blit(price_surf, (col2_x, 50))
+
+    # ───── “Buy” button ─────
+    buy_label = text_cache.render(font_small, "Buy", WHITE)
+    btn_w = 100
+    btn_h = 30
+    buy_rect = pygame.Rect(col3_x, (entry_h // 2) - (btn_h // 2), btn_w, btn_h)
+
+    if can_buy:
+        btn_color = BTN_HOVER if hovered else ACCENT
+    else:
+        btn_color = PANEL_DARK
+
+    pygame.draw.rect(row, btn_color, buy_rect, border_radius=6)
+    row.blit(
+        buy_label,
+        (
+            buy_rect.x + (btn_w - buy_label.get_width()) // 2,
+            buy_rect.y + (btn_h - buy_label.get_height()) // 2
+        )
+    )
+
 def draw_investor_shop_list(surface, mouse_pos, mouse_clicked):
-    global investor_shop_scroll, galactic_investors_total, galactic_investors_spent
-    global global_speed_mult, global_profit_mult
-    global investor_shop_dragging, investor_shop_drag_offset
+    global galactic_investors_spent
     global game_state   # ← MAKE SURE THIS IS PRESENT
 
     box_w = int(WIDTH * 0.6)
@@ -6975,94 +6710,36 @@ def draw_investor_shop_list(surface, mouse_pos, mouse_clicked):
     list_top    = line_y + 20
     list_bottom = box_y + box_h - 20
     visible_h   = list_bottom - list_top
-    entry_h = max(INVESTOR_ICON_SIZE + ENTRY_PADDING, 60)
-    spacing     = 12
+    entry_h = investor_shop_list.row_h
 
     # Clip to the scrolling region
     clip_rect = pygame.Rect(box_x + 10, list_top, box_w - 20, visible_h)
     surface.set_clip(clip_rect)
 
     unpurchased = [g for g in galactic_upgrades if not g.get("purchased", False)]
-    total_h     = len(unpurchased) * (entry_h + spacing)
-    max_scroll  = max(0, total_h - visible_h)
-    investor_shop_scroll = max(0, min(investor_shop_scroll, max_scroll))
 
-    y_offset = list_top - investor_shop_scroll
-    col1_x = box_x + 20               # where the icon goes
-    col2_x = box_x + 80               # text column
     col3_x = box_x + box_w - 140      # “Buy” button right‐edge
 
-    for upgrade in unpurchased:
-        # If this entry is off‐screen, skip
-        if (y_offset + entry_h < list_top) or (y_offset > list_bottom):
-            y_offset += entry_h + spacing
-            continue
+    for i in investor_shop_list.layout(clip_rect, len(unpurchased)):
+        upgrade  = unpurchased[i]
+        y_offset = investor_shop_list.row_y(i)
 
         entry_rect = pygame.Rect(box_x + 10, y_offset, box_w - 20, entry_h)
-        pygame.draw.rect(surface, (50, 50, 70), entry_rect, border_radius=8)
-
-        # ───── ICON ─────
-        try:
-            img = pygame.image.load(resource_path(upgrade["icon_image"])).convert_alpha()
-            img = pygame.transform.smoothscale(img, (INVESTOR_ICON_SIZE, INVESTOR_ICON_SIZE))
-            surface.blit(
-                img,
-                (col1_x, y_offset + (entry_h - INVESTOR_ICON_SIZE) // 2)
-            )
-        except Exception:
-            # Fallback: draw a grey circle if asset not found
-            placeholder = pygame.Surface((INVESTOR_ICON_SIZE, INVESTOR_ICON_SIZE), pygame.SRCALPHA)
-            pygame.draw.circle(
-                placeholder,
-                (150, 150, 150),
-                (INVESTOR_ICON_SIZE // 2, INVESTOR_ICON_SIZE // 2),
-                INVESTOR_ICON_SIZE // 2
-            )
-            surface.blit(
-                placeholder,
-                (col1_x, y_offset + (entry_h - INVESTOR_ICON_SIZE) // 2)
-            )
-
-        # ───── NAME & DESCRIPTION ─────
-        name_surf = font_med.render(upgrade.get("name", ""), True, YELLOW)
-        surface.blit(name_surf, (col2_x, y_offset + 8))
-
-        desc_surf = font_small.render(upgrade.get("description", ""), True, GRAYED)
-        surface.blit(desc_surf, (col2_x, y_offset + 30))
 
-        # ───── PRICE BELOW DESCRIPTION (formatted) ─────
         cost_val = upgrade.get("cost", 0)
-        mant, suff = format_number_parts(cost_val)
-        price_text = f"${mant}{suff}"
-        price_surf = font_small.render(price_text, True, ACCENT)
-        surface.blit(price_surf, (col2_x, y_offset + 50))
-
-        # ───── “Buy” button ─────
-        can_buy = (galactic_investors_total >= cost_val)
-        buy_label = font_small.render("Buy", True, WHITE)
-        btn_w = 100
-        btn_h = 30
-        buy_rect = pygame.Rect(col3_x, y_offset + (entry_h // 2) - (btn_h // 2), btn_w, btn_h)
+        can_buy  = (sim.galactic_investors_total >= cost_val)
+        btn_h    = 30
+        buy_rect = pygame.Rect(col3_x, y_offset + (entry_h // 2) - (btn_h // 2), 100, btn_h)
+        hovered  = can_buy and buy_rect.collidepoint(mouse_pos)
 
-        if can_buy:
-            base_color = ACCENT
-            btn_color  = BTN_HOVER if buy_rect.collidepoint(mouse_pos) else ACCENT
-        else:
-            base_color = PANEL_DARK
-            btn_color  = PANEL_DARK
-
-        pygame.draw.rect(surface, btn_color, buy_rect, border_radius=6)
-        surface.blit(
-            buy_label,
-            (
-                buy_rect.x + (btn_w - buy_label.get_width()) // 2,
-                buy_rect.y + (btn_h - buy_label.get_height()) // 2
-            )
-        )
+        row_key = ("shop", upgrade.get("name", ""), cost_val, can_buy, hovered, get_notation())
+        row = row_cache.get(row_key, entry_rect.size,
+                            lambda r: render_investor_shop_row(r, upgrade, can_buy, hovered))
+        surface.blit(row, entry_rect.topleft)
 
         # ───── HANDLE CLICK ─────
-        if buy_rect.collidepoint(mouse_pos) and mouse_clicked and can_buy:
-            galactic_investors_total -= cost_val
+        if hovered and mouse_clicked:
+            sim.galactic_investors_total -= cost_val
             upgrade["purchased"] = True
 
             upg_type = upgrade.get("type")
@@ -7071,98 +6748,23 @@ def draw_investor_shop_list(surface, mouse_pos, mouse_clicked):
             if upg_type == "profit":
                 if biz_idx is not None:
                     businesses[biz_idx]["profit_mult"] *= upgrade.get("multiplier", 1.0)
+                    sim.invalidate(biz_idx)
 
             elif upg_type == "global_profit":
                 # ← NEW: increment investor_effectiveness_mult instead of looping businesses
-                game_state["investor_effectiveness_mult"] += upgrade.get("multiplier", 1.0)
+                sim.investor_effectiveness_mult += upgrade.get("multiplier", 1.0)
 
             elif upg_type == "add_units":
                 amount = upgrade.get("amount", 0)
                 if biz_idx is not None and amount > 0:
                     businesses[biz_idx]["owned"] += amount
-
-        y_offset += entry_h + spacing
-
-    surface.set_clip(None)
-
-    # ─── Vertical scrollbar (unchanged) ───
-    if total_h > visible_h:
-        track_x = box_x + box_w - 12
-        track_y = list_top
-        track_w = 6
-        track_h = visible_h
-        pygame.draw.rect(
-            surface,
-            (60, 60, 80),
-            (track_x, track_y, track_w, track_h),
-            border_radius=3
-        )
-
-        thumb_h = max(20, int((visible_h / total_h) * visible_h))
-        max_thumb_travel = visible_h - thumb_h
-        if max_scroll > 0:
-            thumb_y = list_top + int((investor_shop_scroll / max_scroll) * max_thumb_travel)
-        else:
-            thumb_y = list_top
-
-        thumb_rect = pygame.Rect(track_x, thumb_y, track_w, thumb_h)
-        thumb_color = ACCENT if thumb_rect.collidepoint(mouse_pos) else BTN_HOVER
-        pygame.draw.rect(surface, thumb_color, thumb_rect, border_radius=3)
-
-        if mouse_clicked and thumb_rect.collidepoint(mouse_pos):
-            investor_shop_dragging = True
-            investor_shop_drag_offset = mouse_pos[1] - thumb_y
-
-        if 'investor_shop_dragging' in globals() and investor_shop_dragging and pygame.mouse.get_pressed()[0]:
-            new_y = mouse_pos[1] - investor_shop_drag_offset
-            new_y = max(list_top, min(list_top + max_thumb_travel, new_y))
-            investor_shop_scroll = int(((new_y - list_top) / max_thumb_travel) * max_scroll) \
-                                  if max_thumb_travel > 0 else 0
-        elif not pygame.mouse.get_pressed()[0]:
-            investor_shop_dragging = False
-
-
-        y_offset += entry_h + spacing
+                    sim.invalidate(biz_idx)
+                    unlock_index.notify(biz_idx)
 
     surface.set_clip(None)
 
     # ─── Vertical scrollbar ───
-    if total_h > visible_h:
-        track_x = box_x + box_w - 12
-        track_y = list_top
-        track_w = 6
-        track_h = visible_h
-        pygame.draw.rect(
-            surface,
-            (60, 60, 80),
-            (track_x, track_y, track_w, track_h),
-            border_radius=3
-        )
-
-        thumb_h = max(20, int((visible_h / total_h) * visible_h))
-        max_thumb_travel = visible_h - thumb_h
-        if max_scroll > 0:
-            thumb_y = list_top + int((investor_shop_scroll / max_scroll) * max_thumb_travel)
-        else:
-            thumb_y = list_top
-
-        thumb_rect = pygame.Rect(track_x, thumb_y, track_w, thumb_h)
-        thumb_color = ACCENT if thumb_rect.collidepoint(mouse_pos) else BTN_HOVER
-        pygame.draw.rect(surface, thumb_color, thumb_rect, border_radius=3)
-
-        if mouse_clicked and thumb_rect.collidepoint(mouse_pos):
-            investor_shop_dragging = True
-            investor_shop_drag_offset = mouse_pos[1] - thumb_y
-
-        if 'investor_shop_dragging' in globals() and investor_shop_dragging and pygame.mouse.get_pressed()[0]:
-            new_y = mouse_pos[1] - investor_shop_drag_offset
-            new_y = max(list_top, min(list_top + max_thumb_travel, new_y))
-            investor_shop_scroll = int(((new_y - list_top) / max_thumb_travel) * max_scroll) \
-                                  if max_thumb_travel > 0 else 0
-        elif not pygame.mouse.get_pressed()[0]:
-            investor_shop_dragging = False
-
-
+    investor_shop_list.draw_scrollbar(surface, box_x + box_w - 12, mouse_pos, mouse_clicked, ACCENT, BTN_HOVER)
 
 def draw_popup(surface):
     global popup_message, popup_end_time
@@ -7179,7 +6781,7 @@ def draw_popup(surface):
         # Close button in top-right
         cbr = first_time_popup_close
         pygame.draw.rect(surface, BTN_HOVER, cbr, border_radius=4)
-        x_surf = font_big.render("X", True, WHITE)
+        x_surf = text_cache.render(font_big, "X", WHITE)
         surface.blit(
             x_surf,
             (cbr.x + (cbr.w - x_surf.get_width()) // 2,
@@ -7203,16 +6805,13 @@ def draw_popup(surface):
             "         here goes nothing..."
         ]
 
-        font_center = pygame.font.SysFont(None, 28)
-        font_bold   = pygame.font.SysFont(None, 28, bold=True)
-
         total_text_height = 0
         rendered_lines = []
         for idx, line in enumerate(lines):
             if "5 dollars" in line:
-                surf = font_bold.render(line, True, WHITE)
+                surf = text_cache.render(font_bold, line, WHITE)
             else:
-                surf = font_center.render(line, True, WHITE)
+                surf = text_cache.render(font_center, line, WHITE)
             rendered_lines.append(surf)
             total_text_height += surf.get_height()
 
@@ -7226,8 +6825,8 @@ def draw_popup(surface):
     elif popup_message and now_ms < popup_end_time:
         text = popup_message["text"]
         req  = popup_message["requirement"]
-        tw_surf = font_small.render(text, True, WHITE)
-        rw_surf = font_small.render(req, True, GRAYED)
+        tw_surf = text_cache.render(font_small, text, WHITE)
+        rw_surf = text_cache.render(font_small, req, GRAYED)
 
         pw = tw_surf.get_width() + 40
         ph = tw_surf.get_height() + rw_surf.get_height() + 30
@@ -7237,17 +6836,44 @@ def draw_popup(surface):
         pygame.draw.rect(surface, PANEL_DARK, (px, py, pw, ph), border_radius=8)
         surface.blit(tw_surf, (px + 20, py + 10))
         surface.blit(rw_surf, (px + 20, py + 10 + tw_surf.get_height()))
+        dirty.cover((px, py, pw, ph))
+
+def draw_debug_overlay(surface):
+    """
+    F3 performance readout in the top-right corner: FPS, how much text
+    rasterising the text cache saved, how many surface allocations the
+    surface pool saved and how much of the screen was pushed last frame,
+    plus the overlay row cache counts.
+    Rendered directly (not through the cache) so the readout does not count
+    itself.
+    """
+    hits, misses   = text_cache.last_frame
+    reused, built  = surface_pool.last_frame
+    row_hits, rows = row_cache.last_frame
+    n_rects, share = dirty.last_frame
+    lines = [
+        f"FPS: {clock.get_fps():.0f} ({scheduler.mode()})",
+        f"Text cache: {hits} hits / {misses} renders last frame ({len(text_cache)} cached)",
+        f"Surface pool: {reused} reused / {built} allocated last frame ({len(surface_pool)} pooled)",
+        f"Dirty rects: {n_rects} updated, {share:.0%} of the screen last frame",
+        f"Row cache: {row_hits} hits / {rows} renders last frame ({len(row_cache)} rows)",
+    ]
+    y = HEADER_HEIGHT + 4
+    for line in lines:
+        surf = font_small.render(line, True, YELLOW)
+        line_x = WIDTH - surf.get_width() - 10
+        surface.blit(surf, (line_x, y))
+        dirty.cover((line_x, y, surf.get_width(), surf.get_height()))
+        y += surf.get_height() + 2
 
 # -------------------------------------------------------------------------------
 # 16. DRAW STATS MENU
 # -------------------------------------------------------------------------------
 def draw_stats_ui(surface, mouse_pos, mouse_clicked):
     global close_btn_rect, click_count, session_start_time, playtime_this_prestige, total_playtime
-    global cycle_start_time, cycle_start_money, space_lifetime_earnings, galactic_investors_total, money
+    global cycle_start_time, cycle_start_money
 
-    overlay_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay_surf.fill((30, 30, 40, 210))
-    surface.blit(overlay_surf, (0, 0))
+    surface.blit(surface_pool.filled((WIDTH, HEIGHT), (30, 30, 40, 210)), (0, 0))
 
     box_w = int(WIDTH * 0.6)
     box_h = int(HEIGHT * 0.7)
@@ -7255,7 +6881,7 @@ def draw_stats_ui(surface, mouse_pos, mouse_clicked):
     box_y = (HEIGHT - box_h) // 2
     pygame.draw.rect(surface, PANEL_DARK, (box_x, box_y, box_w, box_h), border_radius=12)
 
-    title_surf = font_big.render("Stats", True, WHITE)
+    title_surf = text_cache.render(font_big, "Stats", WHITE)
     surface.blit(
         title_surf,
         (box_x + (box_w - title_surf.get_width()) // 2, box_y + 20)
@@ -7266,23 +6892,26 @@ def draw_stats_ui(surface, mouse_pos, mouse_clicked):
     close_y    = box_y + 12
     close_btn_rect = pygame.Rect(close_x, close_y, close_size, close_size)
     pygame.draw.rect(surface, BTN_HOVER, close_btn_rect, border_radius=4)
-    x_surf = font_small.render("X", True, WHITE)
+    x_surf = text_cache.render(font_small, "X", WHITE)
     surface.blit(
         x_surf,
         (close_x + (close_size - x_surf.get_width()) // 2,
          close_y + (close_size - x_surf.get_height()) // 2)
     )
 
-    mant_c, suff_c = format_number_parts(int(money))
+    mant_c, suff_c = format_number_parts(sim.money.floor())
     cash_text = f"${mant_c}{suff_c}"
 
-    cycle_cash = max(0, money - cycle_start_money)
-    mant_cc, suff_cc = format_number_parts(int(cycle_cash))
+    cycle_cash = max(0, sim.money - cycle_start_money)
+    mant_cc, suff_cc = format_number_parts(as_big(cycle_cash).floor())
     cycle_text = f"${mant_cc}{suff_cc}"
 
-    mant_tca, suff_tca = format_number_parts(int(space_lifetime_earnings))
+    mant_tca, suff_tca = format_number_parts(sim.space_lifetime_earnings.floor())
     total_cash_text = f"${mant_tca}{suff_tca}"
 
+    mant_ips, suff_ips = format_number_parts(sim.total_income_per_sec())
+    income_text = f"${mant_ips}{suff_ips} /sec"
+
     pts = playtime_this_prestige
     pts_text = format_time(pts)
 
@@ -7292,8 +6921,8 @@ def draw_stats_ui(surface, mouse_pos, mouse_clicked):
 
     clicks_text = str(click_count)
 
-    boost_pct = galactic_investors_total * 2
-    boost_text = f"{boost_pct}%"
+    boost_pct = sim.galactic_investors_total * sim.per_investor_bonus() * 100
+    boost_text = f"{boost_pct:.0f}%"
 
     x0 = box_x + 40
     y0 = box_y + 80
@@ -7303,6 +6932,7 @@ def draw_stats_ui(surface, mouse_pos, mouse_clicked):
         ("Cash:", cash_text),
         ("Cash this investment cycle:", cycle_text),
         ("Total cash earned all time:", total_cash_text),
+        ("Income per second:", income_text),
         ("Playtime this prestige:", pts_text),
         ("Total playtime:", tpt_text),
         ("Total clicks all time:", clicks_text),
@@ -7311,11 +6941,23 @@ def draw_stats_ui(surface, mouse_pos, mouse_clicked):
 
     for i, (label, value) in enumerate(lines):
         y = y0 + i * line_gap
-        label_surf = font_small.render(label, True, WHITE)
-        value_surf = font_small.render(value, True, ACCENT)
+        label_surf = text_cache.render(font_small, label, WHITE)
+        value_surf = text_cache.render(font_small, value, ACCENT)
         surface.blit(label_surf, (x0, y))
         surface.blit(value_surf, (x0 + 300, y))
 
+    # Number notation toggle: Suffix → Scientific → Engineering
+    y = y0 + len(lines) * line_gap
+    label_surf = text_cache.render(font_small, "Number format:", WHITE)
+    surface.blit(label_surf, (x0, y))
+    notation_surf = text_cache.render(font_small, get_notation().capitalize(), WHITE)
+    notation_rect = pygame.Rect(x0 + 300 - 10, y - 6, notation_surf.get_width() + 20, notation_surf.get_height() + 12)
+    hovered_n = notation_rect.collidepoint(mouse_pos)
+    pygame.draw.rect(surface, BTN_HOVER if hovered_n else ACCENT, notation_rect, border_radius=6)
+    surface.blit(notation_surf, (notation_rect.x + 10, notation_rect.y + 6))
+    if hovered_n and mouse_clicked:
+        set_notation(NOTATIONS[(NOTATIONS.index(get_notation()) + 1) % len(NOTATIONS)])
+
     return close_btn_rect
 
 # -------------------------------------------------------------------------------
@@ -7323,9 +6965,11 @@ def draw_stats_ui(surface, mouse_pos, mouse_clicked):
 # -------------------------------------------------------------------------------
 running = True
 mouse_down = False
+show_debug = False
 
 while running:
-    dt = clock.tick(FPS) / 1000.0
+    # Whatever the wait, dt is the real elapsed time and sim.tick() catches up exactly
+    dt = scheduler.tick()
     mouse_pos = pygame.mouse.get_pos()
     mouse_clicked = False
 
@@ -7334,21 +6978,25 @@ while running:
     playtime_this_prestige += elapsed
 
     for event in pygame.event.get():
+        scheduler.on_event(event)
         if event.type == pygame.QUIT:
             # Before quitting, save game state
             save_data = {
-                "money": money,
-                "space_lifetime_earnings": space_lifetime_earnings,
-                "global_speed_mult": global_speed_mult,
-                "global_profit_mult": global_profit_mult,
+                "money": sim.money.to_json(),
+                "space_lifetime_earnings": sim.space_lifetime_earnings.to_json(),
+                "global_speed_mult": sim.global_speed_mult,
+                "global_profit_mult": sim.global_profit_mult,
                 "last_timestamp": time.time(),
-                "galactic_investors_total": galactic_investors_total,
+                "galactic_investors_total": sim.galactic_investors_total,
+                "investor_effectiveness_mult": sim.investor_effectiveness_mult,
+                "number_notation": get_notation(),
                 "galactic_investors_spent": galactic_investors_spent,
                 "businesses": [], 
                 "upgrades": [], 
                 "unlocked_shown": list(unlocked_shown),
                 "galactic_upgrades": []
             }
+            sim.sync_timers()
             for biz in businesses:
                 save_data["businesses"].append({
                     "owned":       biz["owned"],
@@ -7378,6 +7026,13 @@ while running:
             screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
             PANEL_WIDTH    = WIDTH - PANEL_X - 20
             PANEL_HEIGHT   = HEIGHT - PANEL_Y - 20
+            surface_pool.clear()
+            row_cache.clear()
+            card_layers.clear()
+            stripe_strips.clear()
+
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWRESTORED):
+            dirty.invalidate()
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
             mouse_down = True
@@ -7389,18 +7044,20 @@ while running:
         elif event.type == pygame.MOUSEBUTTONUP:
             mouse_down = False
 
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_F3:
+                show_debug = not show_debug
+
         elif event.type == pygame.MOUSEWHEEL:
             # Scroll for manager, upgrades, unlocks, AND Investor Shop
             if overlay_mode == "Managers":
-                manager_scroll -= event.y * 30
+                manager_list.scroll_by(-event.y * WHEEL_STEP)
             elif overlay_mode == "Upgrades":
-                upgrade_scroll -= event.y * 30
+                upgrade_list.scroll_by(-event.y * WHEEL_STEP)
             elif overlay_mode == "Unlocks":
-                unlock_scroll -= event.y * 30
+                unlock_list.scroll_by(-event.y * WHEEL_STEP)
             elif overlay_mode == "Investors" and show_investor_shop:
-                investor_shop_scroll -= event.y * 30
-
-    screen.fill(BG_DARK)
+                investor_shop_list.scroll_by(-event.y * WHEEL_STEP)
 
     # 0) HANDLE FIRST-TIME POPUP CLICK BLOCKING
     # If the first_time_popup is still open, we only let its "X" consume the click.
@@ -7413,42 +7070,32 @@ while running:
         bc  = mouse_clicked if overlay_mode is None else False
 
     # 1) UPDATE EACH BUSINESS (timers, payouts)
-    for biz in businesses:
-        if biz["in_progress"]:
-            biz["timer"] -= dt * biz["speed_mult"] * global_speed_mult
-            if biz["timer"] <= 0:
-                biz["timer"] = 0.0
-                biz["in_progress"] = False
-                profit_mult = (1.0 + (0.02 * galactic_investors_total)) * global_profit_mult * biz["profit_mult"]
-                payout_val = int(biz["base_payout"] * biz["owned"] * profit_mult)
-                money += payout_val
-                space_lifetime_earnings += payout_val
-
-                if biz["has_manager"]:
-                    biz["in_progress"] = True
-                    effective_time = (biz["base_time"] / biz["speed_mult"]) / global_speed_mult
-                    biz["timer"] = effective_time
-
-    # 2) CHECK UNLOCKS
-    for idx, u in enumerate(unlocks):
-        if idx in unlocked_shown:
-            continue
-        if u["biz_index"] is not None:
-            b = businesses[u["biz_index"]]
-            if b["owned"] >= u["threshold"]:
-                apply_single_unlock(idx)
-        else:
-            if all(bz["owned"] >= u["threshold"] for bz in businesses):
-                apply_single_unlock(idx)
+    # Closed-form, so a long dt after a stalled or minimized window is exact too
+    sim.tick(dt)
+
+    # 2) CHECK UNLOCKS (only for businesses whose owned count changed)
+    apply_crossed_unlocks()
 
     # 3) UPDATE POPUP TIMER
     if popup_message and pygame.time.get_ticks() > popup_end_time:
         popup_message = None
 
+    # Minimized: the simulation above kept up, nothing to draw
+    if not scheduler.rendering:
+        continue
+
     # 4) DRAW MAIN UI
-    draw_header(screen, money, mouse_pos, sbc)
+    # Only the main screen is drawn incrementally; clicks and anything that
+    # moves the layout (resize, overlays, popups, F3) redraw the whole frame
+    scene = (WIDTH, HEIGHT, overlay_mode, first_time_popup, popup_message, show_debug,
+             business_scroll, purchase_index, get_notation())
+    dirty.begin_frame(screen, mouse_clicked or scene != last_scene
+                      or overlay_mode is not None or first_time_popup)
+    last_scene = scene
 
-    unlock_result, buy_result = draw_business_panel(screen, dt, mouse_pos, bc)
+    draw_header(screen, sim.money, mouse_pos, sbc)
+
+    unlock_result, buy_result = draw_business_panel(screen, mouse_pos, bc)
 
     # Handle unlock & buy only when no overlay & no first-time popup
     if overlay_mode is None and not first_time_popup:
@@ -7460,13 +7107,12 @@ while running:
         # BUY-BIZ click (only apply once, here)
         if buy_result is not None:
             biz = businesses[buy_result]
-            count = purchase_options[purchase_index]
-            if count == -1:
-                count = max_affordable(biz, money)
-            total_cost = total_cost_for_next_N(biz, count)
-            if money >= total_cost:
-                money -= total_cost
+            count, total_cost = pricing.quote(buy_result, sim.money, purchase_options[purchase_index])
+            if sim.money >= total_cost:
+                sim.money -= total_cost
                 biz["owned"] += count
+                sim.invalidate(buy_result)
+                unlock_index.notify(buy_result)
 
     # 5) DRAW SIDEBAR (only if no first-time pop-up)
     if not first_time_popup:
@@ -7517,7 +7163,13 @@ while running:
     # 8) DRAW POPUP (first-time, offline earnings, or unlock)
     draw_popup(screen)
 
-    pygame.display.flip()
+    if show_debug:
+        draw_debug_overlay(screen)
+    text_cache.end_frame()
+    surface_pool.end_frame()
+    row_cache.end_frame()
+
+    dirty.present(screen)
 
 pygame.quit()
 sys.exit()
@@ -0,0 +1,207 @@
+"""
+Number formatting for SpaceRace labels.
+
+format_number_parts() is called dozens of times per frame (header money,
+every buy button, manager, upgrade and shop row), so it avoids per-call work:
+the suffix is picked straight from the value's base-10 exponent against the
+module-level NUMBER_UNITS table, and the finished strings are memoized per
+value bucket, i.e. per distinct displayed result, in a bounded LRU cache.
+
+Three notations are available through set_notation():
+    "suffix"       1.234 Million
+    "scientific"   1.234e6
+    "engineering"  1.234e6 / 12.345e9 (exponent always a multiple of 3)
+
+Rounding matches the formatter this replaced: the mantissa shows the value
+divided down by 1000 per unit, rounded by f"{x:.3f}" (its binary value,
+ties to even). A mantissa that rounds up to 1000.000 (10.000 in scientific
+notation) is carried into the next unit, so 999999.9996 reads "1.000
+Million", not "1000.000 Thousand". Values past float range have no old
+result to match; their mantissa is rounded directly, ties to even.
+"""
+import functools
+
+from bignum import as_big
+
+NUMBER_UNITS = (
+    " ", " Thousand", " Million", " Billion", " Trillion", " Quadrillion",
+    " Quintillion", " Sextillion", " Septillion", " Octillion", " Nonillion",
+    " Decillion", " Undecillion", " Duodecillion", " Tredécillion",
+    " Quattuordecillion", " Quindecillion", " Sexdecillion",
+    " Septendecillion", " Octodecillion", " Novemdecillion", " Vigintillion",
+    " Unvigintillion", " Duovigintillion", " Trevigintillion",
+    " Quattuorvigintillion", " Quinvigintillion", " Sexvigintillion",
+    " Septenvigintillion", " Octovigintillion", " Novemnovigintillion",
+    " Trigintillion", " Untrigintillion", " Duotrigintillion",
+    " Trestrigintillion", " Quattuortrigintillion", " Quintrigintillion",
+    " Sextrigintillion", " Septentrigintillion", " Octotrigintillion",
+    " Novemtrigintillion", " Quadragintillion", " Unquadragintillion",
+    " Duoquadragintillion", " Trequadragintillion", " Quattuorquadragintillion",
+    " Quinquadragintillion", " Sexquadragintillion", " Septenquadragintillion",
+    " Octoquadragintillion", " Novemquadragintillion", " Quinquagintillion",
+    " Unquinquagintillion", " Duoquinquagintillion", " Trequinquagintillion",
+    " Quattuorquinquagintillion", " Quinquinquagintillion", " Sexquinquagintillion",
+    " Septenquinquagintillion", " Octoquinquagintillion", " Novemquinquagintillion",
+    " Sexagintillion", " Unsexagintillion", " Duosexagintillion", " Tresexagintillion",
+    " Quattuorsexagintillion", " Quinsexagintillion", " Sexsexagintillion",
+    " Septensexagintillion", " Octosexagintillion", " Novemsexagintillion",
+    " Septuagintillion", " Unseptuagintillion", " Duoseptuagintillion",
+    " Treseptuagintillion", " Quattuorseptuagintillion", " Quinseptuagintillion",
+    " Sexseptuagintillion", " Septenseptuagintillion", " Octoseptuagintillion",
+    " Novemseptuagintillion", " Octogintillion", " Unoctogintillion",
+    " Duooctogintillion", " Treoctogintillion", " Quattuoroctogintillion",
+    " Quinoctogintillion", " Sexoctogintillion", " Septenoctogintillion",
+    " Octooctogintillion", " Novemoctogintillion", " Nonagintillion",
+    " Unnonagintillion", " Duononagintillion", " Trenonagintillion",
+    " Quattuornonagintillion", " Quinnonagintillion", " Sexnonagintillion",
+    " Septennonagintillion", " Octononagintillion", " Novemnonagintillion",
+    " Centillion",
+)
+MAX_SCALE = len(NUMBER_UNITS) - 1
+
+NOTATIONS = ("suffix", "scientific", "engineering")
+_notation = "suffix"
+
+# Distinct displayed values kept in the memo
+FORMAT_CACHE_SIZE = 4096
+
+# Mantissa -> thousandths of the displayed value, by exponent mod 3
+_SHIFT_POW = (1000.0, 10000.0, 100000.0)
+
+# Divisor of each unit, Thousand = 1000.0 ** 1 up to Centillion
+_UNIT_POW = tuple(1000.0 ** k for k in range(MAX_SCALE + 1))
+
+# How close to x.5 thousandths a quick quotient must be to be re-rounded exactly
+_TIE_EPS = 1e-6
+
+
+def set_notation(mode):
+    """
+    Switch every later format_number_parts() call to 'mode' (one of NOTATIONS).
+    """
+    global _notation
+    if mode not in NOTATIONS:
+        raise ValueError(f"unknown number notation {mode!r}")
+    _notation = mode
+
+
+def get_notation():
+    """
+    The notation currently used by format_number_parts().
+    """
+    return _notation
+
+
+@functools.lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_bucket(thousandths, exponent, notation):
+    """
+    Build the (mantissa, suffix) strings for one value bucket: 'thousandths'
+    is the displayed mantissa times 1000, 'exponent' the power of ten it is
+    scaled by (the unit's exponent in suffix mode).
+    """
+    if notation == "suffix":
+        scale = exponent // 3
+        if scale > MAX_SCALE:
+            # Past Centillion: keep the leftover power of ten visible
+            return f"{thousandths / 1000:.3f}e{exponent - 3 * MAX_SCALE}", NUMBER_UNITS[MAX_SCALE]
+        return f"{thousandths / 1000:.3f}", NUMBER_UNITS[scale]
+    return f"{thousandths / 1000:.3f}", f"e{exponent}"
+
+
+def _legacy_unit_value(v):
+    """
+    'v' divided down by 1000 until below 1000, step by step as the old
+    formatter did: (value in the unit, unit index).
+    """
+    scale = 0
+    while abs(v) >= 1000.0 and scale < MAX_SCALE:
+        v /= 1000.0
+        scale += 1
+    return v, scale
+
+
+def _thousandths(x):
+    """
+    round(x * 1000) the way f"{x:.3f}" rounds 'x'.
+    """
+    return int(f"{x:.3f}".replace(".", ""))
+
+
+def _format_scientific(v, e):
+    """
+    Scientific parts for a float 'v' of at least 1000 with exponent 'e'.
+    """
+    x = v / 10.0 ** e
+    t = x * 1000.0
+    thousandths = round(t)
+    if abs(abs(t - thousandths) - 0.5) < _TIE_EPS:
+        # The quick quotient can be a few ulps off; redo the old division
+        x, scale = _legacy_unit_value(v)
+        e = 3 * scale
+        while abs(x) >= 10.0:
+            x /= 10.0
+            e += 1
+        thousandths = _thousandths(x)
+    if abs(thousandths) >= 10000:
+        # 9.9996 rounds up to the next power of ten
+        thousandths //= 10
+        e += 1
+    return _format_bucket(thousandths, e, "scientific")
+
+
+def _format_big(m, e):
+    """
+    Parts for a value past float range, straight from its mantissa and exponent.
+    """
+    if _notation == "scientific" or (_notation == "suffix" and e > 3 * MAX_SCALE + 2):
+        thousandths = round(m * 1000.0)
+        if abs(thousandths) >= 10000:
+            thousandths //= 10
+            e += 1
+        return _format_bucket(thousandths, e, _notation)
+
+    shift = e % 3
+    thousandths = round(m * _SHIFT_POW[shift])
+    e -= shift
+    if abs(thousandths) >= 1000000:
+        # 999.9996 rounds up to the next unit (past Centillion: 1.000e3 Centillion)
+        thousandths //= 1000
+        e += 3
+    return _format_bucket(thousandths, e, _notation)
+
+
+def format_number_parts(n):
+    """
+    Split a number into a mantissa and suffix (e.g., 1,234,000 → ("1.234", " Million")).
+    Accepts int, float or BigNum. Values below 1000 look the same in every notation.
+    """
+    n = as_big(n)
+    v, e = n.f, n.e
+    if v is None:
+        return _format_big(n.m, e)
+
+    scale = e // 3 if e > 0 else 0
+    t = v / _UNIT_POW[scale] * 1000.0
+    thousandths = round(t)
+    if abs(abs(t - thousandths) - 0.5) < _TIE_EPS:
+        # The quick quotient can be a few ulps off; redo the old division
+        x, scale = _legacy_unit_value(v)
+        thousandths = _thousandths(x)
+    if abs(thousandths) >= 1000000:
+        # 999.9996 rounds up to the next unit
+        thousandths //= 1000
+        scale += 1
+
+    if scale == 0:
+        # Below a thousand: plain mantissa, no suffix, in every notation
+        return _format_bucket(thousandths, 0, "suffix")
+    if _notation == "scientific":
+        return _format_scientific(v, max(e, 3))
+    return _format_bucket(thousandths, 3 * scale, _notation)
+
+
+def format_cache_info():
+    """
+    functools hit/miss/size statistics of the formatted-string memo.
+    """
+    return _format_bucket.cache_info()
@@ -0,0 +1,178 @@
+"""
+Business purchase cost engine for SpaceRace.
+
+Buying N more of a business with cost base_cost * coef**owned each is a
+geometric series:
+
+    cost(N) = base_cost * coef**owned * (coef**N - 1) / (coef - 1)
+
+coef**owned overflows a float after a few thousand units, so every price is
+first sized in log10 space. When the result fits comfortably in a float it is
+evaluated with the plain formula and returned as an int (the exact value the
+game always charged); otherwise it comes back as a BigNum built from its
+log10, with no magnitude limit.
+
+quote() prices one purchase mode for one business; PricingService caches
+those quotes for every business so a steady frame recomputes nothing.
+"""
+import math
+
+from bignum import BigNum, as_big
+
+# Costs whose log10 stays below this are evaluated exactly in float/int
+FLOAT_SAFE_LOG10 = 300
+
+# Purchase mode value meaning "as many as money allows"
+MAX_MODE = -1
+
+# Most single-unit steps max_affordable_count takes to correct its estimate;
+# past float precision n + 1 may not change the price at all
+MAX_CORRECTION_STEPS = 64
+
+# -------------------------------------------------------------------------------
+# 1. LOG-SPACE HELPERS
+# -------------------------------------------------------------------------------
+def _log10_series(coef, n):
+    """
+    log10((coef**n - 1) / (coef - 1)) for coef > 1 without forming coef**n.
+    """
+    log_coef = math.log10(coef)
+    x = n * log_coef
+    if x < 15:
+        return math.log10(10.0 ** x - 1.0) - math.log10(coef - 1)
+    # coef**n - 1 == coef**n to float precision
+    return x - math.log10(coef - 1)
+
+
+def log10_cost(base_cost, coef, owned, n):
+    """
+    log10 of the cost of the next 'n' units (-inf when n is 0).
+    """
+    if n <= 0:
+        return -math.inf
+    log_first = math.log10(base_cost) + owned * math.log10(coef)
+    if coef == 1:
+        return log_first + math.log10(n)
+    return log_first + _log10_series(coef, n)
+
+# -------------------------------------------------------------------------------
+# 2. SINGLE-BUSINESS PRICES
+# -------------------------------------------------------------------------------
+def cost_for_next(base_cost, coef, owned, n):
+    """
+    Total cost of the next 'n' units: an exact int while it fits a float,
+    a BigNum of any size beyond that.
+    """
+    if n <= 0:
+        return 0
+    log_total = log10_cost(base_cost, coef, owned, n)
+    if log_total < FLOAT_SAFE_LOG10:
+        b0 = base_cost * (coef ** owned)
+        if coef == 1:
+            return int(b0 * n)
+        return int(b0 * (((coef ** n) - 1) / (coef - 1)))
+    return BigNum.from_log10(log_total).floor()
+
+
+def max_affordable_count(base_cost, coef, owned, money):
+    """
+    Largest N with cost_for_next(..., N) <= money.
+
+    The estimate is corrected against the exact price, so rounding near a
+    boundary never offers a unit the player cannot pay for.
+    """
+    money = as_big(money)
+    if money <= 0:
+        return 0
+
+    if coef == 1:
+        # Flat price: N = floor(money / base_cost), in BigNum so it has no ceiling
+        n = int((money / base_cost).floor())
+    else:
+        log_money = money.log10()
+        log_first = math.log10(base_cost) + owned * math.log10(coef)
+        # money >= b0 * (coef**N - 1) / (coef - 1)  <=>  N <= log_coef(ratio + 1)
+        log_ratio = log_money + math.log10(coef - 1) - log_first
+        if log_ratio > 15:
+            log_rhs = log_ratio
+        else:
+            log_rhs = math.log10(1.0 + 10.0 ** log_ratio)
+        n = int(log_rhs / math.log10(coef))
+
+    n = max(0, n)
+    for _ in range(MAX_CORRECTION_STEPS):
+        if n == 0 or cost_for_next(base_cost, coef, owned, n) <= money:
+            break
+        n -= 1
+    for _ in range(MAX_CORRECTION_STEPS):
+        if cost_for_next(base_cost, coef, owned, n + 1) > money:
+            break
+        n += 1
+    return n
+
+# -------------------------------------------------------------------------------
+# 3. BATCHED QUOTES
+# -------------------------------------------------------------------------------
+def quote(biz, money, mode):
+    """
+    (count, cost) for one business dict under purchase 'mode'
+    (a fixed count, or MAX_MODE for as many as 'money' allows).
+    """
+    base_cost, coef, owned = biz["base_cost"], biz["coef"], biz["owned"]
+    if mode == MAX_MODE:
+        count = max_affordable_count(base_cost, coef, owned, money)
+    else:
+        count = max(0, mode)
+    return count, cost_for_next(base_cost, coef, owned, count)
+
+# -------------------------------------------------------------------------------
+# 4. CACHED PRICING SERVICE
+# -------------------------------------------------------------------------------
+class PricingService:
+    """
+    Per-business, per-purchase-mode cache of (count, cost).
+
+    A fixed-count quote only depends on the owned count. A MAX quote stays valid
+    while money sits in [cost(count), cost(count + 1)), so it is recomputed only
+    when money crosses one of those price boundaries. Each entry remembers the
+    owned count it was priced at, so buying (or prestige) refreshes it without
+    any explicit invalidation.
+    """
+
+    def __init__(self, businesses):
+        self.businesses = businesses
+        self._entries   = {}   # (idx, mode) -> (owned, count, cost, next_cost)
+        self.hits       = 0
+        self.misses     = 0
+
+    def clear(self):
+        """
+        Drop every cached quote (e.g. when business base data is replaced).
+        """
+        self._entries.clear()
+
+    def quote(self, idx, money, mode):
+        """
+        Cached (count, cost) for business 'idx' under purchase 'mode'.
+        """
+        biz   = self.businesses[idx]
+        entry = self._entries.get((idx, mode))
+        if entry is not None and entry[0] == biz["owned"]:
+            if mode != MAX_MODE or entry[2] <= money < entry[3]:
+                self.hits += 1
+                return entry[1], entry[2]
+
+        self.misses += 1
+        count, cost = quote(biz, money, mode)
+        next_cost = None
+        if mode == MAX_MODE:
+            next_cost = cost_for_next(biz["base_cost"], biz["coef"], biz["owned"], count + 1)
+        self._entries[(idx, mode)] = (biz["owned"], count, cost, next_cost)
+        return count, cost
+
+    def quotes(self, money, mode):
+        """
+        Cached (count, cost) for every business under one purchase mode.
+        """
+        money = as_big(money)
+        return [self.quote(idx, money, mode) for idx in range(len(self.businesses))]
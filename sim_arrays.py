@@ -0,0 +1,150 @@
+"""
+Optional struct-of-arrays (NumPy) backend for the SpaceRace simulation.
+
+ArrayBusinessState keeps one vector per business field instead of a dict per
+business, shaped (games, businesses). advance() is the vectorized twin of
+simulation.advance(): timers, completion masks and payout sums are whole-array
+operations, so data packs with hundreds of businesses or thousands of parallel
+simulated games run without Python per-element overhead.
+
+NumPy is not required to play; check HAS_NUMPY before using this module.
+Values are float64, so unlike SimulationCore's BigNum money this backend is
+limited to the float range (~1.8e308).
+"""
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+from simulation import CYCLE_EPSILON
+
+# -------------------------------------------------------------------------------
+# 1. ARRAY STATE STORE
+# -------------------------------------------------------------------------------
+class ArrayBusinessState:
+    """
+    Per-field arrays for 'games' independent copies of one business list.
+
+    Business fields (shape (games, businesses)):
+        owned, speed_mult, profit_mult, timer, in_progress, has_manager
+    Static business data (shape (businesses,)):
+        base_time, base_payout
+    Per-game scalars (shape (games,)):
+        money, space_lifetime_earnings, global_speed_mult, global_profit_mult,
+        galactic_investors_total, investor_effectiveness_mult
+    """
+
+    def __init__(self, businesses, games=1, money=5.0, space_lifetime_earnings=0.0,
+                 global_speed_mult=1.0, global_profit_mult=1.0,
+                 galactic_investors_total=0, investor_effectiveness_mult=0.0):
+        if not HAS_NUMPY:
+            raise RuntimeError("ArrayBusinessState needs NumPy (pip install numpy)")
+
+        def column(key, dtype):
+            row = np.array([biz[key] for biz in businesses], dtype=dtype)
+            return np.tile(row, (games, 1))
+
+        self.games       = games
+        self.base_time   = np.array([biz["base_time"] for biz in businesses], dtype=np.float64)
+        self.base_payout = np.array([biz["base_payout"] for biz in businesses], dtype=np.float64)
+
+        self.owned       = column("owned", np.float64)
+        self.speed_mult  = column("speed_mult", np.float64)
+        self.profit_mult = column("profit_mult", np.float64)
+        self.timer       = column("timer", np.float64)
+        self.in_progress = column("in_progress", bool)
+        self.has_manager = column("has_manager", bool)
+
+        self.money                       = np.full(games, money, dtype=np.float64)
+        self.space_lifetime_earnings     = np.full(games, space_lifetime_earnings, dtype=np.float64)
+        self.global_speed_mult           = np.full(games, global_speed_mult, dtype=np.float64)
+        self.global_profit_mult          = np.full(games, global_profit_mult, dtype=np.float64)
+        self.galactic_investors_total    = np.full(games, galactic_investors_total, dtype=np.float64)
+        self.investor_effectiveness_mult = np.full(games, investor_effectiveness_mult, dtype=np.float64)
+
+    @classmethod
+    def from_sim(cls, sim, games=1):
+        """
+        Build an array store holding 'games' copies of a SimulationCore's state.
+        """
+        sim.sync_timers()
+        return cls(
+            sim.businesses,
+            games                       = games,
+            money                       = float(sim.money),
+            space_lifetime_earnings     = float(sim.space_lifetime_earnings),
+            global_speed_mult           = sim.global_speed_mult,
+            global_profit_mult          = sim.global_profit_mult,
+            galactic_investors_total    = float(sim.galactic_investors_total),
+            investor_effectiveness_mult = sim.investor_effectiveness_mult,
+        )
+
+    def write_back(self, sim, game=0):
+        """
+        Copy one game's row back into a SimulationCore and its business dicts.
+        """
+        for idx, biz in enumerate(sim.businesses):
+            biz["owned"]       = int(self.owned[game, idx])
+            biz["speed_mult"]  = float(self.speed_mult[game, idx])
+            biz["profit_mult"] = float(self.profit_mult[game, idx])
+            biz["timer"]       = float(self.timer[game, idx])
+            biz["in_progress"] = bool(self.in_progress[game, idx])
+            biz["has_manager"] = bool(self.has_manager[game, idx])
+        sim.money                       = float(self.money[game])
+        sim.space_lifetime_earnings     = float(self.space_lifetime_earnings[game])
+        sim.global_speed_mult           = float(self.global_speed_mult[game])
+        sim.global_profit_mult          = float(self.global_profit_mult[game])
+        sim.galactic_investors_total    = float(self.galactic_investors_total[game])
+        sim.investor_effectiveness_mult = float(self.investor_effectiveness_mult[game])
+        sim.rebuild_schedule()
+
+    # ─── DERIVED VALUES ───
+    def effective_time(self):
+        """
+        Seconds per cycle for every (game, business), same formula as SimulationCore.
+        """
+        return (self.base_time / self.speed_mult) / self.global_speed_mult[:, None]
+
+    def payout_per_cycle(self):
+        """
+        Money per completed cycle for every (game, business), truncated like int().
+        """
+        investor_mult = 1.0 + (0.02 + self.investor_effectiveness_mult) * self.galactic_investors_total
+        profit_mult   = (investor_mult * self.global_profit_mult)[:, None] * self.profit_mult
+        return np.floor(self.base_payout * self.owned * profit_mult)
+
+    # ─── TIME STEP ───
+    def advance(self, seconds):
+        """
+        Vectorized closed-form advance by 'seconds' (a scalar or one value per game).
+        Return the money earned by each game as an array of shape (games,).
+        """
+        seconds = np.broadcast_to(np.asarray(seconds, dtype=np.float64), (self.games,))[:, None]
+        seconds = np.maximum(seconds, 0.0)
+        moving  = seconds > 0
+        effective_time = self.effective_time()
+
+        # Like simulation.advance(), only running cycles move: an idle business
+        # stays idle until something starts it, manager or not
+        done      = moving & self.in_progress & (self.timer <= seconds)
+        managed   = done & self.has_manager
+        unmanaged = done & ~self.has_manager
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            leftover = seconds - self.timer
+            extra    = np.where(managed, np.floor(leftover / effective_time + CYCLE_EPSILON), 0.0)
+        cycles = np.where(done, 1.0 + extra, 0.0)
+
+        carried = np.minimum(effective_time, effective_time - (leftover - extra * effective_time))
+        running = self.in_progress & ~done
+        self.timer = np.where(running, self.timer - seconds, self.timer)
+        self.timer = np.where(managed, carried, self.timer)
+        self.timer = np.where(unmanaged, 0.0, self.timer)
+        self.in_progress = self.in_progress & ~unmanaged
+
+        earned = (self.payout_per_cycle() * cycles).sum(axis=1)
+        self.money                   += earned
+        self.space_lifetime_earnings += earned
+        return earned
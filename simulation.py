@@ -0,0 +1,478 @@
+"""
+Headless simulation core for SpaceRace.
+
+Everything that moves money over time (business timers, payouts and manager
+restarts) lives here so the pygame draw functions in main.py only read it.
+Nothing in this module imports pygame.
+
+advance() is the single way time passes: a 16 ms frame, a stalled window and
+a three-day offline absence all go through the same closed-form step.
+
+Running cycles are kept in a priority queue keyed on their absolute completion
+time on the simulation clock, so a step only touches businesses whose deadline
+has actually passed instead of decrementing every timer every frame.
+
+Effective period, payout per cycle and income/sec live in a derived-stats
+table that is only recomputed for entries marked dirty by invalidate(). The
+total income/sec is kept as a running sum that only moves when one of those
+entries is recomputed.
+
+Money, lifetime earnings, payouts and income are BigNum (see bignum.py), so
+the economy has no float overflow ceiling; times and multipliers stay floats.
+"""
+import bisect
+import heapq
+import math
+
+from bignum import ZERO, BigNum, as_big
+
+# Tiny epsilon so spans that are exact multiples of the period
+# (3600 s of a 1.8 s business) don't lose a cycle to rounding
+CYCLE_EPSILON = 1e-9
+
+# -------------------------------------------------------------------------------
+# 1. SIMULATION CORE
+# -------------------------------------------------------------------------------
+class SimulationCore:
+    """
+    Owns the economy state and advances it with tick(dt).
+
+    `businesses` is the shared list of business dicts (owned, speed_mult,
+    profit_mult, timer, in_progress, has_manager, ...). While a business is
+    running its cycle is described by "cycle_start" and "deadline" on the
+    simulation clock `now`; "timer" (seconds left) is only a snapshot used by
+    the save file, refreshed by sync_timers().
+
+    Whoever changes a business's owned, speed_mult, profit_mult or has_manager
+    must call invalidate(idx). The global multipliers and investor values are
+    properties that invalidate the whole table themselves.
+    """
+
+    def __init__(self, businesses, money=5.0, space_lifetime_earnings=0,
+                 global_speed_mult=1.0, global_profit_mult=1.0,
+                 galactic_investors_total=0, investor_effectiveness_mult=0.0):
+        self.businesses    = businesses
+        self._derived      = [None] * len(businesses)
+        self._dirty        = set(range(len(businesses)))
+        self._income_total = ZERO
+
+        self.money                       = money
+        self.space_lifetime_earnings     = space_lifetime_earnings
+        self.global_speed_mult           = global_speed_mult
+        self.global_profit_mult          = global_profit_mult
+        self.galactic_investors_total    = galactic_investors_total
+        self.investor_effectiveness_mult = investor_effectiveness_mult
+
+        self.now    = 0.0
+        self._queue = []   # (deadline, idx) min-heap; stale entries are skipped
+        self.rebuild_schedule()
+
+    # ─── MONEY (always stored as BigNum) ───
+    @property
+    def money(self):
+        return self._money
+
+    @money.setter
+    def money(self, value):
+        self._money = as_big(value)
+
+    @property
+    def space_lifetime_earnings(self):
+        return self._space_lifetime_earnings
+
+    @space_lifetime_earnings.setter
+    def space_lifetime_earnings(self, value):
+        self._space_lifetime_earnings = as_big(value)
+
+    # ─── GLOBAL INPUTS (setting any of these dirties every business) ───
+    @property
+    def global_speed_mult(self):
+        return self._global_speed_mult
+
+    @global_speed_mult.setter
+    def global_speed_mult(self, value):
+        self._global_speed_mult = value
+        self.invalidate()
+
+    @property
+    def global_profit_mult(self):
+        return self._global_profit_mult
+
+    @global_profit_mult.setter
+    def global_profit_mult(self, value):
+        self._global_profit_mult = value
+        self.invalidate()
+
+    @property
+    def galactic_investors_total(self):
+        return self._galactic_investors_total
+
+    @galactic_investors_total.setter
+    def galactic_investors_total(self, value):
+        self._galactic_investors_total = value
+        self.invalidate()
+
+    @property
+    def investor_effectiveness_mult(self):
+        return self._investor_effectiveness_mult
+
+    @investor_effectiveness_mult.setter
+    def investor_effectiveness_mult(self, value):
+        self._investor_effectiveness_mult = value
+        self.invalidate()
+
+    # ─── DERIVED-STATS TABLE ───
+    def invalidate(self, idx=None):
+        """
+        Mark business 'idx' (or every business when None) for recomputation.
+        """
+        if idx is None:
+            self._dirty = set(range(len(self.businesses)))
+        else:
+            self._dirty.add(idx)
+
+    def compute_stats(self, biz):
+        """
+        The one formula for a business's derived stats, uncached:
+          period         - seconds per cycle with all speed multipliers
+          payout         - money paid when one cycle completes
+          income_per_sec - payout / period while a manager keeps it running
+        """
+        period = (biz["base_time"] / biz["speed_mult"]) / self._global_speed_mult
+
+        investor_mult = BigNum(self._galactic_investors_total) * self.per_investor_bonus() + 1
+        profit_mult   = investor_mult * (self._global_profit_mult * biz["profit_mult"])
+        payout        = (profit_mult * (biz["base_payout"] * biz["owned"])).floor()
+
+        if biz["has_manager"] and period > 0:
+            income_per_sec = payout / period
+        else:
+            income_per_sec = ZERO
+
+        return {"period": period, "payout": payout, "income_per_sec": income_per_sec}
+
+    def _refresh(self, idx):
+        """
+        Recompute one dirty entry and move the income total by its change.
+        """
+        old_entry = self._derived[idx]
+        new_entry = self.compute_stats(self.businesses[idx])
+        if old_entry is not None:
+            self._income_total -= old_entry["income_per_sec"]
+        self._income_total += new_entry["income_per_sec"]
+        self._derived[idx] = new_entry
+        self._dirty.discard(idx)
+
+    def stats(self, idx):
+        """
+        O(1) cached derived stats of business 'idx' (see compute_stats).
+        """
+        if idx in self._dirty:
+            self._refresh(idx)
+        return self._derived[idx]
+
+    def total_income_per_sec(self):
+        """
+        Income/sec of all businesses together, maintained incrementally:
+        only entries dirtied since the last call are recomputed.
+        """
+        if len(self._dirty) == len(self.businesses):
+            # Everything changed anyway, so resum from scratch and shed float drift
+            self._income_total = ZERO
+            self._derived = [None] * len(self.businesses)
+        for idx in list(self._dirty):
+            self._refresh(idx)
+        return self._income_total
+
+    def effective_time(self, idx):
+        """
+        Seconds one production cycle of business 'idx' takes.
+        """
+        return self.stats(idx)["period"]
+
+    def payout_per_cycle(self, idx):
+        """
+        Money paid out when one production cycle of business 'idx' completes.
+        """
+        return self.stats(idx)["payout"]
+
+    def income_per_sec(self, idx):
+        """
+        Steady income of business 'idx' per second (0 without a manager).
+        """
+        return self.stats(idx)["income_per_sec"]
+
+    def per_investor_bonus(self):
+        """
+        Profit bonus granted by each Galactic Investor (0.02 = +2%).
+        """
+        return 0.02 + self._investor_effectiveness_mult
+
+    def time_left(self, biz):
+        """
+        Seconds until the running cycle of 'biz' completes (0 when idle).
+        """
+        if not biz["in_progress"]:
+            return 0.0
+        return max(0.0, biz["deadline"] - self.now)
+
+    def progress(self, biz):
+        """
+        Fraction (0..1) of the current cycle that has elapsed, for progress bars.
+        Computed from (now - start) / period, only for the rows being drawn.
+        """
+        if not biz["in_progress"]:
+            return 0.0
+        period = biz["deadline"] - biz["cycle_start"]
+        if period <= 0:
+            return 0.0
+        return max(0.0, min(1.0, (self.now - biz["cycle_start"]) / period))
+
+    def cycles_per_second(self, idx):
+        """
+        Whole cycles per second business 'idx' completes while running (0 when idle).
+        advance() pays all of them, even when several fit inside one frame.
+        """
+        if not self.businesses[idx]["in_progress"]:
+            return 0.0
+        effective_time = self.effective_time(idx)
+        return 1.0 / effective_time if effective_time > 0 else 0.0
+
+    # ─── SCHEDULING ───
+    def schedule(self, idx, seconds_left):
+        """
+        Mark business 'idx' as running and due 'seconds_left' from now.
+        """
+        biz = self.businesses[idx]
+        biz["in_progress"] = True
+        biz["deadline"]    = self.now + seconds_left
+        biz["cycle_start"] = biz["deadline"] - self.effective_time(idx)
+        heapq.heappush(self._queue, (biz["deadline"], idx))
+
+    def rebuild_schedule(self):
+        """
+        Rebuild the queue from each business's "timer"/"in_progress" snapshot,
+        e.g. after loading a save. Idle businesses with a manager are started.
+        """
+        self._queue = []
+        for idx, biz in enumerate(self.businesses):
+            if biz["in_progress"]:
+                self.schedule(idx, biz.get("timer", 0.0))
+            elif biz["has_manager"]:
+                self.start_production(idx)
+
+    def sync_timers(self):
+        """
+        Write the seconds left on every business back into its "timer" field.
+        """
+        for biz in self.businesses:
+            biz["timer"] = self.time_left(biz)
+
+    # ─── PLAYER ACTIONS ───
+    def start_production(self, idx):
+        """
+        Start a production cycle for business 'idx' if it is idle and owned.
+        Return True if a cycle was started.
+        """
+        biz = self.businesses[idx]
+        if biz["in_progress"] or biz["owned"] <= 0:
+            return False
+        self.schedule(idx, self.effective_time(idx))
+        return True
+
+    def stop_production(self, idx):
+        """
+        Drop any running cycle of business 'idx' without paying it out.
+        """
+        biz = self.businesses[idx]
+        biz["in_progress"] = False
+        biz["timer"]       = 0.0
+
+    def hire_manager(self, idx):
+        """
+        Give business 'idx' a manager and kick off production if it is idle.
+        """
+        self.businesses[idx]["has_manager"] = True
+        self.invalidate(idx)
+        self.start_production(idx)
+
+    def earn(self, amount):
+        """
+        Credit 'amount' to both current money and lifetime earnings.
+        """
+        self.money += amount
+        self.space_lifetime_earnings += amount
+
+    # ─── TIME STEP ───
+    def tick(self, dt):
+        """
+        Advance every business by 'dt' seconds and collect finished cycles.
+        Return the money earned during this step.
+        """
+        return advance(self, dt)
+
+# -------------------------------------------------------------------------------
+# 2. CLOSED-FORM ADVANCE
+# -------------------------------------------------------------------------------
+def advance(sim, seconds):
+    """
+    Move 'sim' forward by 'seconds' and return the money earned.
+
+    Costs O(completed businesses · log n) however much time passes: only
+    businesses whose deadline has passed are popped from the queue, and each
+    works out in one step how many whole cycles fit before the new `now`.
+      - A business without a manager finishes its running cycle and stops.
+      - A managed business pays the running cycle plus floor(rest / period)
+        more and is rescheduled with the remainder carried over.
+    """
+    if seconds <= 0:
+        return ZERO
+
+    sim.now += seconds
+    queue    = sim._queue
+    earned   = ZERO
+
+    while queue and queue[0][0] <= sim.now:
+        deadline, idx = heapq.heappop(queue)
+        biz = sim.businesses[idx]
+        if not biz["in_progress"] or biz["deadline"] != deadline:
+            continue   # stopped or rescheduled since this entry was pushed
+
+        cycles = 1
+        if biz["has_manager"]:
+            effective_time = sim.effective_time(idx)
+            extra          = math.floor((sim.now - deadline) / effective_time + CYCLE_EPSILON)
+            cycles        += extra
+            next_deadline  = deadline + (extra + 1) * effective_time
+            sim.schedule(idx, max(0.0, next_deadline - sim.now))
+        else:
+            biz["in_progress"] = False
+
+        earned += sim.payout_per_cycle(idx) * cycles
+
+    if earned:
+        sim.earn(earned)
+    return earned
+
+# -------------------------------------------------------------------------------
+# 3. UNLOCK THRESHOLD INDEX
+# -------------------------------------------------------------------------------
+class UnlockStepTable:
+    """
+    Sorted thresholds for one business (or the global unlocks) with running
+    products of their multipliers: speed[k] / profit[k] is the combined effect of
+    the first k entries, so any range of crossed unlocks is one division.
+    """
+
+    def __init__(self, entries):
+        entries.sort(key=lambda e: (e[0], e[1]))
+        self.thresholds = [threshold for threshold, _, _ in entries]
+        self.unlock_ids = [u_idx for _, u_idx, _ in entries]
+        self.speed      = [1.0]
+        self.profit     = [1.0]
+        self.factors    = []
+        for _, _, u in entries:
+            speed  = u["multiplier"] if u["type"] in ("speed", "global_speed") else 1.0
+            profit = u["multiplier"] if u["type"] in ("profit", "global_profit") else 1.0
+            self.factors.append((speed, profit))
+            self.speed.append(self.speed[-1] * speed)
+            self.profit.append(self.profit[-1] * profit)
+
+
+class UnlockIndex:
+    """
+    Precompiled view of the `unlocks` list for cheap threshold checks.
+
+    Each business gets an UnlockStepTable with a "next pending" pointer, and
+    global unlocks get one table driven by min(owned). Call notify(idx)
+    whenever a business's owned count changes; crossed() then only looks at
+    those businesses, finds the new pointer with a bisect and returns the
+    combined multiplier for everything passed, so a MAX buy that jumps a
+    thousand units applies all its unlocks at once.
+    `shown` is the caller's set of already-applied unlock indices.
+    """
+
+    def __init__(self, unlocks, n_businesses, shown):
+        per_biz  = [[] for _ in range(n_businesses)]
+        globals_ = []
+        for u_idx, u in enumerate(unlocks):
+            entry = (u["threshold"], u_idx, u)
+            if u["biz_index"] is None:
+                globals_.append(entry)
+            else:
+                per_biz[u["biz_index"]].append(entry)
+        self.per_biz = [UnlockStepTable(entries) for entries in per_biz]
+        self.global_table = UnlockStepTable(globals_)
+
+        self.shown = shown
+        self.reset()
+
+    def reset(self):
+        """
+        Rewind every pointer, e.g. after prestige cleared the shown set.
+        """
+        self.next_biz    = [0] * len(self.per_biz)
+        self.next_global = 0
+        self.pending     = set(range(len(self.per_biz)))
+
+    def notify(self, idx):
+        """
+        Business 'idx' changed its owned count; check it on the next crossed().
+        """
+        self.pending.add(idx)
+
+    def _step(self, table, pos, owned, fired):
+        """
+        Move 'pos' past every threshold <= owned. Append the unlock ids not yet
+        shown to 'fired' and return (new_pos, speed_factor, profit_factor).
+        """
+        new_pos = bisect.bisect_right(table.thresholds, owned, lo=pos)
+        if new_pos == pos:
+            return pos, 1.0, 1.0
+
+        ids = table.unlock_ids[pos:new_pos]
+        if self.shown.isdisjoint(ids):
+            fired.extend(ids)
+            return (new_pos,
+                    table.speed[new_pos] / table.speed[pos],
+                    table.profit[new_pos] / table.profit[pos])
+
+        # Some were applied already (e.g. restored from a save); skip those
+        speed = profit = 1.0
+        for k in range(pos, new_pos):
+            if table.unlock_ids[k] not in self.shown:
+                fired.append(table.unlock_ids[k])
+                speed  *= table.factors[k][0]
+                profit *= table.factors[k][1]
+        return new_pos, speed, profit
+
+    def crossed(self, businesses):
+        """
+        Collect the unlocks newly reached since the last call.
+
+        Return (fired, factors): 'fired' is the list of unlock indices in list
+        order, 'factors' maps a business index (or None for the global
+        multipliers) to its combined (speed_factor, profit_factor).
+        """
+        if not self.pending:
+            return [], {}
+
+        fired   = []
+        factors = {}
+        for idx in self.pending:
+            self.next_biz[idx], speed, profit = self._step(
+                self.per_biz[idx], self.next_biz[idx], businesses[idx]["owned"], fired
+            )
+            if speed != 1.0 or profit != 1.0:
+                factors[idx] = (speed, profit)
+
+        min_owned = min(biz["owned"] for biz in businesses)
+        self.next_global, speed, profit = self._step(
+            self.global_table, self.next_global, min_owned, fired
+        )
+        if speed != 1.0 or profit != 1.0:
+            factors[None] = (speed, profit)
+
+        self.pending.clear()
+        fired.sort()
+        return fired, factors
@@ -0,0 +1,40 @@
+"""
+Reusable translucent surfaces for SpaceRace.
+
+Several draw functions build an SRCALPHA surface, fill it with one RGBA
+colour and blit it straight away: the full-screen dimmer behind every
+overlay (and the darker one behind the invest confirmation), the veil over
+a locked business card, the box behind each cycle timer. SurfacePool keeps
+one filled surface per (size, colour) and hands the same one back every
+frame. The pool is cleared when the window is resized, since most sizes
+derive from it. A hit is an allocation the pool saved, a miss a surface it
+had to build.
+
+Every caller asking for the same size and colour gets the same surface, so
+drawing on one would change it for all of them.
+"""
+import pygame
+
+from cache_stats import CountedCache
+
+
+class SurfacePool(CountedCache):
+    """
+    Translucent single-colour SRCALPHA surfaces keyed on (width, height, rgba).
+    """
+
+    def filled(self, size, rgba):
+        """
+        A 'size' surface filled with 'rgba', built on first use.
+        """
+        key = (size[0], size[1], rgba)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(rgba)
+        self._entries[key] = surf
+        return surf
@@ -0,0 +1,57 @@
+import pytest
+
+from bignum import BigNum, FLOAT_EXP_LIMIT
+from pricing import cost_for_next
+
+
+def test_whole_dollar_payouts_stay_exact():
+    money = BigNum(5.0) - 4
+    for _ in range(48):
+        money = money + 1
+    assert money == 49
+    assert money >= 49
+    assert money.floor() == 49
+
+
+@pytest.mark.parametrize("step", [1, 2])
+def test_accumulated_money_reaches_every_threshold(step):
+    money = BigNum(5)
+    while money < 200:
+        money += step
+        assert float(money) == int(money)
+    assert money >= 200
+
+
+def test_large_integer_sums_match_float_sums():
+    money, plain = BigNum(0), 0.0
+    for _ in range(100_000):
+        money += 42_000_000_001
+        plain += 42_000_000_001
+    assert float(money) == plain
+
+
+def test_money_equal_to_cost_affords_it():
+    cost  = cost_for_next(4, 1.07, 25, 1)
+    money = BigNum(0)
+    for _ in range(int(cost)):
+        money += 1.0
+    assert money == cost
+    assert money >= cost
+    assert not money < cost
+
+
+def test_past_float_limit_uses_mantissa_and_exponent():
+    big = BigNum(1.5, FLOAT_EXP_LIMIT + 10)
+    assert big.f is None
+    assert big + big == BigNum(3.0, FLOAT_EXP_LIMIT + 10)
+    assert big > 1e300
+    assert (big / big) == 1
+
+
+def test_plain_number_comparisons_on_both_sides_of_float_limit():
+    assert BigNum(250_000) >= 250_000
+    assert BigNum(249_999.5) < 250_000.0
+    huge = BigNum(5.0, FLOAT_EXP_LIMIT + 100)
+    assert huge > 1e300
+    assert -huge < -1e300
+    assert huge < 10 ** (FLOAT_EXP_LIMIT + 200)
@@ -0,0 +1,53 @@
+import pytest
+
+import number_format
+from bench_format import legacy_format_number_parts
+from bignum import BigNum
+from number_format import format_number_parts
+
+
+@pytest.fixture(params=number_format.NOTATIONS)
+def notation(request):
+    number_format.set_notation(request.param)
+    yield request.param
+    number_format.set_notation("suffix")
+
+
+# value -> expected parts in each of COLUMNS
+COLUMNS = ("suffix", "engineering", "scientific")
+CASES = {
+    9.9995:        (("9.999", " "),              ("9.999", " "),       ("9.999", " ")),
+    0.0005:        (("0.001", " "),              ("0.001", " "),       ("0.001", " ")),
+    999.9996:      (("1.000", " Thousand"),      ("1.000", "e3"),      ("1.000", "e3")),
+    9999.5:        (("9.999", " Thousand"),      ("9.999", "e3"),      ("9.999", "e3")),
+    99999.6:       (("100.000", " Thousand"),    ("100.000", "e3"),    ("1.000", "e5")),
+    999999.6:      (("1.000", " Million"),       ("1.000", "e6"),      ("1.000", "e6")),
+    5.0005e36:     (("5.001", " Undecillion"),   ("5.001", "e36"),     ("5.001", "e36")),
+    1e33 - 0.5:    (("1.000", " Decillion"),     ("1.000", "e33"),     ("1.000", "e33")),
+    9.999996e302:  (("1.000", " Centillion"),    ("1.000", "e303"),    ("1.000", "e303")),
+    1e303:         (("1.000", " Centillion"),    ("1.000", "e303"),    ("1.000", "e303")),
+}
+
+
+@pytest.mark.parametrize("value", list(CASES))
+def test_rounding_boundaries(notation, value):
+    expected = CASES[value][COLUMNS.index(notation)]
+    assert format_number_parts(value) == expected
+
+
+def test_mantissa_past_centillion_carries_into_exponent(notation):
+    expected = {"suffix": ("1.000e3", " Centillion"),
+                "engineering": ("1.000", "e306"),
+                "scientific": ("1.000", "e306")}[notation]
+    assert format_number_parts(BigNum(9.9999996, 305)) == expected
+
+
+@pytest.mark.parametrize("k", range(0, 100, 7))
+def test_matches_legacy_except_where_it_carries(k):
+    for value in (9.9995 * 10.0 ** k, 5.0005 * 10.0 ** k, 10.0 ** (3 * (k // 3)) - 0.5):
+        old = legacy_format_number_parts(value)
+        new = format_number_parts(value)
+        if float(old[0]) < 1000.0:
+            assert new == old
+        else:
+            assert new[0] == "1.000"
@@ -0,0 +1,27 @@
+import pytest
+
+from bignum import BigNum
+from pricing import cost_for_next, max_affordable_count
+
+
+def test_flat_price_with_huge_money_terminates():
+    n = max_affordable_count(4, 1.0, 0, BigNum(1e200))
+    assert n == pytest.approx(2.5e199, rel=1e-12)
+
+
+def test_flat_price_past_float_range():
+    n = max_affordable_count(4, 1.0, 0, BigNum(4.0, 400))
+    assert BigNum(n) == BigNum(1.0, 400)
+
+
+@pytest.mark.parametrize("owned", [0, 10, 300, 5000])
+def test_max_count_is_affordable_and_next_is_not(owned):
+    money = cost_for_next(4, 1.07, owned, 37)
+    n = max_affordable_count(4, 1.07, owned, money)
+    assert cost_for_next(4, 1.07, owned, n) <= money
+    assert cost_for_next(4, 1.07, owned, n + 1) > money
+    assert n == 37
+
+
+def test_money_equal_to_flat_cost_affords_exactly_that_many():
+    assert max_affordable_count(4, 1.0, 0, BigNum(5.0) - 1 + 36) == 10
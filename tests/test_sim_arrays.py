@@ -0,0 +1,46 @@
+import pytest
+
+from simulation import SimulationCore
+
+sim_arrays = pytest.importorskip("sim_arrays")
+if not sim_arrays.HAS_NUMPY:
+    pytest.skip("NumPy is not installed", allow_module_level=True)
+
+# Seconds the two backends' timers may drift apart
+TIMER_TOLERANCE = 1e-6
+
+
+def make_biz(base_time, base_payout, owned=1, has_manager=True):
+    return {
+        "base_time":   base_time,
+        "base_payout": base_payout,
+        "owned":       owned,
+        "speed_mult":  1.0,
+        "profit_mult": 1.0,
+        "timer":       0.0,
+        "in_progress": False,
+        "has_manager": has_manager,
+    }
+
+
+def test_array_backend_matches_scalar_simulation():
+    sim = SimulationCore([
+        make_biz(0.7, 4),
+        make_biz(6.1, 60, owned=12),
+        make_biz(2.5, 500, has_manager=False),
+        make_biz(4.0, 900, owned=0),
+    ])
+    sim.start_production(2)
+    sim.tick(0.3)
+    # Bought after hiring its manager: managed but idle until started
+    sim.businesses[3]["owned"] = 3
+    sim.invalidate(3)
+
+    arrays = sim_arrays.ArrayBusinessState.from_sim(sim)
+    for step in (0.25, 1.0, 17.3, 600.0):
+        assert float(sim.tick(step)) == arrays.advance(step)[0]
+
+    assert float(sim.money) == arrays.money[0]
+    for idx, biz in enumerate(sim.businesses):
+        assert bool(arrays.in_progress[0, idx]) == biz["in_progress"]
+        assert abs(arrays.timer[0, idx] - sim.time_left(biz)) < TIMER_TOLERANCE
@@ -0,0 +1,175 @@
+import math
+
+from simulation import SimulationCore, UnlockIndex, advance
+
+# Seconds that per-frame stepping and one long advance may disagree on a timer
+TIMER_TOLERANCE = 1e-6
+
+
+def make_biz(base_time, base_payout=10, owned=1, has_manager=True):
+    return {
+        "base_time":   base_time,
+        "base_payout": base_payout,
+        "owned":       owned,
+        "speed_mult":  1.0,
+        "profit_mult": 1.0,
+        "timer":       0.0,
+        "in_progress": False,
+        "has_manager": has_manager,
+    }
+
+
+def test_restart_mid_cycle_fires_once_at_new_deadline():
+    sim = SimulationCore([make_biz(2.0, has_manager=False)])
+    sim.start_production(0)                 # due at 2.0
+    sim.tick(0.5)
+    sim.stop_production(0)
+    assert sim.start_production(0)          # due at 2.5; the 2.0 entry is now stale
+
+    assert sim.tick(1.99) == 0              # now 2.49: stale deadline skipped
+    assert sim.money == 5
+    assert sim.tick(0.02) == 10             # now 2.51: the restarted cycle completes
+    assert sim.money == 15
+    assert not sim.businesses[0]["in_progress"]
+    assert sim._queue == []
+    assert sim.tick(10.0) == 0
+
+
+def test_hire_manager_mid_cycle_keeps_one_schedule_entry():
+    sim = SimulationCore([make_biz(2.0, has_manager=False)])
+    sim.start_production(0)
+    sim.tick(1.0)
+    sim.hire_manager(0)
+    assert len(sim._queue) == 1
+    assert sim.time_left(sim.businesses[0]) == 1.0
+
+    assert sim.tick(1.5) == 10              # one completion at 2.0, next due at 4.0
+    assert len(sim._queue) == 1
+    assert sim.businesses[0]["deadline"] == 4.0
+
+
+def test_rebuild_schedule_replaces_queue_from_timer_snapshot():
+    sim = SimulationCore([make_biz(2.0), make_biz(3.0, has_manager=False)])
+    sim.start_production(1)
+    sim.tick(0.5)
+    sim.sync_timers()
+    sim.rebuild_schedule()
+    assert len(sim._queue) == 2
+    assert sim.time_left(sim.businesses[0]) == 1.5
+    assert sim.time_left(sim.businesses[1]) == 2.5
+
+    assert sim.tick(2.6) == 20              # 0 at 2.0, 1 at 3.0, nothing twice
+
+
+def make_economy():
+    businesses = [
+        make_biz(0.7, 4),
+        make_biz(1.3, 30, owned=5),
+        make_biz(6.1, 700),
+        make_biz(45.0, 9000, owned=2),
+        make_biz(2.5, 100, has_manager=False),
+    ]
+    sim = SimulationCore(businesses)
+    sim.start_production(4)
+    return sim
+
+
+def test_frame_steps_and_one_advance_agree():
+    stepped, jumped = make_economy(), make_economy()
+    for _ in range(36000):
+        stepped.tick(1 / 60)
+    advance(jumped, 600.0)
+
+    # Whole cycles in 600 s for each managed business, one for the unmanaged one
+    expected = 5
+    for idx, biz in enumerate(jumped.businesses):
+        cycles = math.floor(600.0 / biz["base_time"]) if biz["has_manager"] else 1
+        expected += jumped.payout_per_cycle(idx) * cycles
+    assert stepped.money == expected
+    assert jumped.money == expected
+
+    for a, b in zip(stepped.businesses, jumped.businesses):
+        assert a["in_progress"] == b["in_progress"]
+        assert abs(stepped.time_left(a) - jumped.time_left(b)) < TIMER_TOLERANCE
+        assert abs(stepped.progress(a) - jumped.progress(b)) < TIMER_TOLERANCE
+
+
+def test_exact_multiple_of_period_keeps_every_cycle():
+    sim = SimulationCore([make_biz(1.8)])
+    advance(sim, 3600.0)
+    assert sim.money == 5 + 10 * 2000
+
+
+def make_unlock(threshold, biz_index, kind, multiplier):
+    return {"threshold": threshold, "biz_index": biz_index, "type": kind,
+            "multiplier": multiplier, "description": f"{kind} x{multiplier} at {threshold}"}
+
+
+def buy(index, businesses, idx, owned):
+    businesses[idx]["owned"] = owned
+    index.notify(idx)
+    fired, factors = index.crossed(businesses)
+    index.shown.update(fired)
+    return fired, factors
+
+
+def test_owning_exactly_the_threshold_crosses_it():
+    businesses = [make_biz(1.0, owned=0), make_biz(1.0, owned=0)]
+    index = UnlockIndex([make_unlock(25, 0, "profit", 2.0)], len(businesses), set())
+
+    assert buy(index, businesses, 0, 24) == ([], {})
+    assert buy(index, businesses, 0, 25) == ([0], {0: (1.0, 2.0)})
+    assert buy(index, businesses, 0, 26) == ([], {})
+
+
+def test_reset_after_prestige_rearms_thresholds():
+    businesses = [make_biz(1.0, owned=0)]
+    unlocks    = [make_unlock(10, 0, "speed", 2.0), make_unlock(50, None, "global_profit", 3.0)]
+    shown      = set()
+    index      = UnlockIndex(unlocks, len(businesses), shown)
+    assert buy(index, businesses, 0, 60)[0] == [0, 1]
+
+    # Prestige: owned counts and the shown set are cleared, then the index rewound
+    businesses[0]["owned"] = 1
+    shown.clear()
+    index.reset()
+
+    assert buy(index, businesses, 0, 10) == ([0], {0: (2.0, 1.0)})
+    assert buy(index, businesses, 0, 50) == ([1], {None: (1.0, 3.0)})
+
+
+def test_bulk_buy_applies_every_crossed_unlock_at_once():
+    businesses = [make_biz(1.0, owned=1), make_biz(1.0, owned=1)]
+    unlocks = [
+        make_unlock(25,  0, "speed", 2.0),
+        make_unlock(50,  0, "profit", 3.0),
+        make_unlock(100, 0, "speed", 2.0),
+        make_unlock(200, 0, "profit", 5.0),
+        make_unlock(100, 1, "speed", 2.0),
+        make_unlock(10,  None, "global_speed", 1.5),
+    ]
+    shown = {2}   # restored from a save: already applied
+    index = UnlockIndex(unlocks, len(businesses), shown)
+
+    fired, factors = buy(index, businesses, 0, 150)
+    assert fired == [0, 1]
+    assert factors == {0: (2.0, 3.0)}
+
+    # One MAX buy across the rest of the table; the global one waits for min(owned)
+    fired, factors = buy(index, businesses, 0, 1000)
+    assert fired == [3]
+    assert factors == {0: (1.0, 5.0)}
+
+    fired, factors = buy(index, businesses, 1, 100)
+    assert fired == [4, 5]
+    assert factors == {1: (2.0, 1.0), None: (1.5, 1.0)}
+
+
+def test_bulk_buy_from_zero_multiplies_the_prefix_products():
+    businesses = [make_biz(1.0, owned=0)]
+    unlocks = [make_unlock(t, 0, "profit", 2.0) for t in range(10, 410, 10)]
+    index = UnlockIndex(unlocks, len(businesses), set())
+
+    fired, factors = buy(index, businesses, 0, 405)
+    assert fired == list(range(40))
+    assert factors == {0: (1.0, 2.0 ** 40)}
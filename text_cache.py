@@ -0,0 +1,123 @@
+"""
+Cached text rendering for SpaceRace.
+
+Most labels drawn each frame never change ("Buy", "Hire", business names,
+unlock descriptions), yet font.render rasterises them again every frame.
+TextCache keeps the rendered surfaces keyed on (font, text, colour) in a
+bounded LRU, so a steady frame only blits. Its hit/miss counters (see
+cache_stats.py) show how much rasterising the cache removes.
+
+Labels that change every frame (the money counter, cycle timers, earning
+labels) would miss that cache every time, so they are drawn from a
+GlyphAtlas instead: digits, separators and suffix words pre-rendered once
+per (font, colour) and blitted side by side.
+
+A cached label can be handed to several callers in the same frame, so it is
+only ever blitted.
+"""
+import re
+from collections import OrderedDict
+
+from cache_stats import CountedCache
+
+# Rendered strings kept before the least recently used one is dropped
+TEXT_CACHE_SIZE = 2048
+
+# Characters every atlas renders up front (money, timers, rates)
+ATLAS_GLYPHS = "0123456789.,:$+-/ xe%"
+
+# Runs of letters ("Million", "sec") become one atlas piece, anything else one character
+_ATLAS_TOKEN = re.compile(r"[^\W\d_]+|.", re.S)
+
+
+class TextCache(CountedCache):
+    """
+    Bounded LRU of rendered labels keyed on (font, text, colour, antialias),
+    plus one GlyphAtlas per (font, colour) for labels that change every frame.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        super().__init__(OrderedDict())
+        self.max_entries = max_entries
+        self.evictions   = 0
+        self._atlases    = {}
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Drop-in for font.render(text, antialias, color), served from the cache.
+        """
+        if type(color) is not tuple:
+            color = tuple(color)
+        key = (font, text, color, antialias)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._entries[key] = surf
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def atlas(self, font, color):
+        """
+        The GlyphAtlas for (font, color), built on first use.
+        """
+        if type(color) is not tuple:
+            color = tuple(color)
+        key = (font, color)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = self._atlases[key] = GlyphAtlas(font, color)
+        return atlas
+
+
+class GlyphAtlas:
+    """
+    Pre-rendered pieces of one font in one colour for labels that change every
+    frame. Digits and separators are rendered up front; letter runs (the
+    suffix words "Million", "Trillion", "sec", ...) are rendered whole the first
+    time they appear and kept, so drawing "$1.234 Trillion" is a handful of
+    blits and no rasterising.
+    """
+
+    def __init__(self, font, color):
+        self.font    = font
+        self.color   = color
+        self._pieces = {}
+        for ch in ATLAS_GLYPHS:
+            self._piece(ch)
+        self.height  = self._pieces["0"].get_height()
+
+    def _piece(self, token):
+        surf = self._pieces.get(token)
+        if surf is None:
+            surf = self._pieces[token] = self.font.render(token, True, self.color)
+        return surf
+
+    def size(self, text):
+        """
+        (width, height) 'text' takes when drawn from this atlas.
+        """
+        width = 0
+        for token in _ATLAS_TOKEN.findall(text):
+            width += self._piece(token).get_width()
+        return width, self.height
+
+    def draw(self, surface, text, pos):
+        """
+        Blit 'text' with its top-left corner at 'pos'; return the width drawn.
+        """
+        x, y  = pos
+        start = x
+        blits = []
+        for token in _ATLAS_TOKEN.findall(text):
+            piece = self._piece(token)
+            blits.append((piece, (x, y)))
+            x += piece.get_width()
+        surface.blits(blits, doreturn=False)
+        return x - start
@@ -0,0 +1,156 @@
+"""
+Scrolling list widget for the SpaceRace overlays.
+
+Managers, Upgrades, Unlocks and the Investor Shop all show fixed-height rows
+in a clipped, scrollable box with a draggable scrollbar thumb. VirtualList
+holds that shared state (scroll offset, drag state) and, because every row
+has the same height, works out which rows intersect the viewport straight
+from the scroll offset. Callers then evaluate and draw only those rows, so
+the ~630-entry Unlocks list costs the same per frame as the 10 managers.
+
+Most rows barely change (icon, name, description, requirement, status), so
+RowCache keeps each rendered row as one surface keyed on the state that
+decides its look; a scrolled list is then a handful of blits. The cache is
+an LRU with a fixed row count, so a long list never holds all its rows.
+"""
+from collections import OrderedDict
+
+import pygame
+
+from cache_stats import CountedCache
+
+# Pixels scrolled per mouse-wheel notch
+WHEEL_STEP = 30
+
+TRACK_COLOR = (60, 60, 80)
+TRACK_WIDTH = 6
+
+# Rendered rows kept before the least recently used one is dropped
+# (a 700x80 row is ~220 KB, so this caps the cache at roughly 14 MB)
+ROW_CACHE_SIZE = 64
+
+
+class VirtualList:
+    """
+    Scroll state and visible-row arithmetic for a list of equal-height rows.
+    """
+
+    def __init__(self, row_h, spacing):
+        self.row_h       = row_h
+        self.spacing     = spacing
+        self.scroll      = 0
+        self.dragging    = False
+        self.drag_offset = 0
+        self.view        = pygame.Rect(0, 0, 0, 0)
+        self.count       = 0
+
+    @property
+    def stride(self):
+        return self.row_h + self.spacing
+
+    @property
+    def content_h(self):
+        return self.count * self.stride
+
+    @property
+    def max_scroll(self):
+        return max(0, self.content_h - self.view.h)
+
+    def layout(self, view, count):
+        """
+        Place the list in 'view' (the clip rect) with 'count' rows, clamp the
+        scroll offset and return the range of row indices that are visible.
+        """
+        self.view   = pygame.Rect(view)
+        self.count  = count
+        self.scroll = max(0, min(self.scroll, self.max_scroll))
+        return self.visible_range()
+
+    def visible_range(self):
+        """
+        Indices of rows that overlap the viewport, from the scroll offset alone.
+        """
+        first = -((self.row_h - self.scroll) // self.stride)
+        last  = (self.scroll + self.view.h) // self.stride + 1
+        return range(max(0, first), min(self.count, last))
+
+    def row_y(self, index):
+        """
+        Screen y of row 'index' at the current scroll offset.
+        """
+        return self.view.y + index * self.stride - self.scroll
+
+    def scroll_by(self, dy):
+        """
+        Move the list by 'dy' pixels; clamped on the next layout().
+        """
+        self.scroll += dy
+
+    def draw_scrollbar(self, surface, track_x, mouse_pos, mouse_clicked, hover_color, color):
+        """
+        Draw the track and thumb (only when the rows overflow the viewport) and
+        handle dragging the thumb with the left mouse button.
+        """
+        if self.content_h <= self.view.h:
+            return
+
+        top       = self.view.y
+        visible_h = self.view.h
+        pygame.draw.rect(surface, TRACK_COLOR, (track_x, top, TRACK_WIDTH, visible_h), border_radius=3)
+
+        max_scroll       = self.max_scroll
+        thumb_h          = max(20, int((visible_h / self.content_h) * visible_h))
+        max_thumb_travel = visible_h - thumb_h
+        if max_scroll > 0:
+            thumb_y = top + int((self.scroll / max_scroll) * max_thumb_travel)
+        else:
+            thumb_y = top
+
+        thumb_rect  = pygame.Rect(track_x, thumb_y, TRACK_WIDTH, thumb_h)
+        thumb_color = hover_color if thumb_rect.collidepoint(mouse_pos) else color
+        pygame.draw.rect(surface, thumb_color, thumb_rect, border_radius=3)
+
+        if mouse_clicked and thumb_rect.collidepoint(mouse_pos):
+            self.dragging    = True
+            self.drag_offset = mouse_pos[1] - thumb_y
+
+        if self.dragging and pygame.mouse.get_pressed()[0]:
+            new_y = mouse_pos[1] - self.drag_offset
+            new_y = max(top, min(top + max_thumb_travel, new_y))
+            self.scroll = int(((new_y - top) / max_thumb_travel) * max_scroll) if max_thumb_travel > 0 else 0
+        elif not pygame.mouse.get_pressed()[0]:
+            self.dragging = False
+
+
+class RowCache(CountedCache):
+    """
+    Bounded LRU of opaque list-row surfaces, keyed on (state key, row size);
+    the state key is whatever decides how the row looks (ownership, price,
+    affordability, hover, notation).
+    """
+
+    def __init__(self, max_rows=ROW_CACHE_SIZE):
+        super().__init__(OrderedDict())
+        self.max_rows  = max_rows
+        self.evictions = 0
+
+    def get(self, key, size, draw):
+        """
+        The cached row for 'key' at 'size'; on a miss 'draw(row)' paints a new
+        row-sized surface with the row's top-left corner at (0, 0).
+        """
+        full_key = (key, size[0], size[1])
+        row = self._entries.get(full_key)
+        if row is not None:
+            self._entries.move_to_end(full_key)
+            self.hits += 1
+            return row
+
+        self.misses += 1
+        row = pygame.Surface(size)
+        draw(row)
+        self._entries[full_key] = row
+        if len(self._entries) > self.max_rows:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return row